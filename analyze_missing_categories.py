@@ -2,16 +2,23 @@
 """Analyze which tutorial categories are missing translations"""
 
 import json
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from i18n_profile import span, timed
 
 # Read the verification report
-with open('translation_verification_report.json', 'r') as f:
+with span('load', 'translation_verification_report.json'), \
+        open('translation_verification_report.json', 'r') as f:
     report = json.load(f)
 
 missing_fr = report['issues']['missing_translations']['fr']
 missing_nl = report['issues']['missing_translations']['nl']
 
 # Group by category (first part of the key before the second dot)
+@timed('compare')
 def categorize_keys(keys):
     categories = defaultdict(list)
     for key in keys:
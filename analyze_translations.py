@@ -10,12 +10,16 @@ from pathlib import Path
 from typing import Dict, Set, List, Tuple
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from i18n_profile import span, timed
+
 class TranslationAnalyzer:
     def __init__(self, messages_dir: str):
         self.messages_dir = Path(messages_dir)
         self.translations = {}
         self.issues = defaultdict(list)
 
+    @timed('load')
     def load_translations(self) -> Dict[str, dict]:
         """Load all translation JSON files"""
         json_files = list(self.messages_dir.glob("*.json"))
@@ -77,6 +81,7 @@ class TranslationAnalyzer:
                     empty_keys.append(full_key)
         return empty_keys
 
+    @timed('compare')
     def analyze(self):
         """Perform comprehensive analysis"""
         if not self.translations:
@@ -89,8 +94,9 @@ class TranslationAnalyzer:
 
         # Get all unique keys from all languages
         all_keys_by_lang = {}
-        for lang, data in self.translations.items():
-            all_keys_by_lang[lang] = self.get_all_keys(data)
+        with span('flatten', 'get_all_keys'):
+            for lang, data in self.translations.items():
+                all_keys_by_lang[lang] = self.get_all_keys(data)
 
         # Find union of all keys
         all_keys = set()
@@ -216,6 +222,7 @@ class TranslationAnalyzer:
 
         return self.issues
 
+    @timed('write')
     def export_report(self, output_file: str = "translation_report.json"):
         """Export detailed report as JSON"""
         report = {
@@ -3,12 +3,20 @@
 Extract all hardcoded English strings from TSX files for i18n
 """
 
+import argparse
 import os
 import re
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from findings_db import DB_FILE as FINDINGS_DB
+from i18n_glossary import get_glossary
+from i18n_profile import count, span, timed
+from i18n_report import open_report
+
 # Patterns to find strings
 PATTERNS = [
     # Double-quoted strings
@@ -32,6 +40,17 @@ EXCLUDE_PATTERNS = [
     r'^(flex|grid|absolute|relative|fixed|sticky)$',  # CSS values
 ]
 
+# UI prose that mentions a brand or a URL; the glossary must never drop these
+# (checked by --self-check)
+PROSE_SAMPLES = [
+    "RAG excels at dynamic information (news, docs), while fine-tuning bakes knowledge into parameters.",
+    "RAG is always better",
+    "RAG has no challenges",
+    "MCP Integration",
+    "Claude Code Documentation",
+    "Exported from Prompt Party - https://prompt-party.netlify.app",
+]
+
 # Directories to scan
 SCAN_DIRS = ['src/app', 'src/components']
 
@@ -44,52 +63,118 @@ def should_exclude(text):
             return True
     return False
 
-def extract_strings_from_file(filepath):
-    """Extract translatable strings from a TSX file"""
-    strings = []
+def iter_strings(filepath):
+    """
+    Yield the translatable strings of a TSX file ({'text', 'line', 'file'}),
+    pattern by pattern. The glossary is asked once per file, so a file's
+    candidates are classified together before its strings are yielded.
+    """
+    candidates = []
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
+        count('files')
+        count('regex evaluations', len(PATTERNS))
+
         # Find all strings
         for pattern in PATTERNS:
-            matches = re.finditer(pattern, content)
-            for match in matches:
+            line_num, position = 1, 0
+            for match in re.finditer(pattern, content):
                 text = match.group(1)
                 if not should_exclude(text):
-                    # Get line number
-                    line_num = content[:match.start()].count('\n') + 1
-                    strings.append({
-                        'text': text,
-                        'line': line_num,
-                        'file': str(filepath)
-                    })
+                    # Line numbers advance with the matches, which come in file order
+                    line_num += content.count('\n', position, match.start())
+                    position = match.start()
+                    candidates.append((text, line_num))
     except Exception as e:
         print(f"Error reading {filepath}: {e}")
 
-    return strings
+    # Only values the glossary matches as a whole: a brand name or a URL inside
+    # a sentence does not make the sentence untranslatable
+    exempt = get_glossary().match_batch((text for text, _ in candidates), whole=True)
+    for text, line_num in candidates:
+        if exempt[text] is None:
+            yield {'text': text, 'line': line_num, 'file': str(filepath)}
 
-def scan_directory(base_path):
-    """Scan directory recursively for TSX files"""
-    all_strings = defaultdict(list)
+@timed('scan')
+def extract_strings_from_file(filepath):
+    """Extract translatable strings from a TSX file"""
+    return list(iter_strings(filepath))
+
+def self_check():
+    """Names of the prose samples the glossary filter would drop (none when healthy)"""
+    exempt = get_glossary().match_batch(PROSE_SAMPLES, whole=True)
+    return [f"{text!r} ({exempt[text]})" for text in PROSE_SAMPLES if exempt[text] is not None]
 
+def iter_tsx_files(base_path):
+    """TSX files of the scanned directories"""
     for dir_name in SCAN_DIRS:
         dir_path = Path(base_path) / dir_name
-        if not dir_path.exists():
-            continue
+        if dir_path.exists():
+            yield from dir_path.rglob('*.tsx')
 
-        for tsx_file in dir_path.rglob('*.tsx'):
-            strings = extract_strings_from_file(tsx_file)
-            if strings:
-                relative_path = str(tsx_file.relative_to(base_path))
-                all_strings[relative_path] = strings
+def iter_directory(base_path):
+    """Yield (relative path, strings) of every TSX file with hardcoded strings, one file at a time"""
+    for tsx_file in iter_tsx_files(base_path):
+        strings = extract_strings_from_file(tsx_file)
+        if strings:
+            yield str(tsx_file.relative_to(base_path)), strings
 
+def scan_directory(base_path):
+    """Scan directory recursively for TSX files"""
+    all_strings = defaultdict(list)
+    for relative_path, strings in iter_directory(base_path):
+        all_strings[relative_path] = strings
     return all_strings
 
+def stream_report(base_path, jsonl=True, db_path=None):
+    """Stream every string to i18n-extraction-report.jsonl and/or the findings database as its file is scanned"""
+    report_path = base_path / 'i18n-extraction-report.jsonl'
+    total_files = 0
+    stream = open_report('extract-hardcoded-strings', report_path if jsonl else None, db_path)
+    with stream:
+        for tsx_file in iter_tsx_files(base_path):
+            relative_path = str(tsx_file.relative_to(base_path))
+            before = stream.findings
+            with span('scan', 'iter_strings'):
+                for item in iter_strings(tsx_file):
+                    stream.finding('hardcoded_string', file=relative_path, line=item['line'], text=item['text'])
+            total_files += stream.findings > before
+        stream.close(total_files=total_files, total_strings=stream.findings)
+
+    if jsonl:
+        print(f"Findings streamed to: i18n-extraction-report.jsonl")
+    if db_path:
+        print(f"Findings recorded in: {db_path}")
+    print(f"Total: {stream.findings} strings across {total_files} files")
+
 def main():
+    parser = argparse.ArgumentParser(description="Extract hardcoded English strings from TSX files")
+    parser.add_argument('--jsonl', action='store_true',
+                        help="stream strings to i18n-extraction-report.jsonl instead of the JSON report")
+    parser.add_argument('--db', type=Path, nargs='?', const=FINDINGS_DB,
+                        help=f"record the strings in the findings database instead (default {FINDINGS_DB.name})")
+    parser.add_argument('--self-check', action='store_true',
+                        help="check that the glossary filter keeps UI prose mentioning brands or URLs, then exit")
+    args = parser.parse_args()
+
+    if args.self_check:
+        dropped = self_check()
+        for sample in dropped:
+            print(f"✗ Glossary filter drops UI prose: {sample}")
+        if dropped:
+            sys.exit(1)
+        print(f"✓ Glossary filter keeps all {len(PROSE_SAMPLES)} prose samples")
+        return
+
     base_path = Path(__file__).parent
     print("Scanning for hardcoded strings...")
 
+    if args.jsonl or args.db:
+        stream_report(base_path, args.jsonl, args.db)
+        return
+
     all_strings = scan_directory(base_path)
 
     # Generate report
@@ -125,7 +210,8 @@ def main():
                 })
 
     # Save report
-    with open(base_path / 'i18n-extraction-report.json', 'w', encoding='utf-8') as f:
+    with span('write', 'i18n-extraction-report.json'), \
+            open(base_path / 'i18n-extraction-report.json', 'w', encoding='utf-8') as f:
         json.dump(report, f, indent=2, ensure_ascii=False)
 
     print(f"\n\nDetailed report saved to: i18n-extraction-report.json")
@@ -3,7 +3,8 @@
 Automatically fix missing translation keys in Prompt Party application.
 This script:
 1. Identifies missing keys in FR/NL by comparing with EN
-2. Adds missing keys with [AUTO-TRANSLATED] marker
+2. Adds missing keys with [AUTO-TRANSLATED] marker (do-not-translate glossary
+   values are copied as-is)
 3. Removes orphaned keys that don't exist in EN
 4. Validates JSON integrity
 """
@@ -13,11 +14,18 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from i18n_glossary import get_glossary
+from i18n_profile import span, timed
+from marker_index import sync_catalogs
+
+@timed('load')
 def load_json(file_path: Path) -> Dict:
     """Load and parse JSON file."""
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+@timed('write')
 def save_json(file_path: Path, data: Dict) -> None:
     """Save data as formatted JSON."""
     with open(file_path, 'w', encoding='utf-8') as f:
@@ -82,27 +90,33 @@ def fix_translations(en_file: Path, target_file: Path, lang: str) -> Tuple[int,
     target_data = load_json(target_file)
 
     # Get all keys
-    en_keys = get_all_keys(en_data)
-    target_keys = get_all_keys(target_data)
+    with span('flatten', 'get_all_keys'):
+        en_keys = get_all_keys(en_data)
+        target_keys = get_all_keys(target_data)
 
     print(f"\nEnglish keys: {len(en_keys)}")
     print(f"{lang.upper()} keys: {len(target_keys)}")
 
     # Find missing and orphaned keys
-    missing_keys = en_keys - target_keys
-    orphaned_keys = target_keys - en_keys
+    with span('compare', 'missing/orphaned keys'):
+        missing_keys = en_keys - target_keys
+        orphaned_keys = target_keys - en_keys
 
     print(f"\nMissing keys in {lang.upper()}: {len(missing_keys)}")
     print(f"Orphaned keys in {lang.upper()}: {len(orphaned_keys)}")
 
-    # Add missing keys with [AUTO-TRANSLATED] marker
+    # Add missing keys with [AUTO-TRANSLATED] marker, except glossary values
+    # that stay identical to English by design
     keys_added = 0
     if missing_keys:
         print(f"\nAdding {len(missing_keys)} missing keys...")
+        missing_values = {key: get_value_by_path(en_data, key) for key in missing_keys}
+        exempt = get_glossary().match_batch(
+            [v for v in missing_values.values() if isinstance(v, str)], target_file.stem)
         for i, key in enumerate(sorted(missing_keys), 1):
-            en_value = get_value_by_path(en_data, key)
+            en_value = missing_values[key]
             if en_value is not None and isinstance(en_value, str):
-                auto_value = f"{en_value} [AUTO-TRANSLATED]"
+                auto_value = en_value if exempt[en_value] else f"{en_value} [AUTO-TRANSLATED]"
                 set_value_by_path(target_data, key, auto_value)
                 keys_added += 1
                 if i <= 5:  # Show first 5 examples
@@ -133,7 +147,8 @@ def fix_translations(en_file: Path, target_file: Path, lang: str) -> Tuple[int,
     # Verify
     print(f"\nVerifying {lang.upper()} translations...")
     updated_data = load_json(target_file)
-    updated_keys = get_all_keys(updated_data)
+    with span('flatten', 'get_all_keys'):
+        updated_keys = get_all_keys(updated_data)
     print(f"  Final key count: {len(updated_keys)}")
     print(f"  Keys match English: {updated_keys == en_keys}")
 
@@ -161,6 +176,9 @@ def main():
     # Fix Dutch translations
     nl_added, nl_removed = fix_translations(en_file, nl_file, 'dutch')
 
+    # Record when each [AUTO-TRANSLATED] marker appeared
+    markers = sync_catalogs(base_path / 'messages')
+
     # Summary
     print(f"\n{'='*60}")
     print("SUMMARY")
@@ -174,6 +192,9 @@ def main():
     print(f"\nTotal changes:")
     print(f"  - Total keys added: {fr_added + nl_added}")
     print(f"  - Total keys removed: {fr_removed + nl_removed}")
+    print(f"\nPending markers:")
+    for lang, counts in markers.items():
+        print(f"  - {lang.upper()}: {counts['pending']} ({counts['introduced']} new, {counts['resolved']} resolved)")
 
     print(f"\n{'='*60}")
     print("All translation files updated successfully!")
@@ -4,6 +4,11 @@ Generate comprehensive translation files for Prompt Party i18n
 """
 
 import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from i18n_profile import span
 
 # All translations organized by namespace
 translations = {
@@ -331,22 +336,25 @@ def main():
 
     for locale in locales:
         try:
-            with open(f'messages/{locale}.json', 'r', encoding='utf-8') as f:
+            with span('load', f'{locale}.json'), \
+                    open(f'messages/{locale}.json', 'r', encoding='utf-8') as f:
                 existing_translations[locale] = json.load(f)
         except FileNotFoundError:
             existing_translations[locale] = {}
 
     # Merge new translations
-    for namespace, trans_by_locale in translations.items():
-        for locale in locales:
-            if locale in trans_by_locale:
-                if namespace not in existing_translations[locale]:
-                    existing_translations[locale][namespace] = {}
-                existing_translations[locale][namespace] = trans_by_locale[locale]
+    with span('compare', 'merge namespaces'):
+        for namespace, trans_by_locale in translations.items():
+            for locale in locales:
+                if locale in trans_by_locale:
+                    if namespace not in existing_translations[locale]:
+                        existing_translations[locale][namespace] = {}
+                    existing_translations[locale][namespace] = trans_by_locale[locale]
 
     # Write updated translation files
     for locale in locales:
-        with open(f'messages/{locale}.json', 'w', encoding='utf-8') as f:
+        with span('write', f'{locale}.json'), \
+                open(f'messages/{locale}.json', 'w', encoding='utf-8') as f:
             json.dump(existing_translations[locale], f, indent=2, ensure_ascii=False)
 
     print("✓ Translation files updated successfully!")
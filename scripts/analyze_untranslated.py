@@ -4,48 +4,25 @@ Analyze untranslated values and categorize them by priority
 """
 
 import json
-import re
 from pathlib import Path
 from collections import defaultdict
 
+from i18n_categories import get_classifier
+from i18n_profile import span, timed
+
+@timed('load')
 def load_report():
     """Load the audit report"""
     report_path = Path(__file__).parent.parent / "translation-audit-report.json"
     with open(report_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def categorize_untranslated(untranslated_items):
-    """Categorize untranslated items by type and priority"""
-    categories = {
-        'ui_classes': [],      # CSS classes (low priority)
-        'numbers': [],         # Numbers and stats (low priority)
-        'urls': [],           # URLs (low priority)
-        'technical': [],      # Technical terms
-        'short_text': [],     # Short text (1-3 words)
-        'long_text': [],      # Long text (sentences/paragraphs)
-        'mixed': []           # Mixed content
-    }
-
-    for item in untranslated_items:
-        key = item['key']
-        value = item['value']
-
-        # Categorize based on content
-        if 'bg-' in value or 'text-' in value or 'border-' in value or 'ring-' in value:
-            categories['ui_classes'].append(item)
-        elif re.match(r'^[\d\s,+%]+$', value):
-            categories['numbers'].append(item)
-        elif value.startswith('http') or '://' in value:
-            categories['urls'].append(item)
-        elif len(value.split()) <= 3 and not any(c in value for c in '.!?'):
-            categories['short_text'].append(item)
-        elif len(value) > 100 or '\n' in value:
-            categories['long_text'].append(item)
-        else:
-            categories['mixed'].append(item)
-
-    return categories
+@timed('compare')
+def categorize_untranslated(untranslated_items, lang=None):
+    """Categorize untranslated items with the rules of i18n-categories.json"""
+    return get_classifier().classify_batch(untranslated_items, lang)
 
+@timed('compare')
 def analyze_by_namespace(untranslated_items):
     """Group untranslated items by namespace"""
     by_namespace = defaultdict(list)
@@ -59,13 +36,14 @@ def analyze_by_namespace(untranslated_items):
     sorted_namespaces = sorted(by_namespace.items(), key=lambda x: len(x[1]), reverse=True)
     return sorted_namespaces
 
-def generate_priority_list(report):
-    """Generate prioritized list of translations to fix"""
+def generate_priority_list(report, save=True):
+    """Generate prioritized list of translations to fix, keyed by language"""
 
     print("\n" + "=" * 80)
     print("TRANSLATION PRIORITY ANALYSIS")
     print("=" * 80)
 
+    prioritized = {}
     for lang in ['fr', 'nl']:
         untranslated = report['untranslated_values'][lang]
 
@@ -74,23 +52,16 @@ def generate_priority_list(report):
         print(f"{'='*80}")
 
         # Categorize
-        categories = categorize_untranslated(untranslated)
+        classifier = get_classifier()
+        categories = categorize_untranslated(untranslated, lang)
+        buckets = classifier.priorities(categories)
 
         print("\n📊 BY CATEGORY:")
         print("-" * 80)
-        priority_order = [
-            ('long_text', '🔴 High Priority - Long Text', categories['long_text']),
-            ('short_text', '🟡 Medium Priority - Short Text', categories['short_text']),
-            ('mixed', '🟡 Medium Priority - Mixed Content', categories['mixed']),
-            ('technical', '🟢 Low Priority - Technical Terms', categories['technical']),
-            ('numbers', '⚪ Very Low - Numbers/Stats', categories['numbers']),
-            ('urls', '⚪ Very Low - URLs', categories['urls']),
-            ('ui_classes', '⚪ Very Low - CSS Classes', categories['ui_classes'])
-        ]
-
-        for cat_key, cat_label, items in priority_order:
-            print(f"\n{cat_label}: {len(items)} items")
-            if len(items) > 0 and cat_key in ['long_text', 'short_text', 'mixed']:
+        for cat_key, items in categories.items():
+            spec = classifier.categories[cat_key]
+            print(f"\n{spec.get('label', cat_key)}: {len(items)} items")
+            if len(items) > 0 and spec.get('priority') in ('high', 'medium'):
                 for item in items[:5]:
                     print(f"  - {item['key']}")
                     preview = item['value'][:80] + '...' if len(item['value']) > 80 else item['value']
@@ -114,8 +85,10 @@ def generate_priority_list(report):
         print("\n\n✅ RECOMMENDED PRIORITY ORDER:")
         print("-" * 80)
 
-        high_priority = categories['long_text'] + categories['mixed'][:10]
-        medium_priority = categories['short_text']
+        high_priority = buckets['high']
+        medium_priority = buckets['medium']
+        low_priority = buckets['low']
+        low_count = sum(len(items) for items in low_priority.values())
 
         print(f"1. HIGH PRIORITY ({len(high_priority)} items):")
         print(f"   - Long text content (user-facing messages, descriptions)")
@@ -125,28 +98,21 @@ def generate_priority_list(report):
         print(f"   - Short text (labels, buttons, headings)")
         print(f"   - Navigation items")
 
-        print(f"\n3. LOW PRIORITY ({len(categories['numbers']) + len(categories['urls']) + len(categories['ui_classes'])} items):")
-        print(f"   - CSS classes: {len(categories['ui_classes'])}")
-        print(f"   - Numbers/stats: {len(categories['numbers'])}")
-        print(f"   - URLs: {len(categories['urls'])}")
+        print(f"\n3. LOW PRIORITY ({low_count} items):")
+        for cat_key, items in low_priority.items():
+            print(f"   - {cat_key}: {len(items)}")
 
-        # Save to file
-        output_file = Path(__file__).parent.parent / f"untranslated_{lang}_prioritized.json"
-        output_data = {
+        prioritized[lang] = {
             'summary': {
                 'total': len(untranslated),
                 'high_priority': len(high_priority),
                 'medium_priority': len(medium_priority),
-                'low_priority': len(categories['numbers']) + len(categories['urls']) + len(categories['ui_classes'])
+                'low_priority': low_count
             },
             'categories': {
                 'high_priority': high_priority,
                 'medium_priority': medium_priority,
-                'low_priority': {
-                    'numbers': categories['numbers'],
-                    'urls': categories['urls'],
-                    'ui_classes': categories['ui_classes']
-                }
+                'low_priority': low_priority
             },
             'by_namespace': [
                 {
@@ -158,14 +124,25 @@ def generate_priority_list(report):
             ]
         }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Save to file
+        if save:
+            output_file = Path(__file__).parent.parent / f"untranslated_{lang}_prioritized.json"
+            with span('write', output_file.name), open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(prioritized[lang], f, indent=2, ensure_ascii=False)
+
+            print(f"\n💾 Detailed analysis saved to: {output_file}")
 
-        print(f"\n💾 Detailed analysis saved to: {output_file}")
+    return prioritized
 
 def main():
     report = load_report()
     generate_priority_list(report)
+    get_classifier().save_cache()
+
+    print("\n" + "=" * 80)
+    print("CATEGORY RULES")
+    print("=" * 80)
+    get_classifier().print_stats()
 
     print("\n" + "=" * 80)
     print("SUMMARY")
@@ -8,27 +8,40 @@ Analyzes all translation files and component usage to identify:
 - Coverage statistics
 """
 
+import argparse
 import json
 import re
 import os
+from itertools import compress
+from operator import eq
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Optional, Set, List, Tuple
 from collections import defaultdict
 
+from findings_db import DB_FILE as FINDINGS_DB
+from i18n_catalog import SOURCE_LOCALE, align_catalogs
+from i18n_glossary import get_glossary
+from i18n_profile import count, timed
+from i18n_report import Findings, JsonLinesReport, open_report
+
 class TranslationAuditor:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, translations: Optional[Dict[str, Dict]] = None):
         self.project_root = Path(project_root)
         self.messages_dir = self.project_root / "messages"
         self.src_dir = self.project_root / "src"
 
-        # Load translation files
+        # Load translation files, unless the caller already holds them
         self.translations = {}
-        self.load_translations()
+        if translations is None:
+            self.load_translations()
+        else:
+            self.translations = translations
 
         # Track usage
         self.used_keys = set()
         self.used_namespaces = set()
 
+    @timed('load')
     def load_translations(self):
         """Load all translation JSON files"""
         for lang in ['en', 'fr', 'nl']:
@@ -74,6 +87,7 @@ class TranslationAuditor:
                 return None
         return current
 
+    @timed('scan')
     def scan_tsx_files(self):
         """Scan all TSX files for translation usage"""
         tsx_files = list(self.src_dir.rglob("*.tsx"))
@@ -89,6 +103,8 @@ class TranslationAuditor:
         for tsx_file in tsx_files:
             try:
                 content = tsx_file.read_text(encoding='utf-8')
+                count('files')
+                count('regex evaluations', 3)
 
                 # Find namespace usage
                 namespaces = re.findall(use_translations_pattern, content)
@@ -111,76 +127,67 @@ class TranslationAuditor:
         print(f"✓ Found {len(self.used_namespaces)} unique namespaces")
         print(f"✓ Found {len(self.used_keys)} unique translation keys")
 
-    def check_missing_keys(self) -> Dict[str, Set[str]]:
+    @timed('compare')
+    def check_missing_keys(self, stream=None, keep: bool = True) -> Dict[str, Findings]:
         """Check for keys present in en.json but missing in fr.json or nl.json"""
-        en_keys = self.get_all_keys(self.translations['en'])
-        fr_keys = self.get_all_keys(self.translations['fr'])
-        nl_keys = self.get_all_keys(self.translations['nl'])
+        en_keys = sorted(self.get_all_keys(self.translations['en']))
 
-        missing = {
-            'fr': en_keys - fr_keys,
-            'nl': en_keys - nl_keys
-        }
+        missing = {}
+        for lang in ['fr', 'nl']:
+            lang_keys = self.get_all_keys(self.translations[lang])
+            missing[lang] = Findings('missing_key', lang, stream, keep)
+            for key in en_keys:
+                if key not in lang_keys:
+                    missing[lang].add(key, key=key)
 
         return missing
 
-    def check_untranslated_values(self) -> Dict[str, List[Tuple[str, str]]]:
+    def align_values(self) -> Tuple[List[str], Dict[str, List]]:
+        """Align the values of every locale over one sorted English key index"""
+        langs = list(self.translations)
+        index, columns = align_catalogs(self.translations[SOURCE_LOCALE],
+                                        [self.translations[lang] for lang in langs])
+        return index, dict(zip(langs, columns))
+
+    @timed('compare')
+    def check_untranslated_values(self, stream=None, keep: bool = True) -> Dict[str, Findings]:
         """Find values in fr/nl that are identical to English (likely untranslated)"""
-        en_keys = self.get_all_keys(self.translations['en'])
-        untranslated = {
-            'fr': [],
-            'nl': []
+        index, columns = self.align_values()
+        en_column = columns[SOURCE_LOCALE]
+        rows = range(len(index))
+
+        # One elementwise comparison per locale over the aligned columns
+        identical = {
+            lang: list(compress(rows, map(eq, column, en_column)))
+            for lang, column in columns.items() if lang != SOURCE_LOCALE
         }
 
-        for key in en_keys:
-            en_value = self.get_value_by_path(self.translations['en'], key)
-
-            # Check French
-            fr_value = self.get_value_by_path(self.translations['fr'], key)
-            if fr_value == en_value and isinstance(en_value, str) and len(en_value) > 0:
-                # Ignore keys that are intentionally the same (like brand names, etc.)
-                if not self.is_intentionally_same(en_value):
-                    untranslated['fr'].append((key, en_value))
-
-            # Check Dutch
-            nl_value = self.get_value_by_path(self.translations['nl'], key)
-            if nl_value == en_value and isinstance(en_value, str) and len(en_value) > 0:
-                if not self.is_intentionally_same(en_value):
-                    untranslated['nl'].append((key, en_value))
-
+        # Classify each distinct value once per locale, after all comparisons
+        untranslated = {}
+        for lang, hits in identical.items():
+            distinct = {en_column[i] for i in hits}
+            strings = [value for value in distinct if isinstance(value, str) and value]
+            categories = get_glossary().match_batch(strings, lang)
+            exempt = {value for value in distinct
+                      if not isinstance(value, str) or not value or categories[value] is not None}
+            untranslated[lang] = Findings('untranslated_value', lang, stream, keep)
+            for i in hits:
+                if en_column[i] not in exempt:
+                    untranslated[lang].add((index[i], en_column[i]), key=index[i], value=en_column[i])
         return untranslated
 
-    def is_intentionally_same(self, value: str) -> bool:
-        """Check if a value is intentionally the same across languages"""
-        # Brand names, proper nouns, numbers, single chars
-        intentional_patterns = [
-            r'^Claude',
-            r'^Anthropic',
-            r'^GitHub',
-            r'^Google',
-            r'^Next\.js',
-            r'^Supabase',
-            r'^Vercel',
-            r'^MCP',
-            r'^RAG',
-            r'^AI$',
-            r'^API$',
-            r'^\d+$',
-            r'^[A-Z]{2,}$',  # Acronyms
-        ]
-
-        for pattern in intentional_patterns:
-            if re.search(pattern, value):
-                return True
-        return False
-
-    def check_orphaned_keys(self) -> Dict[str, Set[str]]:
+    def is_intentionally_same(self, value: str, lang: str = None) -> bool:
+        """Check if a value is intentionally the same across languages (see i18n-glossary.json)"""
+        return get_glossary().is_exempt(value, lang)
+
+    @timed('compare')
+    def check_orphaned_keys(self, stream=None, keep: bool = True) -> Dict[str, Findings]:
         """Find keys in translation files that are never used in code"""
-        en_keys = self.get_all_keys(self.translations['en'])
+        en_keys = sorted(self.get_all_keys(self.translations['en']))
 
         # We need to match used keys with full paths
         # This is approximate - we check if any en key contains the used key
-        potentially_orphaned = set()
+        potentially_orphaned = Findings('orphaned_key', None, stream, keep, head=10)
 
         for en_key in en_keys:
             # Check if this key is referenced in used_keys
@@ -197,7 +204,7 @@ class TranslationAuditor:
                     key_found = True
 
             if not key_found:
-                potentially_orphaned.add(en_key)
+                potentially_orphaned.add(en_key, key=en_key)
 
         return {'orphaned': potentially_orphaned}
 
@@ -213,8 +220,16 @@ class TranslationAuditor:
             'nl': (nl_count / en_count * 100) if en_count > 0 else 0
         }
 
-    def generate_report(self):
-        """Generate comprehensive audit report"""
+    def generate_report(self, save: bool = True, stream: Optional[JsonLinesReport] = None,
+                        detailed: bool = True) -> Dict:
+        """
+        Generate comprehensive audit report, returned as the data of
+        translation-audit-report.json; with a stream, every finding is also
+        written to it the moment a check finds it. Without the detailed
+        report (detailed=False, for --jsonl) the findings are not kept in
+        memory and only the summary is returned.
+        """
+        keep = save or detailed
         print("\n" + "=" * 80)
         print("TRANSLATION AUDIT REPORT")
         print("=" * 80)
@@ -238,11 +253,11 @@ class TranslationAuditor:
         # Missing keys
         print("\n❌ MISSING KEYS")
         print("-" * 80)
-        missing = self.check_missing_keys()
+        missing = self.check_missing_keys(stream, keep)
         for lang, keys in missing.items():
             print(f"\n{lang.upper()} missing {len(keys)} keys:")
             if len(keys) > 0:
-                for key in sorted(list(keys)[:20]):  # Show first 20
+                for key in keys[:20]:  # Show first 20
                     print(f"  - {key}")
                 if len(keys) > 20:
                     print(f"  ... and {len(keys) - 20} more")
@@ -250,7 +265,7 @@ class TranslationAuditor:
         # Untranslated values
         print("\n⚠️  POTENTIALLY UNTRANSLATED VALUES")
         print("-" * 80)
-        untranslated = self.check_untranslated_values()
+        untranslated = self.check_untranslated_values(stream, keep)
         for lang, items in untranslated.items():
             print(f"\n{lang.upper()} has {len(items)} values identical to English:")
             if len(items) > 0:
@@ -262,12 +277,12 @@ class TranslationAuditor:
         # Orphaned keys (potentially unused)
         print("\n🗑️  POTENTIALLY ORPHANED KEYS")
         print("-" * 80)
-        orphaned = self.check_orphaned_keys()
+        orphaned = self.check_orphaned_keys(stream, keep)
         orphaned_keys = orphaned['orphaned']
         print(f"Found {len(orphaned_keys)} keys that may not be used in code")
         print("(Note: This is approximate and may include false positives)")
         if len(orphaned_keys) > 0:
-            for key in sorted(list(orphaned_keys)[:10]):
+            for key in orphaned_keys[:10]:
                 print(f"  - {key}")
             if len(orphaned_keys) > 10:
                 print(f"  ... and {len(orphaned_keys) - 10} more")
@@ -295,31 +310,51 @@ class TranslationAuditor:
         else:
             print(f"\n⚡ Total issues to fix: {total_issues}")
 
+        if not keep:
+            return self.build_summary()
+        report = self.build_detailed_report(missing, untranslated, orphaned)
+
         # Save detailed report to file
-        self.save_detailed_report(missing, untranslated, orphaned)
+        if save:
+            self.save_detailed_report(report)
+        return report
 
-    def save_detailed_report(self, missing, untranslated, orphaned):
-        """Save detailed report to JSON file"""
-        report = {
+    def build_summary(self) -> Dict:
+        """Report data besides the findings"""
+        return {
             'statistics': {
                 'en': self.count_keys(self.translations['en']),
                 'fr': self.count_keys(self.translations['fr']),
                 'nl': self.count_keys(self.translations['nl'])
             },
             'coverage': self.calculate_coverage(),
+            'namespaces_used': sorted(list(self.used_namespaces)),
+            'total_files_scanned': len(list(self.src_dir.rglob("*.tsx")))
+        }
+
+    @timed('report')
+    def build_detailed_report(self, missing, untranslated, orphaned) -> Dict:
+        """Detailed report data"""
+        summary = self.build_summary()
+        return {
+            'statistics': summary['statistics'],
+            'coverage': summary['coverage'],
             'missing_keys': {
-                'fr': sorted(list(missing['fr'])),
-                'nl': sorted(list(missing['nl']))
+                'fr': list(missing['fr']),
+                'nl': list(missing['nl'])
             },
             'untranslated_values': {
                 'fr': [{'key': k, 'value': v} for k, v in untranslated['fr']],
                 'nl': [{'key': k, 'value': v} for k, v in untranslated['nl']]
             },
-            'orphaned_keys': sorted(list(orphaned['orphaned'])),
-            'namespaces_used': sorted(list(self.used_namespaces)),
-            'total_files_scanned': len(list(self.src_dir.rglob("*.tsx")))
+            'orphaned_keys': list(orphaned['orphaned']),
+            'namespaces_used': summary['namespaces_used'],
+            'total_files_scanned': summary['total_files_scanned']
         }
 
+    @timed('write')
+    def save_detailed_report(self, report: Dict):
+        """Save detailed report to JSON file"""
         report_path = self.project_root / "translation-audit-report.json"
         with open(report_path, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
@@ -327,12 +362,33 @@ class TranslationAuditor:
         print(f"\n💾 Detailed report saved to: {report_path}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Audit translation catalogs and component usage")
+    parser.add_argument('--jsonl', action='store_true',
+                        help="stream findings to translation-audit-report.jsonl instead of writing the JSON report")
+    parser.add_argument('--db', type=Path, nargs='?', const=FINDINGS_DB,
+                        help=f"also record the findings in the findings database (default {FINDINGS_DB.name})")
+    args = parser.parse_args()
+
     project_root = Path(__file__).parent.parent
     auditor = TranslationAuditor(str(project_root))
 
     print("🚀 Starting Translation Audit...")
     auditor.scan_tsx_files()
-    auditor.generate_report()
+    report_path = project_root / "translation-audit-report.jsonl"
+    stream = open_report('audit_translations', report_path if args.jsonl else None, args.db)
+    if stream is None:
+        auditor.generate_report()
+        return
+
+    with stream:
+        report = auditor.generate_report(save=not args.jsonl, stream=stream, detailed=not args.jsonl)
+        stream.close(statistics=report['statistics'], coverage=report['coverage'],
+                     namespaces_used=report['namespaces_used'],
+                     total_files_scanned=report['total_files_scanned'])
+    if args.jsonl:
+        print(f"\n💾 Findings streamed to: {report_path}")
+    if args.db:
+        print(f"💾 Findings recorded in: {args.db}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Message bundle size benchmark, tracked across commits
+Measures raw (indent=2), minified, gzip and brotli bytes for every locale
+and namespace bundle, plus the statically used keys of every route. Each run
+is appended to .i18n-build/bundle-size-history.jsonl keyed by commit, and
+can be compared against a baseline commit to catch namespace growth.
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional, brotli sizes are omitted without it
+    brotli = None
+
+from build_locale_bundles import merge_entry, minify
+from i18n_catalog import (
+    BUILD_DIR,
+    LOCALES,
+    SOURCE_LOCALE,
+    get_value_by_path,
+    git,
+    load_catalogs,
+    set_value_by_path,
+)
+from i18n_profile import timed
+from i18n_usage import UsageScanner
+
+HISTORY_FILE = BUILD_DIR / "bundle-size-history.jsonl"
+
+
+def measure(data) -> Dict[str, int]:
+    """Raw, minified and compressed byte sizes of one bundle"""
+    minified = minify(data)
+    sizes = {
+        'raw': len(json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')),
+        'min': len(minified),
+        'gzip': len(gzip.compress(minified, compresslevel=9, mtime=0)),
+    }
+    if brotli is not None:
+        sizes['br'] = len(brotli.compress(minified, quality=11))
+    return sizes
+
+
+def current_commit() -> Dict:
+    """Commit hash of HEAD and whether the catalogs have uncommitted changes"""
+    commit = git('rev-parse', 'HEAD') or 'unknown'
+    dirty = bool(git('status', '--porcelain', '--', 'messages', 'src'))
+    return {'commit': commit, 'dirty': dirty}
+
+
+class BundleSizeBenchmark:
+    def __init__(self, history_file: Path = HISTORY_FILE):
+        self.history_file = Path(history_file)
+        self.catalogs = load_catalogs()
+
+    @timed('compare')
+    def locale_bundles(self) -> Dict[str, Dict]:
+        """Fallback-merged bundle trees as the runtime receives them"""
+        source = self.catalogs[SOURCE_LOCALE]
+        bundles = {SOURCE_LOCALE: source}
+        for lang in LOCALES:
+            if lang != SOURCE_LOCALE:
+                bundles[lang] = {
+                    ns: merge_entry(tree, self.catalogs[lang].get(ns), ns)[0]
+                    for ns, tree in source.items()
+                }
+        return bundles
+
+    @timed('report')
+    def run(self) -> Dict:
+        """Measure every namespace and route bundle"""
+        bundles = self.locale_bundles()
+
+        namespaces = {
+            lang: {ns: measure(tree) for ns, tree in bundle.items()}
+            for lang, bundle in bundles.items()
+        }
+
+        routes = {}
+        for route, keys in UsageScanner().route_keys().items():
+            routes[route] = {'keys': len(keys)}
+            for lang, bundle in bundles.items():
+                subset = {}
+                for key in sorted(keys):
+                    value = get_value_by_path(bundle, key)
+                    if value is not None:
+                        set_value_by_path(subset, key, value)
+                routes[route][lang] = measure(subset)
+
+        return {
+            **current_commit(),
+            'timestamp': datetime.now().isoformat(),
+            'namespaces': namespaces,
+            'routes': routes,
+        }
+
+    @timed('write')
+    def append(self, record: Dict):
+        """Append one run to the history file"""
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.history_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    @timed('load')
+    def load_history(self) -> Dict[str, Dict]:
+        """Latest recorded run for each commit"""
+        history = {}
+        if self.history_file.exists():
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        history[record['commit']] = record
+        return history
+
+    def find_baseline(self, ref: str) -> Optional[Dict]:
+        """Resolve a commit-ish and return its recorded run"""
+        history = self.load_history()
+        commit = git('rev-parse', ref) or ref
+        if commit in history:
+            return history[commit]
+        # Allow abbreviated hashes that git can no longer resolve
+        matches = [c for c in history if c.startswith(ref)]
+        return history[matches[0]] if len(matches) == 1 else None
+
+
+@timed('compare', 'compare baseline')
+def compare(current: Dict, baseline: Dict, encoding: str,
+            threshold_bytes: int, threshold_pct: float) -> List[Dict]:
+    """Print namespace and route deltas, return namespaces that grew past the threshold"""
+    flagged = []
+
+    print(f"\n📊 NAMESPACE DELTAS vs {baseline['commit'][:10]} ({encoding} bytes)")
+    print("-" * 80)
+    for lang, namespaces in current['namespaces'].items():
+        base_namespaces = baseline['namespaces'].get(lang, {})
+        for ns in sorted(set(namespaces) | set(base_namespaces)):
+            now = namespaces.get(ns, {}).get(encoding, 0)
+            before = base_namespaces.get(ns, {}).get(encoding, 0)
+            delta = now - before
+            if delta == 0:
+                continue
+            pct = (delta / before * 100) if before else float('inf')
+            grew = delta > threshold_bytes and pct > threshold_pct
+            marker = '🔺' if grew else '  '
+            print(f"{marker} {lang}/{ns:30} {before:>9,} → {now:>9,} ({delta:+,} B, {pct:+.1f}%)")
+            if grew:
+                flagged.append({'locale': lang, 'namespace': ns, 'before': before,
+                                'after': now, 'delta': delta})
+
+    print(f"\n🧭 ROUTE DELTAS ({SOURCE_LOCALE}, {encoding} bytes)")
+    print("-" * 80)
+    for route, sizes in sorted(current['routes'].items()):
+        now = sizes.get(SOURCE_LOCALE, {}).get(encoding, 0)
+        before = baseline['routes'].get(route, {}).get(SOURCE_LOCALE, {}).get(encoding, 0)
+        if now != before:
+            print(f"   {route:50} {before:>9,} → {now:>9,} ({now - before:+,} B)")
+
+    return flagged
+
+
+def print_summary(record: Dict, encoding: str):
+    """Print per-locale totals and the largest namespaces and routes"""
+    print("\n📦 BUNDLE SIZES")
+    print("-" * 80)
+    for lang, namespaces in record['namespaces'].items():
+        totals = {}
+        for sizes in namespaces.values():
+            for enc, size in sizes.items():
+                totals[enc] = totals.get(enc, 0) + size
+        summary = ', '.join(f"{enc} {size / 1024:.1f} KB" for enc, size in totals.items())
+        print(f"{lang.upper()}: {summary}")
+
+    print(f"\n🏋️  LARGEST NAMESPACES ({SOURCE_LOCALE}, {encoding})")
+    print("-" * 80)
+    namespaces = record['namespaces'][SOURCE_LOCALE]
+    for ns, sizes in sorted(namespaces.items(), key=lambda x: -x[1][encoding])[:10]:
+        print(f"  {ns:30} {sizes[encoding]:>9,} B")
+
+    print(f"\n🧭 LARGEST ROUTES ({SOURCE_LOCALE}, {encoding} of statically used keys)")
+    print("-" * 80)
+    routes = record['routes']
+    for route, sizes in sorted(routes.items(), key=lambda x: -x[1][SOURCE_LOCALE][encoding])[:10]:
+        print(f"  {route:50} {sizes[SOURCE_LOCALE][encoding]:>9,} B ({sizes['keys']} keys)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark message bundle sizes across commits")
+    parser.add_argument('--baseline', help="commit-ish to compare against (must be in the history)")
+    parser.add_argument('--threshold-bytes', type=int, default=1024,
+                        help="flag namespaces that grew by more than this many compressed bytes")
+    parser.add_argument('--threshold-pct', type=float, default=5.0,
+                        help="... and by more than this percentage")
+    parser.add_argument('--encoding', choices=['gzip', 'br', 'min'], default='gzip')
+    parser.add_argument('--no-record', action='store_true', help="do not append to the history")
+    parser.add_argument('--strict', action='store_true', help="exit 1 when a namespace is flagged")
+    args = parser.parse_args()
+
+    if args.encoding == 'br' and brotli is None:
+        print("⚠ brotli is not installed, using gzip sizes")
+        args.encoding = 'gzip'
+
+    print("🚀 Measuring message bundle sizes...")
+    benchmark = BundleSizeBenchmark()
+    record = benchmark.run()
+    print_summary(record, args.encoding)
+
+    if not args.no_record:
+        benchmark.append(record)
+        dirty = ' (uncommitted changes)' if record['dirty'] else ''
+        print(f"\n💾 Recorded {record['commit'][:10]}{dirty} in {benchmark.history_file}")
+
+    if args.baseline:
+        baseline = benchmark.find_baseline(args.baseline)
+        if baseline is None:
+            print(f"\n✗ No recorded run for baseline {args.baseline}. "
+                  f"Check it out and run this script first.")
+            sys.exit(2)
+        flagged = compare(record, baseline, args.encoding, args.threshold_bytes, args.threshold_pct)
+        if flagged:
+            print(f"\n⚠️  {len(flagged)} namespace bundles grew past the threshold "
+                  f"(> {args.threshold_bytes:,} B and > {args.threshold_pct}%)")
+            if args.strict:
+                sys.exit(1)
+        else:
+            print("\n✓ No namespace grew past the threshold")
+
+
+if __name__ == "__main__":
+    main()
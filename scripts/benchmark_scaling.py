@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark of the translation scripts on synthetic projects
+Generates deterministic synthetic projects (synthetic_i18n.py) at several
+multiples of the real catalog and source tree, times the core function of
+every script on each, and prints one row per script with the time at each
+scale and the fitted scaling exponent (1.0 = linear). Runs are appended to
+.i18n-build/scaling-history.jsonl keyed by commit, and can be compared
+against a baseline commit to catch regressions release to release.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import math
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import i18n_categories
+import i18n_glossary
+import i18n_icu
+import i18n_tailwind
+from analyze_untranslated import generate_priority_list
+from audit_translations import TranslationAuditor
+from benchmark_bundle_sizes import current_commit
+from build_locale_bundles import BundleBuilder
+from check_placeholders import find_mismatches as placeholder_mismatches
+from check_terms import TermChecker
+from compile_icu_messages import MessageCompiler
+from detect_languages import MIN_LETTERS, find_mismatches as language_mismatches
+from detect_length_anomalies import find_anomalies
+from detect_near_copies import NearCopyDetector
+from generate_message_types import MessageTypeGenerator
+from generate_translations import TranslationGenerator
+from i18n_catalog import (
+    BUILD_DIR,
+    LOCALES,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    align_catalogs,
+    flatten,
+    git,
+    load_catalogs,
+)
+from i18n_categories import CategoryClassifier
+from i18n_langid import load_identifier
+from i18n_usage import UsageScanner
+from string_pool_report import StringPool
+from synthetic_i18n import SYNTHETIC_DIR, current_spec, write_project
+
+HISTORY_FILE = BUILD_DIR / "scaling-history.jsonl"
+DEFAULT_SCALES = [0.1, 1, 10]
+
+
+def load_script(name: str):
+    """Import one of the root scripts (their file names are not module names)"""
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), PROJECT_ROOT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Workload:
+    """One synthetic project, loaded once and shared by the benchmarks of a scale"""
+
+    def __init__(self, root: Path, scratch: Path):
+        self.root = root
+        self.messages_dir = root / "messages"
+        self.src_dir = root / "src"
+        self.scratch = scratch
+        self.catalogs = load_catalogs(self.messages_dir, LOCALES)
+        self._report = None
+        self._prioritized = None
+
+    def scratch_dir(self, name: str) -> Path:
+        """A fresh output directory, so every run starts with cold caches"""
+        return Path(tempfile.mkdtemp(prefix=f"{name}-", dir=self.scratch))
+
+    def report(self) -> Dict:
+        if self._report is None:
+            auditor = TranslationAuditor(str(self.root), translations=self.catalogs)
+            auditor.scan_tsx_files()
+            self._report = auditor.generate_report(save=False)
+        return self._report
+
+    def prioritized(self) -> Dict:
+        if self._prioritized is None:
+            self._prioritized = generate_priority_list(self.report(), save=False)
+        return self._prioritized
+
+
+# Each benchmark prepares its inputs outside the timing and returns the
+# zero-argument call that is timed
+def bench_load(w: Workload):
+    return lambda: load_catalogs(w.messages_dir, LOCALES)
+
+
+def bench_align(w: Workload):
+    source = w.catalogs[SOURCE_LOCALE]
+    return lambda: align_catalogs(source, [w.catalogs[lang] for lang in TARGET_LOCALES])
+
+
+def bench_audit(w: Workload):
+    def run():
+        auditor = TranslationAuditor(str(w.root), translations=w.catalogs)
+        auditor.scan_tsx_files()
+        return auditor.generate_report(save=False)
+    return run
+
+
+def bench_categories(w: Workload):
+    classifier = CategoryClassifier(cache_file=w.scratch_dir('categories') / "cache.json")
+    items = w.report()['untranslated_values']
+    return lambda: [classifier.classify_batch(items[lang], lang) for lang in TARGET_LOCALES]
+
+
+def bench_generate(w: Workload):
+    prioritized = w.prioritized()
+
+    def run():
+        # Without the developer's TM store, and with translation memories rebuilt every run
+        generator = TranslationGenerator(str(w.root), translations=w.catalogs,
+                                         untranslated=prioritized, tm_db=None)
+        return generator.generate_report(save=False)
+    return run
+
+
+def bench_usage(w: Workload):
+    return lambda: UsageScanner(w.src_dir).route_keys(w.src_dir / "app")
+
+
+def bench_extract(w: Workload):
+    extract = load_script('extract-hardcoded-strings')
+    return lambda: extract.scan_directory(w.root)
+
+
+def bench_verify(w: Workload):
+    verifier_class = load_script('verify_translations').TranslationVerifier
+
+    def run():
+        verifier = verifier_class(w.messages_dir)
+        verifier.load_translations()
+        return verifier.compare_translations()
+    return run
+
+
+def bench_placeholders(w: Workload):
+    return lambda: placeholder_mismatches(w.catalogs)
+
+
+def bench_lengths(w: Workload):
+    return lambda: find_anomalies(w.catalogs)
+
+
+def bench_near_copies(w: Workload):
+    def run():
+        detector = NearCopyDetector(w.catalogs, 0.9)
+        detector.build_index()
+        return [detector.scan_locale(lang) for lang in TARGET_LOCALES]
+    return run
+
+
+def bench_terms(w: Workload):
+    return lambda: TermChecker().check(w.catalogs)
+
+
+def bench_languages(w: Workload):
+    # Profiles trained on the real catalogs, as the script uses them
+    identifier = load_identifier()
+    flats = {lang: flatten(catalog) for lang, catalog in w.catalogs.items()}
+    return lambda: [language_mismatches(identifier, lang, flat, 0.99, MIN_LETTERS) for lang, flat in flats.items()]
+
+
+def bench_string_pool(w: Workload):
+    return lambda: StringPool().build(w.messages_dir, LOCALES)
+
+
+def bench_icu(w: Workload):
+    output = w.scratch_dir('icu')
+    compiler = MessageCompiler(cache_file=output / "cache.json")
+    return lambda: compiler.compile_catalogs(w.catalogs, output)
+
+
+def bench_types(w: Workload):
+    output = w.scratch_dir('types')
+    generator = MessageTypeGenerator(output_dir=output, cache_file=output / "cache.json")
+    return lambda: generator.generate(w.catalogs[SOURCE_LOCALE])
+
+
+def bench_bundles(w: Workload):
+    builder = BundleBuilder(w.messages_dir, w.scratch_dir('bundles'))
+    return lambda: builder.build(force=True, workers=1)
+
+
+BENCHMARKS: Dict[str, Callable[[Workload], Callable]] = {
+    'load catalogs': bench_load,
+    'align catalogs': bench_align,
+    'audit_translations': bench_audit,
+    'i18n_categories': bench_categories,
+    'generate_translations': bench_generate,
+    'i18n_usage (routes)': bench_usage,
+    'extract-hardcoded-strings': bench_extract,
+    'verify_translations': bench_verify,
+    'check_placeholders': bench_placeholders,
+    'detect_length_anomalies': bench_lengths,
+    'detect_near_copies': bench_near_copies,
+    'check_terms': bench_terms,
+    'detect_languages': bench_languages,
+    'string_pool_report': bench_string_pool,
+    'compile_icu_messages': bench_icu,
+    'generate_message_types': bench_types,
+    'build_locale_bundles': bench_bundles,
+}
+
+
+def reset_caches():
+    """Drop the process-wide caches, so no run profits from an earlier one"""
+    i18n_glossary._default_glossary = None
+    i18n_tailwind._default_vocabulary = None
+    i18n_categories._default_classifier = None
+    i18n_icu._signatures.clear()
+
+
+def measure(prepare: Callable[[Workload], Callable], workload: Workload, repeat: int,
+            memory: bool) -> Dict[str, float]:
+    """Best wall time over repeat fresh runs, plus the traced peak of one more run"""
+    best = math.inf
+    for _ in range(repeat):
+        reset_caches()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run = prepare(workload)
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+    result = {'seconds': round(best, 6)}
+    if memory:
+        reset_caches()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run = prepare(workload)
+            tracemalloc.start()
+            try:
+                run()
+                result['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+            finally:
+                tracemalloc.stop()
+    return result
+
+
+def exponent(points: Dict[float, float]) -> Optional[float]:
+    """Least-squares slope of log(time) over log(scale)"""
+    pairs = [(math.log(scale), math.log(seconds)) for scale, seconds in points.items() if seconds > 0]
+    if len(pairs) < 2:
+        return None
+    mean_x = sum(x for x, _ in pairs) / len(pairs)
+    mean_y = sum(y for _, y in pairs) / len(pairs)
+    spread = sum((x - mean_x) ** 2 for x, _ in pairs)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in pairs) / spread
+
+
+def run_benchmarks(scales: List[float], names: List[str], repeat: int, memory: bool, seed: int) -> Dict:
+    base = current_spec(seed)
+    record = {
+        **current_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'scales': {},
+        'results': {name: {} for name in names},
+    }
+    with tempfile.TemporaryDirectory(prefix="i18n-scaling-") as scratch:
+        for scale in scales:
+            spec = base.scaled(scale)
+            label = f"{scale:g}x"
+            print(f"\n🏗️  {label}: {spec.keys:,} keys x {len(spec.locales)} locales, {spec.files:,} TSX files")
+            start = time.perf_counter()
+            root = write_project(SYNTHETIC_DIR / label, spec)
+            print(f"   project ready in {time.perf_counter() - start:.1f}s ({root})")
+            record['scales'][label] = {'scale': scale, 'keys': spec.keys, 'files': spec.files}
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                workload = Workload(root, Path(scratch))
+            for name in names:
+                result = measure(BENCHMARKS[name], workload, repeat, memory)
+                record['results'][name][label] = result
+                peak = f", peak {result['peak_mb']:.1f} MB" if 'peak_mb' in result else ''
+                print(f"   ✓ {name:28} {result['seconds'] * 1000:>10.1f} ms{peak}")
+    return record
+
+
+def print_table(record: Dict):
+    labels = list(record['scales'])
+    print("\n" + "=" * 80)
+    print("SCALING BENCHMARK (best wall time)")
+    print("=" * 80)
+    print(f"{'SCRIPT':28}" + ''.join(f"{label:>11}" for label in labels) + f"{'EXP':>7}")
+    print(f"{'  keys':28}" + ''.join(f"{record['scales'][label]['keys']:>11,}" for label in labels))
+    print(f"{'  TSX files':28}" + ''.join(f"{record['scales'][label]['files']:>11,}" for label in labels))
+    print("-" * 80)
+    for name, results in record['results'].items():
+        line = f"{name[:28]:28}"
+        for label in labels:
+            seconds = results[label]['seconds']
+            line += f"{seconds * 1000:>9.1f}ms"
+        slope = exponent({record['scales'][label]['scale']: results[label]['seconds'] for label in labels})
+        line += f" {slope:>6.2f}" if slope is not None else f" {'-':>6}"
+        print(line)
+    print("-" * 80)
+    print("EXP: fitted exponent of time over scale (1.0 linear, 2.0 quadratic)")
+
+    if not any('peak_mb' in result for results in record['results'].values() for result in results.values()):
+        return
+    print("\n🧠 PEAK PYTHON ALLOCATION (tracemalloc)")
+    print("-" * 80)
+    for name, results in record['results'].items():
+        print(f"{name[:28]:28}" + ''.join(f"{results[label].get('peak_mb', 0):>9.1f}MB" for label in labels))
+
+
+def append_history(record: Dict, history_file: Path = HISTORY_FILE):
+    history_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_file, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def find_baseline(ref: str, history_file: Path = HISTORY_FILE) -> Optional[Dict]:
+    """Latest recorded run of a commit-ish"""
+    history = {}
+    if history_file.exists():
+        with open(history_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    history[record['commit']] = record
+    commit = git('rev-parse', ref) or ref
+    if commit in history:
+        return history[commit]
+    matches = [c for c in history if c.startswith(ref)]
+    return history[matches[0]] if len(matches) == 1 else None
+
+
+def compare(record: Dict, baseline: Dict, threshold_ms: float, threshold_pct: float) -> List[Dict]:
+    """Print time ratios against the baseline, return the benchmarks that slowed past the threshold"""
+    flagged = []
+    print(f"\n📊 DELTAS vs {baseline['commit'][:10]} (time now / time then)")
+    print("-" * 80)
+    for name, results in record['results'].items():
+        base_results = baseline['results'].get(name, {})
+        cells = []
+        for label, result in results.items():
+            before = base_results.get(label, {}).get('seconds')
+            if not before:
+                cells.append(f"{label} -")
+                continue
+            ratio = result['seconds'] / before
+            slower = (result['seconds'] - before) * 1000 > threshold_ms and (ratio - 1) * 100 > threshold_pct
+            cells.append(f"{label} {ratio:.2f}x{'🔺' if slower else ''}")
+            if slower:
+                flagged.append({'benchmark': name, 'scale': label, 'before': before,
+                                'after': result['seconds'], 'ratio': round(ratio, 3)})
+        print(f"  {name[:28]:28} " + '  '.join(cells))
+    return flagged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the translation scripts on synthetic projects of several sizes")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES,
+                        help="sizes relative to this project (default: 0.1 1 10)")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), metavar='SCRIPT',
+                        help="benchmarks to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per benchmark and scale, the best is kept")
+    parser.add_argument('--memory', action='store_true', help="also trace the peak Python allocation (slower)")
+    parser.add_argument('--seed', type=int, default=1, help="synthetic project seed")
+    parser.add_argument('--baseline', help="commit-ish to compare against (must be in the history)")
+    parser.add_argument('--threshold-ms', type=float, default=5.0,
+                        help="flag benchmarks more than this many milliseconds slower than the baseline")
+    parser.add_argument('--threshold-pct', type=float, default=25.0,
+                        help="... and more than this percentage slower")
+    parser.add_argument('--no-record', action='store_true', help="do not append to the history")
+    parser.add_argument('--strict', action='store_true', help="exit 1 when a benchmark is flagged")
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+    print(f"🚀 Benchmarking {len(names)} scripts at {', '.join(f'{s:g}x' for s in args.scales)}...")
+    record = run_benchmarks(sorted(set(args.scales)), names, max(1, args.repeat), args.memory, args.seed)
+    print_table(record)
+
+    if not args.no_record:
+        append_history(record)
+        dirty = ' (uncommitted changes)' if record['dirty'] else ''
+        print(f"\n💾 Recorded {record['commit'][:10]}{dirty} in {HISTORY_FILE}")
+
+    if args.baseline:
+        baseline = find_baseline(args.baseline)
+        if baseline is None:
+            print(f"\n✗ No recorded run for baseline {args.baseline}. "
+                  f"Check it out and run this script first.")
+            sys.exit(2)
+        flagged = compare(record, baseline, args.threshold_ms, args.threshold_pct)
+        if flagged:
+            print(f"\n⚠️  {len(flagged)} benchmark/scale pairs slowed past the threshold "
+                  f"(> {args.threshold_ms:g} ms and > {args.threshold_pct}%)")
+            if args.strict:
+                sys.exit(1)
+        else:
+            print("\n✓ Nothing slowed past the threshold")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Build runtime locale bundles with the English fallback already merged
+Source catalogs in messages/ stay sparse; every bundle written to
+.i18n-build/bundles/{locale}/{namespace}.json has the full en shape, and a
+sidecar _provenance.json records which keys were filled from English.
+Only namespaces whose inputs changed since the last build are rebuilt.
+
+Bundles are emitted as minified JSON with precompressed .gz and .br
+variants, and compressed sizes are checked against i18n-budgets.json.
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional, only .gz variants are written without it
+    brotli = None
+
+from i18n_catalog import (
+    AUTO_TRANSLATED_MARKER,
+    BUILD_DIR,
+    LOCALES,
+    MESSAGES_DIR,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    fingerprint,
+    load_catalogs,
+    write_if_changed,
+)
+from i18n_profile import timed
+
+BUNDLES_DIR = BUILD_DIR / "bundles"
+MANIFEST_FILE = BUNDLES_DIR / "manifest.json"
+PROVENANCE_FILE = "_provenance.json"
+BUDGETS_FILE = PROJECT_ROOT / "i18n-budgets.json"
+
+
+def minify(data: Any) -> bytes:
+    """Serialize a bundle as compact JSON"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def compress_bundle(path: str) -> Tuple[str, Dict[str, int]]:
+    """Write .gz (and .br when brotli is installed) next to a minified bundle"""
+    raw = Path(path).read_bytes()
+    sizes = {'raw': len(raw)}
+    # mtime=0 keeps the .gz output byte-identical across builds
+    gz = gzip.compress(raw, compresslevel=9, mtime=0)
+    write_if_changed(Path(path + '.gz'), gz)
+    sizes['gzip'] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(raw, quality=11)
+        write_if_changed(Path(path + '.br'), br)
+        sizes['br'] = len(br)
+    return path, sizes
+
+
+@timed('write')
+def compress_bundles(paths: List[Path], workers: int = None) -> Dict[str, Dict[str, int]]:
+    """Compress bundles in parallel, one shard per file"""
+    if not paths:
+        return {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(compress_bundle, [str(p) for p in paths], chunksize=8))
+
+
+def load_budgets(budgets_file: Path = BUDGETS_FILE) -> Dict:
+    """Load per-namespace compressed size budgets"""
+    if not Path(budgets_file).exists():
+        return {}
+    with open(budgets_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def is_missing(value: Any) -> bool:
+    """A target value that should fall back to English"""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip() == '' or value.endswith(AUTO_TRANSLATED_MARKER)
+    return False
+
+
+def merge_namespace(source: Dict, target: Any, prefix: str = '') -> Tuple[Dict, Dict[str, str]]:
+    """
+    Merge a target namespace over its English source in a single walk.
+    Returns (merged tree with the en shape, {key: 'en'} for every fallback leaf).
+    Keys only present in the target are dropped.
+    """
+    merged = {}
+    fallbacks = {}
+    target = target if isinstance(target, dict) else {}
+
+    for key, en_value in source.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        value = target.get(key)
+
+        if isinstance(en_value, dict):
+            merged[key], nested = merge_namespace(en_value, value, full_key)
+            fallbacks.update(nested)
+        elif isinstance(value, dict) or is_missing(value):
+            merged[key] = en_value
+            fallbacks[full_key] = SOURCE_LOCALE
+        else:
+            merged[key] = value
+
+    return merged, fallbacks
+
+
+def merge_entry(en_value: Any, target_value: Any, namespace: str) -> Tuple[Any, Dict[str, str]]:
+    """
+    Merge one top-level entry of a target catalog: a namespace tree, or a
+    top-level leaf, which falls back to English exactly like a nested one
+    """
+    if isinstance(en_value, dict):
+        return merge_namespace(en_value, target_value, namespace)
+    merged, fallbacks = merge_namespace({namespace: en_value}, {namespace: target_value})
+    return merged[namespace], fallbacks
+
+
+class BundleBuilder:
+    def __init__(self, messages_dir: Path = MESSAGES_DIR, output_dir: Path = BUNDLES_DIR):
+        self.messages_dir = Path(messages_dir)
+        self.output_dir = Path(output_dir)
+        self.manifest_file = self.output_dir / MANIFEST_FILE.name
+        self.catalogs = load_catalogs(self.messages_dir)
+        self.manifest = self.load_manifest()
+        self.stats = {'built': 0, 'skipped': 0, 'fallbacks': 0}
+        self.changed: List[Path] = []
+        self.sizes: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    def load_manifest(self) -> Dict[str, Dict[str, str]]:
+        """Load namespace fingerprints from the previous build"""
+        if self.manifest_file.exists():
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def bundle_path(self, lang: str, namespace: str) -> Path:
+        return self.output_dir / lang / f"{namespace}.json"
+
+    def serialize(self, data: Dict) -> bytes:
+        """Serialize build metadata (manifest, provenance) readably"""
+        return (json.dumps(data, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+
+    @timed('write')
+    def build_locale(self, lang: str, force: bool = False):
+        """Build every namespace bundle of one locale"""
+        source = self.catalogs[SOURCE_LOCALE]
+        target = self.catalogs[lang]
+        previous = self.manifest.get(lang, {})
+        fingerprints = {}
+
+        provenance_path = self.output_dir / lang / PROVENANCE_FILE
+        provenance = {}
+        if provenance_path.exists():
+            with open(provenance_path, 'r', encoding='utf-8') as f:
+                provenance = json.load(f)
+
+        for namespace, en_tree in source.items():
+            target_tree = target.get(namespace)
+            if lang == SOURCE_LOCALE:
+                ns_fingerprint = fingerprint(en_tree)
+            else:
+                ns_fingerprint = fingerprint([en_tree, target_tree])
+            fingerprints[namespace] = ns_fingerprint
+
+            if (not force and previous.get(namespace) == ns_fingerprint
+                    and self.bundle_path(lang, namespace).exists()):
+                self.stats['skipped'] += 1
+                continue
+
+            if lang == SOURCE_LOCALE:
+                merged, fallbacks = en_tree, {}
+            else:
+                merged, fallbacks = merge_entry(en_tree, target_tree, namespace)
+
+            bundle_path = self.bundle_path(lang, namespace)
+            write_if_changed(bundle_path, minify(merged))
+            self.changed.append(bundle_path)
+            provenance[namespace] = fallbacks
+            self.stats['built'] += 1
+
+        # Drop bundles of namespaces that no longer exist in en.json
+        for namespace in set(previous) - set(fingerprints):
+            for suffix in ('', '.gz', '.br'):
+                Path(str(self.bundle_path(lang, namespace)) + suffix).unlink(missing_ok=True)
+            provenance.pop(namespace, None)
+
+        self.stats['fallbacks'] += sum(len(keys) for keys in provenance.values())
+        write_if_changed(provenance_path, self.serialize(provenance))
+        self.manifest[lang] = fingerprints
+
+    def collect_sizes(self, compressed: Dict[str, Dict[str, int]]):
+        """Record raw and compressed sizes of every bundle, fresh or reused"""
+        for lang, namespaces in self.manifest.items():
+            for namespace in namespaces:
+                path = self.bundle_path(lang, namespace)
+                sizes = compressed.get(str(path))
+                if sizes is None:
+                    sizes = {'raw': path.stat().st_size}
+                    for encoding, suffix in (('gzip', '.gz'), ('br', '.br')):
+                        variant = Path(str(path) + suffix)
+                        if variant.exists():
+                            sizes[encoding] = variant.stat().st_size
+                self.sizes[(lang, namespace)] = sizes
+
+    def check_budgets(self, budgets: Dict) -> List[Dict]:
+        """Return bundles over budget, largest overage first"""
+        encoding = budgets.get('encoding', 'gzip')
+        if encoding == 'br' and brotli is None:
+            print("⚠ brotli is not installed, checking budgets against gzip sizes")
+            encoding = 'gzip'
+        default = budgets.get('default')
+        limits = budgets.get('namespaces', {})
+
+        offenders = []
+        for (lang, namespace), sizes in self.sizes.items():
+            limit = limits.get(namespace, default)
+            if limit is None or encoding not in sizes:
+                continue
+            if sizes[encoding] > limit:
+                offenders.append({
+                    'locale': lang,
+                    'namespace': namespace,
+                    'encoding': encoding,
+                    'size': sizes[encoding],
+                    'budget': limit,
+                    'over': sizes[encoding] - limit,
+                })
+        offenders.sort(key=lambda o: (o['over'], o['size']), reverse=True)
+        return offenders
+
+    def build(self, force: bool = False, budgets: Dict = None, workers: int = None) -> bool:
+        """Build bundles for every locale, compress them and check budgets"""
+        for lang in LOCALES:
+            self.build_locale(lang, force=force)
+            print(f"✓ {lang}: {len(self.manifest[lang])} namespaces")
+
+        if brotli is None:
+            print("⚠ brotli is not installed, skipping .br variants")
+        self.collect_sizes(compress_bundles(self.changed, workers))
+        write_if_changed(self.manifest_file, self.serialize(self.manifest))
+
+        print(f"\n📦 Rebuilt {self.stats['built']} namespace bundles, "
+              f"{self.stats['skipped']} unchanged")
+        print(f"↩️  {self.stats['fallbacks']} keys served from English fallback")
+        for lang in LOCALES:
+            totals = defaultdict(int)
+            for (bundle_lang, _), sizes in self.sizes.items():
+                if bundle_lang == lang:
+                    for encoding, size in sizes.items():
+                        totals[encoding] += size
+            summary = ', '.join(f"{encoding} {size / 1024:.1f} KB" for encoding, size in totals.items())
+            print(f"   {lang.upper()}: {summary}")
+        print(f"💾 Bundles written to: {self.output_dir}")
+
+        offenders = self.check_budgets(budgets or {})
+        if offenders:
+            print(f"\n❌ {len(offenders)} bundles exceed their size budget:")
+            for i, o in enumerate(offenders, 1):
+                print(f"  {i:2}. {o['locale']}/{o['namespace']:30} "
+                      f"{o['size']:>8,} B {o['encoding']} "
+                      f"(budget {o['budget']:,} B, +{o['over']:,} B)")
+            return False
+        if budgets:
+            print("✓ All bundles within budget")
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build fallback-merged runtime locale bundles")
+    parser.add_argument('--force', action='store_true', help="rebuild every namespace")
+    parser.add_argument('--out', type=Path, default=BUNDLES_DIR, help="output directory")
+    parser.add_argument('--budgets', type=Path, default=BUDGETS_FILE, help="size budget file")
+    parser.add_argument('--workers', type=int, default=None, help="compression processes")
+    args = parser.parse_args()
+
+    print("🚀 Building locale bundles...")
+    builder = BundleBuilder(output_dir=args.out)
+    if not builder.build(force=args.force, budgets=load_budgets(args.budgets), workers=args.workers):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
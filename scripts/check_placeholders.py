@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Placeholder and rich-text tag parity between locales
+Compares the interpolation signature ({name}, {count, plural, ...}, <link>)
+of every English value with its fr/nl translation. A dropped or renamed
+placeholder crashes rendering at runtime, so every mismatch is reported
+with its exact key path. Signatures come from i18n_icu.message_signature,
+which parses each distinct value once.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+from i18n_catalog import (
+    LOCALES,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    align_catalogs,
+    load_catalogs,
+)
+from i18n_icu import message_signature
+from i18n_profile import span, timed
+
+
+def iter_mismatches(catalogs: Dict[str, Dict]) -> Iterator[Tuple[str, Dict]]:
+    """(locale, mismatch) of every translation that does not carry the English placeholders, in key order"""
+    targets = [lang for lang in catalogs if lang != SOURCE_LOCALE]
+    source = catalogs[SOURCE_LOCALE]
+    keys, (sources, *columns) = align_catalogs(source, [source] + [catalogs[lang] for lang in targets])
+
+    for row, (key, en_value) in enumerate(zip(keys, sources)):
+        if not isinstance(en_value, str):
+            continue
+        expected = message_signature(en_value)
+        for lang, column in zip(targets, columns):
+            value = column[row]
+            if not isinstance(value, str) or value == en_value:
+                continue
+            actual = message_signature(value)
+            if actual == expected:
+                continue
+            if expected is None or actual is None:
+                issue = {'invalid': SOURCE_LOCALE if expected is None else lang}
+            else:
+                issue = {'missing': sorted(set(expected) - set(actual)),
+                         'unexpected': sorted(set(actual) - set(expected))}
+            yield lang, {'key': key, 'source': en_value, 'value': value, **issue}
+
+
+@timed('compare')
+def find_mismatches(catalogs: Dict[str, Dict]) -> Dict[str, List[Dict]]:
+    """Per target locale: keys whose translation does not carry the English placeholders"""
+    mismatches: Dict[str, List[Dict]] = {lang: [] for lang in catalogs if lang != SOURCE_LOCALE}
+    for lang, mismatch in iter_mismatches(catalogs):
+        mismatches[lang].append(mismatch)
+    return mismatches
+
+
+def describe(mismatch: Dict) -> str:
+    """One-line summary of a mismatch"""
+    if 'invalid' in mismatch:
+        return f"invalid ICU in {mismatch['invalid']}.json"
+    parts = []
+    if mismatch['missing']:
+        parts.append(f"missing {', '.join(mismatch['missing'])}")
+    if mismatch['unexpected']:
+        parts.append(f"unexpected {', '.join(mismatch['unexpected'])}")
+    return '; '.join(parts)
+
+
+def print_mismatches(mismatches: Dict[str, List[Dict]], top: int):
+    for lang, found in mismatches.items():
+        print(f"\n{lang.upper()} - {len(found)} placeholder mismatches:")
+        if not found:
+            print("  ✓ All placeholders and tags match English!")
+            continue
+        for i, mismatch in enumerate(found[:top], 1):
+            print(f"  {i}. {mismatch['key']}: {describe(mismatch)}")
+        if len(found) > top:
+            print(f"  ... and {len(found) - top} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check placeholder and tag parity between locales")
+    parser.add_argument('--top', type=int, default=20, help="mismatches to print per locale")
+    args = parser.parse_args()
+
+    mismatches = find_mismatches(load_catalogs(locales=LOCALES))
+    print_mismatches(mismatches, args.top)
+
+    report_path = PROJECT_ROOT / "placeholder-parity-report.json"
+    with span('write', report_path.name), open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(mismatches, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Detailed report saved to: {report_path}")
+
+    if any(mismatches.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
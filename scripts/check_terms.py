@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Glossary term-consistency checker
+Loads the bilingual "terms" section of i18n-glossary.json and scans every
+English source and its fr/nl translation in one pass, with one Aho-Corasick
+automaton per language. A pair is flagged when a glossary term appears in
+the source but none of its required renderings appears in the target.
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+from i18n_catalog import (
+    AUTO_TRANSLATED_MARKER,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    TRANSLATE_MARKER,
+    align_catalogs,
+    load_catalogs,
+)
+from i18n_glossary import get_glossary
+from i18n_profile import span, timed
+
+
+class TermAutomaton:
+    """
+    Aho-Corasick automaton over lowercase patterns. Matches must start at a
+    word boundary (unless compounds are allowed); with whole_words they must
+    also end at one (an English plural 's' is allowed), otherwise a pattern
+    matches any word it begins (so 'défi' matches 'défis', 'recherch'
+    matches 'rechercher').
+    """
+
+    def __init__(self, patterns: Dict[str, Set[str]], whole_words: bool = False, compounds: bool = False):
+        self.whole_words = whole_words
+        self.compounds = compounds
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # Per state: (pattern length, labels) of every pattern ending there
+        self.output: List[List[Tuple[int, Set[str]]]] = [[]]
+
+        for pattern, labels in patterns.items():
+            state = 0
+            for ch in pattern.lower():
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = nxt
+            self.output[state].append((len(pattern), set(labels)))
+
+        # Breadth-first failure links; outputs of the fallback state are inherited
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def labels(self, text: str) -> Set[str]:
+        """Labels of every pattern found in a text, in a single scan"""
+        text = text.lower()
+        found: Set[str] = set()
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, labels in output[state]:
+                start = end - length
+                if not self.compounds and start > 0 and text[start - 1].isalnum():
+                    continue
+                if self.whole_words and not self.ends_word(text, end):
+                    continue
+                found |= labels
+        return found
+
+    @staticmethod
+    def ends_word(text: str, end: int) -> bool:
+        if end == len(text) or not text[end].isalnum():
+            return True
+        return text[end] == 's' and (end + 1 == len(text) or not text[end + 1].isalnum())
+
+
+class TermChecker:
+    def __init__(self, locales: List[str] = TARGET_LOCALES):
+        glossary = get_glossary()
+        self.renderings = {lang: glossary.renderings(lang) for lang in locales}
+        terms = set().union(*(r.keys() for r in self.renderings.values())) if self.renderings else set()
+        self.source_automaton = TermAutomaton({term: {term} for term in terms}, whole_words=True)
+
+        # Several terms may share a rendering ('modèle' for model and template)
+        self.target_automata = {}
+        for lang, renderings in self.renderings.items():
+            patterns: Dict[str, Set[str]] = {}
+            for term, accepted in renderings.items():
+                for rendering in accepted:
+                    patterns.setdefault(rendering.lower(), set()).add(term)
+            self.target_automata[lang] = TermAutomaton(patterns, compounds=glossary.compound_terms(lang))
+
+        self.cache: Dict[Tuple[str, str], Set[str]] = {}
+
+    def scan(self, lang: str, text: str) -> Set[str]:
+        """Glossary terms found in a text (lang is the text's language), cached per value"""
+        cache_key = (lang, text)
+        found = self.cache.get(cache_key)
+        if found is None:
+            automaton = self.source_automaton if lang == SOURCE_LOCALE else self.target_automata[lang]
+            found = self.cache[cache_key] = automaton.labels(text)
+        return found
+
+    @timed('compare')
+    def check(self, catalogs: Dict[str, Dict]) -> Dict[str, Dict[str, Dict]]:
+        """Per locale and term: pairs checked and pairs missing the rendering"""
+        locales = list(self.renderings)
+        keys, (sources, *targets) = align_catalogs(
+            catalogs[SOURCE_LOCALE], [catalogs[SOURCE_LOCALE]] + [catalogs.get(lang, {}) for lang in locales])
+        glossary = get_glossary()
+
+        results = {lang: {} for lang in locales}
+        for row, (key, source) in enumerate(zip(keys, sources)):
+            if not isinstance(source, str):
+                continue
+            terms = self.scan(SOURCE_LOCALE, source)
+            if not terms:
+                continue
+            for lang, column in zip(locales, targets):
+                target = column[row]
+                # Untranslated or marked values are the audit's job, not a term inconsistency
+                if (not isinstance(target, str) or target == source or AUTO_TRANSLATED_MARKER in target
+                        or TRANSLATE_MARKER in target or glossary.is_exempt(target, lang)):
+                    continue
+                present = self.scan(lang, target)
+                for term in terms:
+                    if term not in self.renderings[lang]:
+                        continue
+                    entry = results[lang].setdefault(term, {'checked': 0, 'missing': []})
+                    entry['checked'] += 1
+                    if term not in present:
+                        entry['missing'].append({'key': key, 'source': source, 'target': target})
+        return results
+
+
+def print_results(results: Dict[str, Dict[str, Dict]], renderings: Dict[str, Dict[str, List[str]]], top: int):
+    for lang, terms in results.items():
+        missing_total = sum(len(t['missing']) for t in terms.values())
+        checked_total = sum(t['checked'] for t in terms.values())
+        print(f"\n{lang.upper()}: {missing_total} of {checked_total} term uses without the glossary rendering")
+        print("-" * 80)
+        ranked = sorted(terms.items(), key=lambda item: len(item[1]['missing']), reverse=True)
+        for term, entry in ranked:
+            if not entry['missing']:
+                continue
+            consistency = 1 - len(entry['missing']) / entry['checked']
+            expected = ' / '.join(renderings[lang][term])
+            print(f"  {term} → {expected}: {len(entry['missing'])} missing "
+                  f"({consistency:.0%} consistent over {entry['checked']})")
+            for miss in entry['missing'][:top]:
+                preview = miss['target'][:60] + '...' if len(miss['target']) > 60 else miss['target']
+                print(f"      {miss['key']}: \"{preview}\"")
+            if len(entry['missing']) > top:
+                print(f"      ... and {len(entry['missing']) - top} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check glossary term consistency in translations")
+    parser.add_argument('--top', type=int, default=3, help="examples to print per term")
+    parser.add_argument('--strict', action='store_true', help="exit 1 when any term is missing")
+    args = parser.parse_args()
+
+    checker = TermChecker()
+    term_count = sum(len(r) for r in checker.renderings.values())
+    print(f"🚀 Checking {term_count} glossary terms across {', '.join(checker.renderings)}...")
+    results = checker.check(load_catalogs())
+    print_results(results, checker.renderings, args.top)
+
+    report_path = PROJECT_ROOT / "term-consistency-report.json"
+    with span('write', report_path.name), open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Detailed report saved to: {report_path}")
+
+    if args.strict and any(entry['missing'] for terms in results.values() for entry in terms.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
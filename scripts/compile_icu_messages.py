@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Precompile ICU messages into a compact AST format
+Parses every leaf message of every locale once, validates it, and writes
+.i18n-build/compiled/{locale}.json with the catalog shape: plain strings are
+passed through untouched, ICU messages become AST element lists (see
+i18n_icu.py for the format). Results are cached per value hash across runs.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from i18n_catalog import (
+    BUILD_DIR,
+    LOCALES,
+    MESSAGES_DIR,
+    load_catalogs,
+    value_hash,
+    write_if_changed,
+)
+from i18n_icu import ICUSyntaxError, compile_message, has_syntax
+from i18n_profile import timed
+
+COMPILED_DIR = BUILD_DIR / "compiled"
+CACHE_FILE = BUILD_DIR / "icu-cache.json"
+# Bump when the parser or the AST format changes to invalidate the cache
+CACHE_VERSION = 1
+
+
+class MessageCompiler:
+    def __init__(self, cache_file: Path = CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self.cache: Dict[str, Dict] = self.load_cache()
+        self.errors: Dict[str, List[Tuple[str, str, str]]] = {}
+        self.stats = {'plain': 0, 'compiled': 0, 'cache_hits': 0, 'parsed': 0}
+
+    def load_cache(self) -> Dict[str, Dict]:
+        """Load compiled results keyed by value hash"""
+        if self.cache_file.exists():
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                return data['entries']
+        return {}
+
+    def save_cache(self):
+        """Persist the value-hash cache"""
+        data = {'version': CACHE_VERSION, 'entries': self.cache}
+        write_if_changed(self.cache_file,
+                         json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def compile_value(self, value: str) -> Dict:
+        """Compile one message through the cache: {'ast': ...} or {'error': ...}"""
+        digest = value_hash(value)
+        entry = self.cache.get(digest)
+        if entry is not None:
+            self.stats['cache_hits'] += 1
+            return entry
+        self.stats['parsed'] += 1
+        try:
+            entry = {'ast': compile_message(value)}
+        except ICUSyntaxError as e:
+            entry = {'error': str(e), 'offset': e.offset}
+        self.cache[digest] = entry
+        return entry
+
+    def compile_tree(self, lang: str, tree: Dict, prefix: str = '') -> Dict:
+        """Compile every leaf of a catalog, keeping the tree shape"""
+        compiled = {}
+        for key, value in tree.items():
+            full_key = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                compiled[key] = self.compile_tree(lang, value, full_key)
+            elif not isinstance(value, str) or not has_syntax(value):
+                # Plain strings never touch the parser or the cache
+                compiled[key] = value
+                self.stats['plain'] += 1
+            else:
+                entry = self.compile_value(value)
+                if 'error' in entry:
+                    self.errors.setdefault(lang, []).append((full_key, entry['error'], value))
+                    compiled[key] = value
+                else:
+                    compiled[key] = entry['ast']
+                    if isinstance(entry['ast'], str):
+                        self.stats['plain'] += 1
+                    else:
+                        self.stats['compiled'] += 1
+        return compiled
+
+    @timed('scan')
+    def compile_catalogs(self, catalogs: Dict[str, Dict], output_dir: Path) -> int:
+        """Compile all locales, write outputs and return the number of parse errors"""
+        for lang, catalog in catalogs.items():
+            compiled = self.compile_tree(lang, catalog)
+            content = json.dumps(compiled, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            changed = write_if_changed(Path(output_dir) / f"{lang}.json", content)
+            status = "written" if changed else "unchanged"
+            print(f"✓ {lang}.json: {len(self.errors.get(lang, []))} errors ({status})")
+        self.save_cache()
+        return sum(len(errors) for errors in self.errors.values())
+
+    def print_report(self):
+        """Print compile statistics and parse errors grouped by locale"""
+        print("\n📊 COMPILE STATISTICS")
+        print("-" * 80)
+        print(f"Plain strings passed through: {self.stats['plain']:,}")
+        print(f"ICU messages compiled: {self.stats['compiled']:,}")
+        print(f"Parsed: {self.stats['parsed']:,}, cache hits: {self.stats['cache_hits']:,}")
+
+        if not self.errors:
+            print("\n✓ All messages are valid ICU")
+            return
+
+        print("\n❌ PARSE ERRORS")
+        print("-" * 80)
+        for lang, errors in self.errors.items():
+            print(f"\n{lang.upper()} - {len(errors)} invalid messages:")
+            for key, error, value in errors:
+                preview = value[:80] + '...' if len(value) > 80 else value
+                print(f"  - {key}: {error}")
+                print(f"    \"{preview}\"")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompile ICU messages to a compact AST")
+    parser.add_argument('--messages', type=Path, default=MESSAGES_DIR, help="catalog directory")
+    parser.add_argument('--out', type=Path, default=COMPILED_DIR, help="output directory")
+    args = parser.parse_args()
+
+    print("🚀 Compiling ICU messages...")
+    compiler = MessageCompiler()
+    error_count = compiler.compile_catalogs(load_catalogs(args.messages, LOCALES), args.out)
+    compiler.print_report()
+    print(f"\n💾 Compiled catalogs written to: {args.out}")
+
+    if error_count:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
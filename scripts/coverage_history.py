@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Translation coverage over git history
+Reads the messages/*.json blobs of every commit in a range through one
+persistent `git cat-file --batch` process (no checkouts) and computes the
+coverage, missing and untranslated counts per locale and namespace. Commits
+whose catalog blobs did not change are skipped, and the statistics of an
+(English blob, locale blob) pair are cached across runs in
+.i18n-build/coverage-history-cache.json.
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from i18n_catalog import (
+    BUILD_DIR,
+    LOCALES,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    GitObjectReader,
+    align_catalogs,
+    catalog_log,
+    fingerprint,
+    namespace_of,
+    write_if_changed,
+)
+from i18n_glossary import get_glossary
+from i18n_profile import span, timed
+
+CACHE_FILE = BUILD_DIR / "coverage-history-cache.json"
+# Bump when the statistics change meaning to invalidate the cache
+CACHE_VERSION = 1
+REPORT_FILE = PROJECT_ROOT / "coverage-history.json"
+# Parsed catalogs kept in memory; consecutive commits mostly share blobs
+PARSED_BLOBS = 16
+
+
+@timed('compare')
+def namespace_counts(source: Dict, target: Dict, lang: str) -> Dict[str, Dict[str, int]]:
+    """
+    Key, missing and untranslated (identical to English and not in the
+    glossary) counts per namespace of one locale
+    """
+    keys, (sources, values) = align_catalogs(source, [source, target])
+    identical = [en_value for en_value, value in zip(sources, values)
+                 if isinstance(en_value, str) and en_value and value == en_value]
+    categories = get_glossary().match_batch(list(set(identical)), lang)
+
+    namespaces: Dict[str, Dict[str, int]] = {}
+    for key, en_value, value in zip(keys, sources, values):
+        counts = namespaces.setdefault(namespace_of(key), {'keys': 0, 'missing': 0, 'untranslated': 0})
+        counts['keys'] += 1
+        if value is None:
+            counts['missing'] += 1
+        elif value == en_value and isinstance(en_value, str) and en_value and categories[en_value] is None:
+            counts['untranslated'] += 1
+    return namespaces
+
+
+def coverage_stats(source: Dict, target: Dict, lang: str, previous: Optional[Tuple] = None) -> Dict:
+    """
+    Counts of one locale, overall and per namespace; coverage is the share of
+    English keys with a real translation. With the (source, target, stats) of
+    the previous commit, namespaces whose subtrees are unchanged on both sides
+    keep their counts, so a commit costs a walk of the namespaces it touched.
+    """
+    namespaces: Dict[str, Dict[str, int]] = {}
+    leaves = {}
+    for name, subtree in source.items():
+        if not isinstance(subtree, dict):
+            leaves[name] = subtree
+            continue
+        if (previous is not None and name in previous[2]['namespaces']
+                and previous[0].get(name) == subtree and previous[1].get(name) == target.get(name)):
+            namespaces[name] = previous[2]['namespaces'][name]
+        else:
+            namespaces.update(namespace_counts({name: subtree}, {name: target.get(name)}, lang))
+    if leaves:
+        namespaces.update(namespace_counts(leaves, target, lang))
+
+    totals = {name: sum(counts[name] for counts in namespaces.values())
+              for name in ('keys', 'missing', 'untranslated')}
+    return {**totals, 'coverage': coverage_of(totals), 'namespaces': namespaces}
+
+
+def coverage_of(counts: Dict[str, int]) -> float:
+    if not counts['keys']:
+        return 0.0
+    return round((counts['keys'] - counts['missing'] - counts['untranslated']) / counts['keys'] * 100, 2)
+
+
+class CoverageHistory:
+    def __init__(self, locales: List[str] = TARGET_LOCALES):
+        self.locales = locales
+        self.fingerprint = fingerprint({'glossary': get_glossary().data})
+        self.cache: Dict[str, Dict] = self.load_cache()
+        self.parsed: Dict[str, Dict] = {}
+        self.previous: Dict[str, Tuple] = {}
+        self.counters = {'commits': 0, 'skipped': 0, 'computed': 0, 'cached': 0, 'blobs_read': 0}
+
+    def load_cache(self) -> Dict[str, Dict]:
+        """Statistics keyed by '<locale>:<English blob>:<locale blob>'"""
+        if CACHE_FILE.exists():
+            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION and data.get('fingerprint') == self.fingerprint:
+                return data['entries']
+        return {}
+
+    def save_cache(self):
+        data = {'version': CACHE_VERSION, 'fingerprint': self.fingerprint, 'entries': self.cache}
+        write_if_changed(CACHE_FILE, json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def catalog(self, reader: GitObjectReader, blob: Optional[str]) -> Dict:
+        if blob is None:
+            return {}
+        catalog = self.parsed.pop(blob, None)
+        if catalog is None:
+            if len(self.parsed) >= PARSED_BLOBS:
+                self.parsed.pop(next(iter(self.parsed)))
+            catalog = reader.read_json(blob)
+            self.counters['blobs_read'] += 1
+        # Most recently used last
+        self.parsed[blob] = catalog
+        return catalog
+
+    def stats(self, reader: GitObjectReader, lang: str, source_blob: Optional[str],
+              blob: Optional[str]) -> Dict:
+        cache_key = f"{lang}:{source_blob}:{blob}"
+        if cache_key in self.cache:
+            self.counters['cached'] += 1
+            return self.cache[cache_key]
+        source, target = self.catalog(reader, source_blob), self.catalog(reader, blob)
+        stats = self.cache[cache_key] = coverage_stats(source, target, lang, self.previous.get(lang))
+        self.previous[lang] = (source, target, stats)
+        self.counters['computed'] += 1
+        return stats
+
+    def series(self, rev_range: Optional[str] = None) -> List[Dict]:
+        """One point per commit in the range whose catalog blobs changed, oldest first"""
+        points = []
+        previous = None
+        with GitObjectReader() as reader:
+            for commit, timestamp, blobs in catalog_log(rev_range, locales=LOCALES):
+                self.counters['commits'] += 1
+                current = tuple(blobs.get(lang) for lang in [SOURCE_LOCALE] + self.locales)
+                if current == previous:
+                    self.counters['skipped'] += 1
+                    continue
+                previous = current
+                points.append({
+                    'commit': commit,
+                    'timestamp': timestamp,
+                    'locales': {lang: self.stats(reader, lang, blobs.get(SOURCE_LOCALE), blobs.get(lang))
+                                for lang in self.locales},
+                })
+        return points
+
+
+def namespace_point(point: Dict, lang: str, namespace: str) -> Optional[Dict]:
+    counts = point['locales'][lang]['namespaces'].get(namespace)
+    if counts is None:
+        return None
+    return {**counts, 'coverage': coverage_of(counts)}
+
+
+def print_series(points: List[Dict], locales: List[str], namespace: Optional[str] = None):
+    title = f"COVERAGE HISTORY - {namespace}" if namespace else "COVERAGE HISTORY"
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80)
+    header = f"{'DATE':10} {'COMMIT':8}"
+    for lang in locales:
+        header += f" {lang.upper() + ' %':>8} {'MISS':>6} {'UNTR':>6}"
+    print(header)
+    print("-" * 80)
+    for point in points:
+        line = f"{datetime.fromtimestamp(point['timestamp']).strftime('%Y-%m-%d'):10} {point['commit'][:8]:8}"
+        for lang in locales:
+            counts = (namespace_point(point, lang, namespace) if namespace
+                      else point['locales'][lang])
+            if counts is None:
+                line += f" {'-':>8} {'-':>6} {'-':>6}"
+            else:
+                line += f" {counts['coverage']:>7.1f}% {counts['missing']:>6,} {counts['untranslated']:>6,}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translation coverage per commit, read from git history")
+    parser.add_argument('range', nargs='?', help="revision range, e.g. HEAD~300..HEAD (default: all history)")
+    parser.add_argument('--namespace', help="show the series of one namespace")
+    parser.add_argument('--locale', choices=TARGET_LOCALES, action='append', help="limit to a locale")
+    args = parser.parse_args()
+
+    locales = args.locale or TARGET_LOCALES
+    history = CoverageHistory(locales)
+    start = time.perf_counter()
+    try:
+        points = history.series(args.range)
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    history.save_cache()
+
+    print_series(points, locales, args.namespace)
+    counters = history.counters
+    print(f"\n⏱ {counters['commits']} commits in {elapsed * 1000:.0f} ms: {len(points)} points, "
+          f"{counters['skipped']} unchanged, {counters['computed']} computed, {counters['cached']} cached, "
+          f"{counters['blobs_read']} blobs read")
+
+    with span('write', REPORT_FILE.name), open(REPORT_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'range': args.range, 'locales': locales, 'points': points}, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Coverage history saved to: {REPORT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Detect catalog values written in the wrong language
+Scores every leaf of every locale with the trigram identifier in
+i18n_langid.py and reports values whose detected language does not match
+their catalog, e.g. English left in fr.json or French pasted into en.json.
+Unlike the audit, this does not depend on exact equality with en.json.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from i18n_catalog import LOCALES, MESSAGES_DIR, PROJECT_ROOT, flatten, load_catalogs
+from i18n_glossary import get_glossary
+from i18n_langid import PROFILES_FILE, LanguageIdentifier, load_identifier
+from i18n_profile import span, timed
+
+# Short values (buttons, labels) share too many trigrams across languages
+MIN_LETTERS = 20
+
+
+@timed('compare')
+def find_mismatches(identifier: LanguageIdentifier, lang: str, flat: Dict[str, str],
+                    min_confidence: float, min_letters: int) -> List[Dict]:
+    """Values of one catalog confidently detected as another language"""
+    glossary = get_glossary()
+    results = identifier.identify_batch(v for v in flat.values() if isinstance(v, str))
+    mismatches = []
+    for key, value in flat.items():
+        result = results.get(value) if isinstance(value, str) else None
+        if result is None:
+            continue
+        detected, confidence, letters = result
+        if detected == lang or confidence < min_confidence or letters < min_letters:
+            continue
+        if glossary.is_exempt(value, lang):
+            continue
+        mismatches.append({'key': key, 'value': value, 'detected': detected,
+                           'confidence': round(confidence, 4)})
+    mismatches.sort(key=lambda m: (-m['confidence'], m['key']))
+    return mismatches
+
+
+def print_mismatches(lang: str, mismatches: List[Dict], top: int):
+    by_language: Dict[str, int] = {}
+    for m in mismatches:
+        by_language[m['detected']] = by_language.get(m['detected'], 0) + 1
+    summary = ', '.join(f"{count} {detected}" for detected, count in sorted(by_language.items()))
+    print(f"\n{lang.upper()}: {len(mismatches)} values in another language"
+          + (f" ({summary})" if summary else ""))
+    print("-" * 80)
+    for m in mismatches[:top]:
+        preview = m['value'][:70] + '...' if len(m['value']) > 70 else m['value']
+        print(f"  {m['detected']} {m['confidence']:.3f}  {m['key']}")
+        print(f"        \"{preview}\"")
+    if len(mismatches) > top:
+        print(f"  ... and {len(mismatches) - top} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect catalog values written in the wrong language")
+    parser.add_argument('--messages', type=Path, default=MESSAGES_DIR, help="catalog directory")
+    parser.add_argument('--min-confidence', type=float, default=0.99,
+                        help="minimum posterior of the detected language (default 0.99)")
+    parser.add_argument('--min-letters', type=int, default=MIN_LETTERS,
+                        help=f"ignore values with fewer letters (default {MIN_LETTERS})")
+    parser.add_argument('--top', type=int, default=15, help="findings to print per locale")
+    parser.add_argument('--retrain', action='store_true',
+                        help=f"retrain {PROFILES_FILE.relative_to(PROJECT_ROOT)} even if it is current")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    identifier = load_identifier(args.messages, LOCALES, retrain=args.retrain)
+    print(f"🚀 Language profiles ready for {', '.join(identifier.languages)} "
+          f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    flats = {lang: flatten(catalog) for lang, catalog in load_catalogs(args.messages, LOCALES).items()}
+    start = time.perf_counter()
+    report = {'min_confidence': args.min_confidence, 'min_letters': args.min_letters, 'locales': {}}
+    for lang, flat in flats.items():
+        mismatches = find_mismatches(identifier, lang, flat, args.min_confidence, args.min_letters)
+        report['locales'][lang] = mismatches
+    elapsed = time.perf_counter() - start
+
+    for lang, mismatches in report['locales'].items():
+        print_mismatches(lang, mismatches, args.top)
+
+    leaves = sum(len(flat) for flat in flats.values())
+    print(f"\n📊 Scored {leaves:,} leaves ({len(identifier.cache):,} distinct values) "
+          f"in {elapsed * 1000:.0f} ms")
+
+    report_path = PROJECT_ROOT / "language-mismatch-report.json"
+    with span('write', report_path.name), open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Detailed report saved to: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
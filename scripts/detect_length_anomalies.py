@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Length-ratio anomaly detection
+Computes the target/source length ratio of every translated key for every
+target locale in one aligned pass, fits the expected (log) ratio per locale
+and namespace, and ranks the keys whose ratio is an outlier by robust
+z-score: truncated translations on one side, runaway ones on the other.
+"""
+
+import argparse
+import json
+import math
+import statistics
+import time
+from array import array
+from typing import Dict, List, Tuple
+
+from i18n_catalog import (
+    AUTO_TRANSLATED_MARKER,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    TRANSLATE_MARKER,
+    align_catalogs,
+    load_catalogs,
+    namespace_of,
+)
+from i18n_profile import span, timed
+
+# Ratios of very short sources (buttons, labels) are mostly noise
+MIN_SOURCE_LENGTH = 12
+# Namespaces with fewer samples use the locale-wide fit
+MIN_SAMPLES = 20
+# Scales the median absolute deviation to a standard deviation under normality
+MAD_SCALE = 1.4826
+# Keeps near-constant namespaces from flagging every small deviation
+MIN_SPREAD = 0.05
+Z_THRESHOLD = 3.5
+
+
+def length_columns(sources: List, targets: Dict[str, List]) -> Tuple[array, Dict[str, array]]:
+    """
+    Source lengths and the log length ratio of every locale over aligned
+    columns. Keys without a usable translation (missing, untranslated,
+    marked, or too short a source) hold NaN.
+    """
+    source_lengths = array('d', (len(v) if isinstance(v, str) else 0 for v in sources))
+    ratios = {lang: array('d', bytes(8 * len(sources))) for lang in targets}
+    columns = list(ratios.values())
+
+    for row, (en_value, en_length) in enumerate(zip(sources, source_lengths)):
+        if en_length < MIN_SOURCE_LENGTH:
+            for column in columns:
+                column[row] = math.nan
+            continue
+        for column, target in zip(columns, targets.values()):
+            value = target[row]
+            if (not isinstance(value, str) or not value or value == en_value
+                    or AUTO_TRANSLATED_MARKER in value or TRANSLATE_MARKER in value):
+                column[row] = math.nan
+            else:
+                column[row] = math.log(len(value) / en_length)
+    return source_lengths, ratios
+
+
+def fit(values: List[float]) -> Dict[str, float]:
+    """Robust location and spread of a sample of log ratios"""
+    median = statistics.median(values)
+    mad = statistics.median(abs(v - median) for v in values)
+    return {'median': median, 'spread': max(MAD_SCALE * mad, MIN_SPREAD), 'samples': len(values)}
+
+
+def fit_distributions(keys: List[str], ratios: Dict[str, array]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Per locale: the locale-wide fit ('*') and one fit per namespace with enough samples"""
+    namespaces = list(map(namespace_of, keys))
+    fits = {}
+    for lang, column in ratios.items():
+        groups: Dict[str, List[float]] = {}
+        for namespace, ratio in zip(namespaces, column):
+            if ratio == ratio:
+                groups.setdefault(namespace, []).append(ratio)
+        every = [ratio for ratio in column if ratio == ratio]
+        fits[lang] = {'*': fit(every)} if every else {}
+        for namespace, values in groups.items():
+            if len(values) >= MIN_SAMPLES:
+                fits[lang][namespace] = fit(values)
+    return fits
+
+
+@timed('compare')
+def find_anomalies(catalogs: Dict[str, Dict], locales: List[str] = TARGET_LOCALES,
+                   threshold: float = Z_THRESHOLD) -> Tuple[List[Dict], Dict]:
+    """Keys whose length ratio is an outlier for their locale and namespace, most extreme first"""
+    source = catalogs[SOURCE_LOCALE]
+    keys, (sources, *columns) = align_catalogs(source, [source] + [catalogs.get(lang, {}) for lang in locales])
+    targets = dict(zip(locales, columns))
+    source_lengths, ratios = length_columns(sources, targets)
+    fits = fit_distributions(keys, ratios)
+
+    suspects = []
+    for lang, column in ratios.items():
+        locale_fits = fits[lang]
+        for row, ratio in enumerate(column):
+            if ratio != ratio:
+                continue
+            key = keys[row]
+            distribution = locale_fits.get(namespace_of(key)) or locale_fits['*']
+            z = (ratio - distribution['median']) / distribution['spread']
+            if abs(z) < threshold:
+                continue
+            suspects.append({
+                'key': key,
+                'locale': lang,
+                'kind': 'truncated' if z < 0 else 'runaway',
+                'z': round(z, 2),
+                'ratio': round(math.exp(ratio), 2),
+                'expected_ratio': round(math.exp(distribution['median']), 2),
+                'source_length': int(source_lengths[row]),
+                'source': sources[row],
+                'value': targets[lang][row],
+            })
+    suspects.sort(key=lambda s: (-abs(s['z']), s['key'], s['locale']))
+    return suspects, fits
+
+
+def print_fits(fits: Dict[str, Dict[str, Dict[str, float]]]):
+    for lang, locale_fits in fits.items():
+        overall = locale_fits.get('*')
+        if overall is None:
+            continue
+        print(f"\n{lang.upper()}: expected length ratio {math.exp(overall['median']):.2f} "
+              f"over {overall['samples']:,} keys, {len(locale_fits) - 1} namespace fits")
+        ranked = sorted(((ns, f) for ns, f in locale_fits.items() if ns != '*'),
+                        key=lambda item: item[1]['median'])
+        for namespace, namespace_fit in ranked[:3] + ranked[-3:] if len(ranked) > 6 else ranked:
+            print(f"  {namespace:30} x{math.exp(namespace_fit['median']):.2f} "
+                  f"(spread {namespace_fit['spread']:.2f}, {namespace_fit['samples']} keys)")
+
+
+def print_suspects(suspects: List[Dict], top: int):
+    print("\n" + "=" * 80)
+    print(f"🔍 {len(suspects)} LENGTH ANOMALIES")
+    print("=" * 80)
+    for i, suspect in enumerate(suspects[:top], 1):
+        icon = "✂️" if suspect['kind'] == 'truncated' else "📏"
+        print(f"\n{i}. {icon} [{suspect['locale'].upper()}] {suspect['key']}  "
+              f"z={suspect['z']:+.1f}  x{suspect['ratio']:.2f} (expected x{suspect['expected_ratio']:.2f})")
+        for label, text in (('EN', suspect['source']), (suspect['locale'].upper(), suspect['value'])):
+            preview = text[:70] + '...' if len(text) > 70 else text
+            print(f"   {label}: \"{preview}\"")
+    if len(suspects) > top:
+        print(f"\n... and {len(suspects) - top} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag translations whose length is an outlier")
+    parser.add_argument('--threshold', type=float, default=Z_THRESHOLD,
+                        help=f"minimum absolute robust z-score (default {Z_THRESHOLD})")
+    parser.add_argument('--top', type=int, default=25, help="suspects to print")
+    args = parser.parse_args()
+
+    catalogs = load_catalogs()
+    start = time.perf_counter()
+    suspects, fits = find_anomalies(catalogs, threshold=args.threshold)
+    elapsed = time.perf_counter() - start
+
+    print_fits(fits)
+    print_suspects(suspects, args.top)
+    truncated = sum(1 for s in suspects if s['kind'] == 'truncated')
+    print(f"\n📊 {truncated} truncated, {len(suspects) - truncated} runaway "
+          f"({elapsed * 1000:.0f} ms for {', '.join(fits)})")
+
+    report_path = PROJECT_ROOT / "length-anomaly-report.json"
+    with span('write', report_path.name), open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({'threshold': args.threshold, 'fits': fits, 'suspects': suspects},
+                  f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Detailed report saved to: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
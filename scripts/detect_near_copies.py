@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate untranslated detection with MinHash/LSH
+Finds fr/nl values that are near-copies of English, e.g. an English sentence
+with one word swapped or a value with a trailing [AUTO-TRANSLATED] marker.
+Each target value is compared with its own key's English source by exact
+Jaccard similarity of character shingles; glossary values that stay English by
+design are skipped. With --cross-key, values without a near-copy of their own
+source are also matched against every other English value: those get a MinHash
+signature (one-permutation hashing, so each shingle is hashed once), English
+signatures are banded into an LSH index, and each target value only compares
+against its bucket mates.
+"""
+
+import argparse
+import json
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from i18n_catalog import (
+    AUTO_TRANSLATED_MARKER,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    TRANSLATE_MARKER,
+    flatten,
+    load_catalogs,
+)
+from i18n_glossary import get_glossary
+from i18n_profile import span, timed
+
+MARKER_PATTERN = re.compile(
+    rf"\s*(?:{re.escape(AUTO_TRANSLATED_MARKER)}|{re.escape(TRANSLATE_MARKER)})\s*"
+)
+WHITESPACE = re.compile(r'\s+')
+
+SHINGLE_SIZE = 4
+NUM_PERM = 64
+BANDS = 16
+# Shorter values have too few shingles for a meaningful estimate
+MIN_LENGTH = 12
+MAX_HASH = (1 << 64) - 1
+
+
+def normalize(value: str) -> Tuple[str, bool]:
+    """Lowercased, whitespace-collapsed text without review markers"""
+    stripped, count = MARKER_PATTERN.subn(' ', value)
+    return WHITESPACE.sub(' ', stripped).strip().lower(), count > 0
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed character shingles of a normalized value"""
+    if len(text) <= size:
+        grams = {text}
+    else:
+        grams = {text[i:i + size] for i in range(len(text) - size + 1)}
+    # Built-in str hashing is salted per process, which is fine because
+    # signatures are only compared within one run
+    return {hash(g) & MAX_HASH for g in grams}
+
+
+def minhash(hashes: Set[int], num_perm: int = NUM_PERM) -> Tuple[int, ...]:
+    """
+    One-permutation MinHash: each shingle hash lands in one of num_perm bins
+    and keeps the bin minimum. Empty bins borrow from the next filled bin
+    (rotation densification) so every position is comparable.
+    """
+    bins: List[Optional[int]] = [None] * num_perm
+    for h in hashes:
+        index = h % num_perm
+        value = h // num_perm
+        current = bins[index]
+        if current is None or value < current:
+            bins[index] = value
+    if None in bins:
+        filled = [i for i, v in enumerate(bins) if v is not None]
+        if not filled:
+            return tuple([MAX_HASH] * num_perm)
+        for i in range(num_perm):
+            if bins[i] is None:
+                # Distance to the next filled bin keeps borrowed values distinct
+                offset = next((d for d in range(1, num_perm) if bins[(i + d) % num_perm] is not None))
+                bins[i] = bins[(i + offset) % num_perm] + offset * (MAX_HASH // num_perm)
+    return tuple(bins)
+
+
+def estimate(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity from two signatures"""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Exact Jaccard similarity of two shingle sets"""
+    return len(a & b) / len(a | b)
+
+
+class LSHIndex:
+    def __init__(self, bands: int = BANDS, num_perm: int = NUM_PERM):
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+        self.signatures: Dict[str, Tuple[int, ...]] = {}
+
+    def band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: str, signature: Tuple[int, ...]):
+        self.signatures[key] = signature
+        for band_key in self.band_keys(signature):
+            self.buckets[band_key].append(key)
+
+    def candidates(self, signature: Tuple[int, ...]) -> Set[str]:
+        found = set()
+        for band_key in self.band_keys(signature):
+            found.update(self.buckets.get(band_key, ()))
+        return found
+
+
+class NearCopyDetector:
+    def __init__(self, catalogs: Dict[str, Dict], threshold: float, cross_key: bool = False):
+        self.threshold = threshold
+        self.cross_key = cross_key
+        self.flat = {lang: flatten(data) for lang, data in catalogs.items()}
+        self.index = LSHIndex()
+        self.shingle_sets: Dict[str, Set[int]] = {}
+        self.stats = {'indexed': 0, 'queried': 0, 'candidates': 0}
+
+    @timed('compare')
+    def build_index(self):
+        """Shingle every English source value, and sign and band it for --cross-key"""
+        for key, value in self.flat[SOURCE_LOCALE].items():
+            if not isinstance(value, str):
+                continue
+            text, _ = normalize(value)
+            if len(text) < MIN_LENGTH:
+                continue
+            hashes = shingles(text)
+            self.shingle_sets[key] = hashes
+            if self.cross_key:
+                self.index.add(key, minhash(hashes))
+            self.stats['indexed'] += 1
+
+    def closest_other(self, key: str, hashes: Set[int]) -> Tuple[Optional[str], float]:
+        """Most similar English value of another key above the threshold, via the LSH index"""
+        signature = minhash(hashes)
+        best, best_similarity = None, 0.0
+        for candidate in self.index.candidates(signature):
+            if candidate == key:
+                continue
+            self.stats['candidates'] += 1
+            if estimate(signature, self.index.signatures[candidate]) < self.threshold * 0.8:
+                continue
+            # Exact Jaccard on the few surviving candidates
+            similarity = jaccard(hashes, self.shingle_sets[candidate])
+            if similarity >= self.threshold and similarity > best_similarity:
+                best, best_similarity = candidate, similarity
+        return best, best_similarity
+
+    @timed('compare')
+    def scan_locale(self, lang: str) -> List[Dict]:
+        """Target values that are near-copies of their English source (or, with --cross-key, of any)"""
+        source = self.flat[SOURCE_LOCALE]
+        values = {key: value for key, value in self.flat.get(lang, {}).items() if isinstance(value, str)}
+        sources = [source[key] for key in values if isinstance(source.get(key), str)]
+        exempt = get_glossary().match_batch(list(values.values()) + sources, lang)
+        findings = []
+        for key, value in values.items():
+            text, has_marker = normalize(value)
+            # Exact copies without markers are already reported by audit_translations.py
+            if len(text) < MIN_LENGTH or (value == source.get(key) and not has_marker):
+                continue
+            # Brands, terms, URLs, ... may legitimately stay (almost) English
+            if exempt[value] or (isinstance(source.get(key), str) and exempt[source[key]]):
+                continue
+            self.stats['queried'] += 1
+            hashes = shingles(text)
+
+            best_key, similarity = None, 0.0
+            own = self.shingle_sets.get(key)
+            if own is not None:
+                self.stats['candidates'] += 1
+                similarity = jaccard(hashes, own)
+                if similarity >= self.threshold:
+                    best_key = key
+            if best_key is None and self.cross_key:
+                best_key, similarity = self.closest_other(key, hashes)
+            if best_key is not None:
+                findings.append({'key': key, 'value': value, 'source_key': best_key,
+                                 'source': source[best_key], 'similarity': round(similarity, 3),
+                                 'same_key': best_key == key, 'marker': has_marker})
+
+        findings.sort(key=lambda f: (-f['similarity'], f['key']))
+        return findings
+
+
+def print_findings(lang: str, findings: List[Dict], top: int):
+    same_key = [f for f in findings if f['same_key']]
+    print(f"\n{lang.upper()}: {len(findings)} near-copies of English "
+          f"({len(same_key)} of their own source, "
+          f"{sum(1 for f in findings if f['marker'])} with review markers)")
+    print("-" * 80)
+    for f in findings[:top]:
+        where = "" if f['same_key'] else f" ≈ {f['source_key']}"
+        preview = f['value'][:70] + '...' if len(f['value']) > 70 else f['value']
+        print(f"  {f['similarity']:.2f}  {f['key']}{where}")
+        print(f"        \"{preview}\"")
+    if len(findings) > top:
+        print(f"  ... and {len(findings) - top} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect near-copies of English in target catalogs")
+    parser.add_argument('--threshold', type=float, default=0.7,
+                        help="minimum Jaccard similarity of character shingles (default 0.7)")
+    parser.add_argument('--top', type=int, default=15, help="findings to print per locale")
+    parser.add_argument('--cross-key', action='store_true',
+                        help="also report near-copies of other keys' English values (LSH index)")
+    args = parser.parse_args()
+
+    print("🚀 Indexing English values...")
+    detector = NearCopyDetector(load_catalogs(), args.threshold, args.cross_key)
+    detector.build_index()
+
+    report = {'threshold': args.threshold, 'cross_key': args.cross_key, 'locales': {}}
+    for lang in TARGET_LOCALES:
+        findings = detector.scan_locale(lang)
+        print_findings(lang, findings, args.top)
+        report['locales'][lang] = findings
+
+    print(f"\n📊 {detector.stats['indexed']:,} sources indexed, "
+          f"{detector.stats['queried']:,} targets queried, "
+          f"{detector.stats['candidates']:,} candidate pairs compared")
+
+    report_path = PROJECT_ROOT / "near-copies-report.json"
+    with span('write', report_path.name), open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Detailed report saved to: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Queryable findings database
+Audits run with --db record their findings in .i18n-build/findings.sqlite3:
+one row per run (tool, commit, summary), interned keys (with their
+namespace) and locales, one row per finding, and the source location of
+findings that have one. Questions like "missing keys in tutorials.* for nl
+in the last run" become indexed lookups instead of reloading and re-grouping
+a JSON report, and comparing two runs is a set difference in SQL.
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from i18n_catalog import BUILD_DIR, git, namespace_of
+from i18n_profile import timed
+
+DB_FILE = BUILD_DIR / "findings.sqlite3"
+SCHEMA_VERSION = 1
+# Finding fields stored in their own columns/tables rather than in the JSON detail
+LOCATION_FIELDS = ('file', 'line')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    tool TEXT NOT NULL,
+    started_at INTEGER NOT NULL,
+    finished_at INTEGER,
+    git_commit TEXT,
+    findings INTEGER,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS locales (
+    id INTEGER PRIMARY KEY,
+    code TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS keys (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    namespace TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    check_name TEXT NOT NULL,
+    locale_id INTEGER REFERENCES locales (id),
+    key_id INTEGER REFERENCES keys (id),
+    detail TEXT
+);
+CREATE TABLE IF NOT EXISTS locations (
+    finding_id INTEGER NOT NULL REFERENCES findings (id) ON DELETE CASCADE,
+    file TEXT NOT NULL,
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_tool ON runs (tool, id);
+CREATE INDEX IF NOT EXISTS keys_namespace ON keys (namespace);
+CREATE INDEX IF NOT EXISTS findings_run ON findings (run_id, check_name, locale_id);
+CREATE INDEX IF NOT EXISTS findings_check ON findings (check_name, run_id);
+CREATE INDEX IF NOT EXISTS findings_key ON findings (key_id);
+CREATE INDEX IF NOT EXISTS locations_finding ON locations (finding_id);
+CREATE INDEX IF NOT EXISTS locations_file ON locations (file);
+"""
+
+FINDING_COLUMNS = """
+    f.id, f.run_id, f.check_name, l.code AS locale, k.key, k.namespace, f.detail, loc.file, loc.line
+"""
+FINDING_JOINS = """
+    FROM findings f
+    LEFT JOIN locales l ON l.id = f.locale_id
+    LEFT JOIN keys k ON k.id = f.key_id
+    LEFT JOIN locations loc ON loc.finding_id = f.id
+"""
+GROUPS = {'namespace': 'k.namespace', 'check': 'f.check_name', 'locale': 'l.code', 'file': 'loc.file'}
+
+
+class FindingsDB:
+    def __init__(self, db_path: Path = DB_FILE, readonly: bool = False):
+        self.db_path = Path(db_path)
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            self.conn.commit()
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Queries
+
+    @timed('load')
+    def runs(self, tool: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        sql = "SELECT * FROM runs WHERE finished_at IS NOT NULL"
+        params: List = []
+        if tool:
+            sql += " AND tool = ?"
+            params.append(tool)
+        sql += " ORDER BY id DESC LIMIT ?"
+        return [dict(row) for row in self.conn.execute(sql, params + [limit])]
+
+    def latest_run(self, tool: Optional[str] = None, check: Optional[str] = None) -> Optional[int]:
+        """Last finished run of a tool, or the last one that reported a check"""
+        if check and not tool:
+            row = self.conn.execute(
+                "SELECT MAX(f.run_id) FROM findings f JOIN runs r ON r.id = f.run_id "
+                "WHERE f.check_name = ? AND r.finished_at IS NOT NULL", (check,)).fetchone()
+            return row[0]
+        runs = self.runs(tool, limit=1)
+        return runs[0]['id'] if runs else None
+
+    def where(self, run_id: int, check: Optional[str] = None, locale: Optional[str] = None,
+              key: Optional[str] = None, namespace: Optional[str] = None) -> Tuple[str, List]:
+        clauses, params = ["f.run_id = ?"], [run_id]
+        for clause, value in (("f.check_name = ?", check), ("l.code = ?", locale),
+                              ("k.key GLOB ?", key), ("k.namespace = ?", namespace)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return " WHERE " + " AND ".join(clauses), params
+
+    @timed('load')
+    def findings(self, run_id: int, check: Optional[str] = None, locale: Optional[str] = None,
+                 key: Optional[str] = None, namespace: Optional[str] = None,
+                 limit: Optional[int] = None) -> List[Dict]:
+        """Findings of a run, filtered by check, locale, key glob (tutorials.*) and namespace"""
+        where, params = self.where(run_id, check, locale, key, namespace)
+        sql = f"SELECT {FINDING_COLUMNS} {FINDING_JOINS} {where} ORDER BY f.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    @timed('compare')
+    def grouped(self, run_id: int, by: str, check: Optional[str] = None, locale: Optional[str] = None,
+                key: Optional[str] = None, namespace: Optional[str] = None) -> List[Dict]:
+        """Finding counts of a run per namespace, check, locale or file"""
+        column = GROUPS[by]
+        where, params = self.where(run_id, check, locale, key, namespace)
+        return [dict(row) for row in self.conn.execute(
+            f"SELECT {column} AS value, COUNT(*) AS findings {FINDING_JOINS} {where} "
+            f"GROUP BY {column} ORDER BY findings DESC, value", params)]
+
+    @timed('compare')
+    def diff(self, old_run: int, new_run: int, check: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Findings introduced and fixed between two runs, matched on check, locale, key and detail"""
+        check_clause = " AND check_name = ?" if check else ""
+        identity = "SELECT check_name, locale_id, key_id, detail FROM findings WHERE run_id = ?" + check_clause
+
+        def only_in(run: int, other: int) -> List[Dict]:
+            params = [run] + ([check] if check else []) + [other] + ([check] if check else [])
+            return [dict(row) for row in self.conn.execute(
+                f"SELECT d.check_name, l.code AS locale, k.key, d.detail "
+                f"FROM ({identity} EXCEPT {identity}) d "
+                f"LEFT JOIN locales l ON l.id = d.locale_id LEFT JOIN keys k ON k.id = d.key_id "
+                f"ORDER BY d.check_name, l.code, k.key", params)]
+
+        return {'introduced': only_in(new_run, old_run), 'fixed': only_in(old_run, new_run)}
+
+    @timed('load')
+    def sql(self, statement: str) -> List[Dict]:
+        return [dict(row) for row in self.conn.execute(statement)]
+
+
+class FindingsRun:
+    """One audit run being recorded; the report interface of i18n_report.JsonLinesReport"""
+
+    def __init__(self, db: FindingsDB, tool: str):
+        self.db = db
+        self.conn = db.conn
+        self.tool = tool
+        self.findings = 0
+        self.counts: Dict[str, Dict[str, int]] = {}
+        self.locale_ids: Dict[str, int] = {}
+        self.key_ids: Dict[str, int] = {}
+        self.closed = False
+        # The whole run is one transaction: an interrupted run leaves no trace
+        self.run_id = self.conn.execute(
+            "INSERT INTO runs (tool, started_at, git_commit) VALUES (?, ?, ?)",
+            (tool, int(time.time()), git('rev-parse', 'HEAD'))).lastrowid
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.conn.rollback()
+            self.db.close()
+
+    def intern(self, table: str, column: str, value: str, cache: Dict[str, int], **extra) -> int:
+        if value not in cache:
+            columns = (column,) + tuple(extra)
+            self.conn.execute(f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+                              f"VALUES ({', '.join('?' * len(columns))})", (value, *extra.values()))
+            cache[value] = self.conn.execute(f"SELECT id FROM {table} WHERE {column} = ?", (value,)).fetchone()[0]
+        return cache[value]
+
+    def finding(self, check: str, locale: Optional[str] = None, **fields):
+        key = fields.pop('key', None)
+        location = {name: fields.pop(name) for name in LOCATION_FIELDS if name in fields}
+        locale_id = self.intern('locales', 'code', locale, self.locale_ids) if locale else None
+        key_id = (self.intern('keys', 'key', key, self.key_ids, namespace=namespace_of(key))
+                  if key is not None else None)
+        detail = json.dumps(fields, ensure_ascii=False, sort_keys=True) if fields else None
+        finding_id = self.conn.execute(
+            "INSERT INTO findings (run_id, check_name, locale_id, key_id, detail) VALUES (?, ?, ?, ?, ?)",
+            (self.run_id, check, locale_id, key_id, detail)).lastrowid
+        if 'file' in location:
+            self.conn.execute("INSERT INTO locations VALUES (?, ?, ?)",
+                              (finding_id, location['file'], location.get('line')))
+        by_locale = self.counts.setdefault(check, {})
+        by_locale[locale or '*'] = by_locale.get(locale or '*', 0) + 1
+        self.findings += 1
+
+    @timed('write', 'FindingsRun.commit')
+    def close(self, **summary):
+        if self.closed:
+            return
+        self.closed = True
+        self.conn.execute(
+            "UPDATE runs SET finished_at = ?, findings = ?, summary = ? WHERE id = ?",
+            (int(time.time()), self.findings,
+             json.dumps({'counts': self.counts, **summary}, ensure_ascii=False), self.run_id))
+        self.conn.commit()
+        self.db.close()
+
+
+def record_run(tool: str, db_path: Path = DB_FILE) -> FindingsRun:
+    """Start recording the findings of one run of a tool"""
+    return FindingsRun(FindingsDB(db_path), tool)
+
+
+def describe_detail(detail: Optional[str]) -> str:
+    if not detail:
+        return ''
+    fields = json.loads(detail)
+    return ' '.join(f"{name}={value!r}" for name, value in fields.items())
+
+
+def print_findings(rows: List[Dict]):
+    for row in rows:
+        where = f"{row['file']}:{row['line']}" if row['file'] else row['key'] or ''
+        locale = f"[{row['locale']}] " if row['locale'] else ''
+        detail = describe_detail(row['detail'])
+        print(f"  {row['check_name']:22} {locale}{where}" + (f"  {detail[:80]}" if detail else ''))
+
+
+def print_query(db: FindingsDB, args: argparse.Namespace):
+    start = time.perf_counter()
+    if args.command == 'runs':
+        print(f"{'RUN':>5} {'TOOL':28} {'FINISHED':20} {'FINDINGS':>9} COMMIT")
+        print("-" * 80)
+        for run in db.runs(args.tool, args.limit):
+            finished = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run['finished_at']))
+            print(f"{run['id']:>5} {run['tool']:28} {finished:20} {run['findings']:>9,} "
+                  f"{(run['git_commit'] or '-')[:10]}")
+        return
+
+    if args.command == 'sql':
+        rows = db.sql(args.statement)
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+        print(f"\n📊 {len(rows)} rows in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return
+
+    if args.command == 'diff':
+        if args.runs:
+            old_run, new_run = args.runs
+        else:
+            runs = db.runs(args.tool, limit=2)
+            if len(runs) < 2:
+                print("✗ Need two finished runs to compare")
+                return
+            new_run, old_run = runs[0]['id'], runs[1]['id']
+        changes = db.diff(old_run, new_run, args.check)
+        for label, rows in (('🆕 INTRODUCED', changes['introduced']), ('✅ FIXED', changes['fixed'])):
+            print(f"\n{label} (run {old_run} → {new_run}): {len(rows)}")
+            print("-" * 80)
+            for row in rows[:args.limit]:
+                locale = f"[{row['locale']}] " if row['locale'] else ''
+                print(f"  {row['check_name']:22} {locale}{row['key'] or describe_detail(row['detail'])[:80]}")
+            if len(rows) > args.limit:
+                print(f"  ... and {len(rows) - args.limit} more")
+        print(f"\n⏱ {(time.perf_counter() - start) * 1000:.1f} ms")
+        return
+
+    run_id = args.run or db.latest_run(args.tool, args.check)
+    if run_id is None:
+        print("✗ No matching run")
+        return
+    if args.group:
+        rows = db.grouped(run_id, args.group, args.check, args.locale, args.key, args.namespace)
+        if args.json:
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+            return
+        print(f"{args.group.upper():40} {'FINDINGS':>9}")
+        print("-" * 80)
+        for row in rows[:args.limit]:
+            print(f"{str(row['value']):40} {row['findings']:>9,}")
+        total = sum(row['findings'] for row in rows)
+    else:
+        rows = db.findings(run_id, args.check, args.locale, args.key, args.namespace, args.limit)
+        if args.json:
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+            return
+        print_findings(rows)
+        total = len(rows)
+    print(f"\n📊 {total:,} findings in run {run_id} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the audit findings database")
+    parser.add_argument('--db', type=Path, default=DB_FILE, help="SQLite database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    runs = commands.add_parser('runs', help="recorded runs, newest first")
+    runs.add_argument('--tool')
+    runs.add_argument('--limit', type=int, default=20)
+
+    query = commands.add_parser('query', help="findings of one run (default: the latest)")
+    query.add_argument('--run', type=int, help="run id")
+    query.add_argument('--tool', help="latest run of this tool")
+    query.add_argument('--check', help="e.g. missing_key, untranslated_value, hardcoded_string")
+    query.add_argument('--locale')
+    query.add_argument('--key', help="key glob, e.g. 'tutorials.*'")
+    query.add_argument('--namespace')
+    query.add_argument('--group', choices=sorted(GROUPS), help="count findings per value instead")
+    query.add_argument('--limit', type=int)
+    query.add_argument('--json', action='store_true', help="print the rows as JSON")
+
+    diff = commands.add_parser('diff', help="findings introduced and fixed between two runs")
+    diff.add_argument('--runs', type=int, nargs=2, metavar=('OLD', 'NEW'))
+    diff.add_argument('--tool', help="compare the last two runs of this tool")
+    diff.add_argument('--check')
+    diff.add_argument('--limit', type=int, default=25, help="rows to print per side")
+
+    sql = commands.add_parser('sql', help="run a read-only SQL statement")
+    sql.add_argument('statement')
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"✗ No findings database at {args.db}, run an audit with --db first")
+        return
+    with FindingsDB(args.db, readonly=True) as db:
+        print_query(db, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Generate TypeScript message types from en.json
+Writes src/types/messages/{namespace}.d.ts (message shape, key union and
+ICU argument types per namespace) plus an index.d.ts tying them together.
+Only namespaces whose fingerprint changed are regenerated, and files whose
+bytes are unchanged are never rewritten, so tsc incremental builds stay warm.
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from i18n_catalog import (
+    BUILD_DIR,
+    MESSAGES_DIR,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    fingerprint,
+    iter_leaves,
+    load_json,
+    write_if_changed,
+)
+from i18n_icu import (
+    ARGUMENT, DATE, NUMBER, PLURAL, SELECT, TAG, TIME,
+    ICUSyntaxError, compile_message, iter_elements,
+)
+from i18n_profile import timed
+
+TYPES_DIR = PROJECT_ROOT / "src" / "types" / "messages"
+CACHE_FILE = BUILD_DIR / "message-types-cache.json"
+# Bump when the emitted TypeScript changes shape to invalidate the cache
+CACHE_VERSION = 1
+
+HEADER = "// Generated by scripts/generate_message_types.py from messages/en.json. Do not edit.\n"
+IDENTIFIER = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
+
+# Argument kinds ordered from least to most specific
+ARG_TYPES = {
+    ARGUMENT: (0, 'string | number'),
+    SELECT: (1, 'string'),
+    DATE: (2, 'Date | number'),
+    TIME: (2, 'Date | number'),
+    NUMBER: (3, 'number'),
+    PLURAL: (3, 'number'),
+    TAG: (4, '(chunks: ReactNode) => ReactNode'),
+}
+
+
+def type_name(namespace: str) -> str:
+    """PascalCase type prefix for a namespace (design_system -> DesignSystem)"""
+    parts = re.split(r'[^A-Za-z0-9]+', namespace)
+    name = ''.join(p[:1].upper() + p[1:] for p in parts if p)
+    return name if name and not name[0].isdigit() else f"Ns{name}"
+
+
+def property_name(key: str) -> str:
+    return key if IDENTIFIER.match(key) else json.dumps(key)
+
+
+def message_args(value: str) -> Dict[str, str]:
+    """ICU argument name -> TypeScript type for one message"""
+    try:
+        compiled = compile_message(value)
+    except ICUSyntaxError:
+        return {}
+    if isinstance(compiled, str):
+        return {}
+    args: Dict[str, Tuple[int, str]] = {}
+    for element in iter_elements(compiled):
+        kind = ARG_TYPES.get(element[0])
+        if kind is None:
+            continue
+        name = element[1]
+        if name not in args or kind[0] > args[name][0]:
+            args[name] = kind
+    return {name: ts_type for name, (_, ts_type) in args.items()}
+
+
+def shape_lines(tree: Dict, indent: int) -> List[str]:
+    """Nested object type body for a catalog subtree"""
+    pad = '  ' * indent
+    lines = []
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            lines.append(f"{pad}{property_name(key)}: {{")
+            lines.extend(shape_lines(value, indent + 1))
+            lines.append(f"{pad}}};")
+        else:
+            lines.append(f"{pad}{property_name(key)}: string;")
+    return lines
+
+
+def namespace_module(namespace: str, tree) -> str:
+    """Full .d.ts source for one namespace"""
+    name = type_name(namespace)
+    leaves = list(iter_leaves(tree)) if isinstance(tree, dict) else []
+    args = {key: message_args(value) for key, value in leaves if isinstance(value, str)}
+    args = {key: a for key, a in args.items() if a}
+    needs_react = any('ReactNode' in t for a in args.values() for t in a.values())
+
+    lines = [HEADER.rstrip('\n')]
+    if needs_react:
+        lines.append("import type { ReactNode } from 'react';")
+    lines.append('')
+
+    if isinstance(tree, dict):
+        lines.append(f"export interface {name}Messages {{")
+        lines.extend(shape_lines(tree, 1))
+        lines.append("}")
+    else:
+        lines.append(f"export type {name}Messages = string;")
+    lines.append('')
+
+    if leaves:
+        lines.append(f"export type {name}Key =")
+        lines.extend(f"  | {json.dumps(key)}" for key, _ in leaves)
+        lines[-1] += ';'
+    else:
+        lines.append(f"export type {name}Key = never;")
+    lines.append('')
+
+    lines.append(f"export interface {name}Args {{")
+    for key, key_args in args.items():
+        fields = '; '.join(f"{property_name(arg)}: {ts_type}" for arg, ts_type in key_args.items())
+        lines.append(f"  {json.dumps(key)}: {{ {fields} }};")
+    lines.append("}")
+    return '\n'.join(lines) + '\n'
+
+
+def index_module(namespaces: List[str]) -> str:
+    """index.d.ts combining every namespace"""
+    lines = [HEADER.rstrip('\n')]
+    for namespace in namespaces:
+        name = type_name(namespace)
+        lines.append(f"import type {{ {name}Messages, {name}Key, {name}Args }} "
+                     f"from './{namespace}';")
+    lines.append('')
+
+    lines.append("export interface Messages {")
+    lines.extend(f"  {property_name(ns)}: {type_name(ns)}Messages;" for ns in namespaces)
+    lines.append("}")
+    lines.append('')
+    lines.append("export type Namespace = keyof Messages;")
+    lines.append('')
+    lines.append("export interface NamespaceKeys {")
+    lines.extend(f"  {property_name(ns)}: {type_name(ns)}Key;" for ns in namespaces)
+    lines.append("}")
+    lines.append('')
+    lines.append("export interface NamespaceArgs {")
+    lines.extend(f"  {property_name(ns)}: {type_name(ns)}Args;" for ns in namespaces)
+    lines.append("}")
+    lines.append('')
+    lines.append("/** Fully qualified key, e.g. 'common.save' */")
+    lines.append("export type MessageKey = {")
+    lines.append("  [N in Namespace]: `${N}.${NamespaceKeys[N]}`;")
+    lines.append("}[Namespace];")
+    lines.append('')
+    lines.append("/** ICU arguments of a key, never for messages without arguments */")
+    lines.append("export type MessageArgs<N extends Namespace, K extends NamespaceKeys[N]> =")
+    lines.append("  K extends keyof NamespaceArgs[N] ? NamespaceArgs[N][K] : never;")
+    return '\n'.join(lines) + '\n'
+
+
+class MessageTypeGenerator:
+    def __init__(self, output_dir: Path = TYPES_DIR, cache_file: Path = CACHE_FILE):
+        self.output_dir = Path(output_dir)
+        self.cache_file = Path(cache_file)
+        self.cache = self.load_cache()
+        self.stats = {'regenerated': 0, 'reused': 0, 'written': 0}
+
+    def load_cache(self) -> Dict[str, Dict[str, str]]:
+        if self.cache_file.exists():
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                return data['namespaces']
+        return {}
+
+    def save_cache(self):
+        data = {'version': CACHE_VERSION, 'namespaces': self.cache}
+        write_if_changed(self.cache_file, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def write(self, file_path: Path, source: str):
+        if write_if_changed(file_path, source.encode('utf-8')):
+            self.stats['written'] += 1
+
+    @timed('report')
+    def generate(self, catalog: Dict):
+        """Regenerate changed namespaces and write every file whose bytes differ"""
+        namespaces = list(catalog)
+        for namespace in namespaces:
+            ns_fingerprint = fingerprint(catalog[namespace])
+            cached = self.cache.get(namespace)
+            if cached and cached['fingerprint'] == ns_fingerprint:
+                source = cached['source']
+                self.stats['reused'] += 1
+            else:
+                source = namespace_module(namespace, catalog[namespace])
+                self.cache[namespace] = {'fingerprint': ns_fingerprint, 'source': source}
+                self.stats['regenerated'] += 1
+            self.write(self.output_dir / f"{namespace}.d.ts", source)
+
+        self.write(self.output_dir / "index.d.ts", index_module(namespaces))
+
+        # Remove namespaces that no longer exist in en.json
+        for stale in set(self.cache) - set(namespaces):
+            del self.cache[stale]
+            (self.output_dir / f"{stale}.d.ts").unlink(missing_ok=True)
+        self.save_cache()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate TypeScript message types from en.json")
+    parser.add_argument('--messages', type=Path, default=MESSAGES_DIR, help="catalog directory")
+    parser.add_argument('--out', type=Path, default=TYPES_DIR, help="output directory")
+    args = parser.parse_args()
+
+    catalog = load_json(args.messages / f"{SOURCE_LOCALE}.json")
+    generator = MessageTypeGenerator(output_dir=args.out)
+    generator.generate(catalog)
+
+    print(f"✓ {len(catalog)} namespaces: {generator.stats['regenerated']} regenerated, "
+          f"{generator.stats['reused']} unchanged")
+    print(f"💾 {generator.stats['written']} files written to: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
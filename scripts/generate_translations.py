@@ -1,51 +1,68 @@
 #!/usr/bin/env python3
 """
 Generate translations for untranslated values
-Uses context-aware translation based on key paths and surrounding translations
+Uses context-aware translation based on key paths and surrounding translations,
+plus a translation memory of every existing en -> fr/nl pair
 """
 
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from i18n_glossary import get_glossary
+from i18n_profile import timed
+from i18n_tm import TranslationMemory, build_memory
+from marker_index import sync_catalogs
+from tm_store import DB_FILE, TMStore
 
 class TranslationGenerator:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, translations: Optional[Dict[str, Dict]] = None,
+                 untranslated: Optional[Dict[str, Dict]] = None, tm_db: Optional[Path] = DB_FILE):
         self.project_root = Path(project_root)
         self.messages_dir = self.project_root / "messages"
-
-        # Load all translations
-        self.translations = {}
-        for lang in ['en', 'fr', 'nl']:
-            with open(self.messages_dir / f"{lang}.json", 'r', encoding='utf-8') as f:
-                self.translations[lang] = json.load(f)
-
-        # Load prioritized untranslated items
-        self.untranslated = {}
-        for lang in ['fr', 'nl']:
-            file_path = self.project_root / f"untranslated_{lang}_prioritized.json"
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.untranslated[lang] = json.load(f)
-
-    def should_translate(self, key: str, value: str) -> bool:
+        # Persistent translation memory merged into the catalog pairs; None for none
+        self.tm_db = tm_db
+
+        # Load all translations, unless the caller already holds them
+        self.translations = translations
+        if self.translations is None:
+            self.translations = {}
+            for lang in ['en', 'fr', 'nl']:
+                with open(self.messages_dir / f"{lang}.json", 'r', encoding='utf-8') as f:
+                    self.translations[lang] = json.load(f)
+
+        # Load prioritized untranslated items (analyze_untranslated.py output)
+        self.untranslated = untranslated
+        if self.untranslated is None:
+            self.untranslated = {}
+            for lang in ['fr', 'nl']:
+                file_path = self.project_root / f"untranslated_{lang}_prioritized.json"
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    self.untranslated[lang] = json.load(f)
+
+        # Translation memories are built on first use, one per target locale
+        self.memories: Dict[str, TranslationMemory] = {}
+        self.tm_matches: Dict[str, Dict[str, Dict]] = {}
+
+    def get_memory(self, lang: str) -> TranslationMemory:
+        """Translation memory of every existing en -> lang pair, plus the persistent store if there is one"""
+        if lang not in self.memories:
+            memory = build_memory(self.translations, lang)
+            if self.tm_db is not None and Path(self.tm_db).exists():
+                current = set(memory.segments)
+                with TMStore(self.tm_db, readonly=True) as store:
+                    for source, target, key in store.segments(lang):
+                        if (source, target, key) not in current:
+                            memory.add(source, target, key)
+            self.memories[lang] = memory
+        return self.memories[lang]
+
+    def should_translate(self, key: str, value: str, lang: str = None) -> bool:
         """Determine if a value should be translated"""
-        # Skip CSS classes
-        if any(css in value for css in ['bg-', 'text-', 'border-', 'ring-', 'focus-visible:']):
-            return False
-
-        # Skip URLs
-        if value.startswith('http') or '://' in value:
-            return False
-
-        # Skip pure numbers
-        if value.replace('+', '').replace(',', '').replace('%', '').replace('k', '').replace('M', '').strip().isdigit():
-            return False
-
-        # Skip very short durations that are already clear
-        if 'minutes' in value or 'min' in value or 'hours' in value:
-            return True  # These should be translated
-
-        return True
+        # Skip CSS classes, URLs, numbers, brand names and other glossary entries
+        return not get_glossary().is_exempt(value, lang)
 
+    @timed('compare')
     def get_translation_suggestions(self, lang: str) -> Dict[str, str]:
         """Generate translation suggestions for high/medium priority items"""
         suggestions = {}
@@ -113,23 +130,36 @@ class TranslationGenerator:
 
         # Process items
         all_items = high_priority + medium_priority
+        memory = self.get_memory(lang)
+        self.tm_matches[lang] = {}
 
         for item in all_items:
             key = item['key']
             value = item['value']
 
-            if not self.should_translate(key, value):
+            if not self.should_translate(key, value, lang):
                 continue
 
             # Check if we have a manual translation
             if value in common_translations:
                 suggestions[key] = common_translations[value]
-            else:
-                # Mark for manual translation
-                suggestions[key] = f"[TRANSLATE] {value}"
+                continue
+
+            # Reuse an existing translation of the same source text
+            matches = memory.lookup(value)
+            if matches and matches[0].score == 1.0:
+                suggestions[key] = matches[0].target
+                self.tm_matches[lang][key] = {'source': value, 'matches': [matches[0]._asdict()]}
+                continue
+
+            # Mark for manual translation, fuzzy matches go to the suggestions file
+            suggestions[key] = f"[TRANSLATE] {value}"
+            if matches:
+                self.tm_matches[lang][key] = {'source': value, 'matches': [m._asdict() for m in matches]}
 
         return suggestions
 
+    @timed('write')
     def generate_patch_file(self, lang: str, suggestions: Dict[str, str]):
         """Generate a JSON patch file with translation suggestions"""
         patch_file = self.project_root / f"translations_{lang}_patch.json"
@@ -140,6 +170,18 @@ class TranslationGenerator:
         print(f"✓ Generated patch file: {patch_file}")
         return patch_file
 
+    @timed('write')
+    def generate_suggestions_file(self, lang: str):
+        """Write translation memory matches, with scores, next to the patch file"""
+        suggestions_file = self.project_root / f"translations_{lang}_suggestions.json"
+
+        with open(suggestions_file, 'w', encoding='utf-8') as f:
+            json.dump(self.tm_matches.get(lang, {}), f, indent=2, ensure_ascii=False)
+
+        print(f"✓ Generated suggestions file: {suggestions_file}")
+        return suggestions_file
+
+    @timed('write')
     def apply_translations(self, lang: str, suggestions: Dict[str, str], auto_apply: bool = False):
         """Apply translations to the target language file"""
         translations = self.translations[lang].copy()
@@ -187,17 +229,22 @@ class TranslationGenerator:
         if manual_count > 0:
             print(f"⚠ {manual_count} items need manual translation (marked with [TRANSLATE])")
 
-    def generate_report(self):
-        """Generate final report"""
+        # Record markers written into (or removed from) the catalog
+        markers = sync_catalogs(self.messages_dir, ['en', lang])[lang]
+        print(f"✓ Marker index: {markers['pending']} pending in {lang}.json")
+
+    def generate_report(self, save: bool = True) -> Dict[str, Dict[str, str]]:
+        """Generate final report, returning the suggestions of every language"""
         print("\n" + "=" * 80)
         print("TRANSLATION GENERATION REPORT")
         print("=" * 80)
 
+        generated = {}
         for lang in ['fr', 'nl']:
             print(f"\n{lang.upper()}:")
             print("-" * 80)
 
-            suggestions = self.get_translation_suggestions(lang)
+            suggestions = generated[lang] = self.get_translation_suggestions(lang)
 
             auto_translated = sum(1 for v in suggestions.values() if '[TRANSLATE]' not in v)
             needs_manual = sum(1 for v in suggestions.values() if '[TRANSLATE]' in v)
@@ -205,13 +252,22 @@ class TranslationGenerator:
                       len(self.untranslated[lang]['categories']['medium_priority']) -
                       len(suggestions))
 
+            matches = self.tm_matches[lang].values()
+            exact = sum(1 for m in matches if m['matches'][0]['score'] == 1.0)
+            fuzzy = len(matches) - exact
+
             print(f"Total items to translate: {len(suggestions)}")
-            print(f"Auto-translated: {auto_translated}")
-            print(f"Needs manual translation: {needs_manual}")
+            print(f"Auto-translated: {auto_translated} ({exact} from translation memory)")
+            print(f"Needs manual translation: {needs_manual} ({fuzzy} with fuzzy matches)")
             print(f"Skipped (CSS/URLs/numbers): {skipped}")
+            print(f"Translation memory: {len(self.get_memory(lang)):,} segments")
+
+            # Generate patch and suggestions files
+            if save:
+                self.generate_patch_file(lang, suggestions)
+                self.generate_suggestions_file(lang)
 
-            # Generate patch file
-            self.generate_patch_file(lang, suggestions)
+        return generated
 
 def main():
     project_root = Path(__file__).parent.parent
@@ -228,6 +284,7 @@ def main():
     print("   - translations_nl_patch.json")
     print()
     print("2. Items marked with [TRANSLATE] need manual translation")
+    print("   Fuzzy translation memory matches are in translations_{fr,nl}_suggestions.json")
     print()
     print("3. To apply translations automatically (excluding [TRANSLATE] items):")
     print("   python scripts/apply_translations.py fr")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Shared catalog helpers for the translation scripts
+Loading, flattening and hashing of the messages/*.json catalogs
+"""
+
+import hashlib
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from i18n_profile import count, timed
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MESSAGES_DIR = PROJECT_ROOT / "messages"
+BUILD_DIR = PROJECT_ROOT / ".i18n-build"
+
+SOURCE_LOCALE = 'en'
+LOCALES = ['en', 'fr', 'nl']
+TARGET_LOCALES = [lang for lang in LOCALES if lang != SOURCE_LOCALE]
+
+AUTO_TRANSLATED_MARKER = '[AUTO-TRANSLATED]'
+TRANSLATE_MARKER = '[TRANSLATE]'
+
+
+@timed('load')
+def load_json(file_path: Path) -> Dict:
+    """Load and parse a JSON file"""
+    count('files')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_catalogs(messages_dir: Path = MESSAGES_DIR, locales: List[str] = LOCALES) -> Dict[str, Dict]:
+    """Load the catalog of every locale, missing files load as empty catalogs"""
+    catalogs = {}
+    for lang in locales:
+        file_path = Path(messages_dir) / f"{lang}.json"
+        catalogs[lang] = load_json(file_path) if file_path.exists() else {}
+    return catalogs
+
+
+def iter_leaves(obj: Dict, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Yield (dot.path, value) for every non-dict value of a nested catalog"""
+    for key, value in obj.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from iter_leaves(value, full_key)
+        else:
+            yield full_key, value
+
+
+def _flatten_into(out: Dict[str, Any], obj: Dict, prefix: str):
+    for key, value in obj.items():
+        if isinstance(value, dict):
+            _flatten_into(out, value, prefix + key + '.')
+        else:
+            out[prefix + key] = value
+
+
+@timed('flatten')
+def flatten(obj: Dict, prefix: str = '') -> Dict[str, Any]:
+    """Flatten a nested catalog into {dot.path: value}"""
+    out = {}
+    _flatten_into(out, obj, f"{prefix}." if prefix else '')
+    return out
+
+
+@timed('flatten')
+def align_catalogs(source: Dict, others: List[Dict]) -> Tuple[List[str], List[List[Any]]]:
+    """
+    Align catalogs over the sorted leaf keys of a source catalog.
+    Returns (keys, columns) where columns[i][j] is the value of keys[j] in
+    others[i] (None when missing). Walks all trees together, so only the
+    source keys are ever built as strings.
+    """
+    index: List[str] = []
+    columns: List[List[Any]] = [[] for _ in others]
+
+    def walk(node: Dict, subtrees: List[Any], prefix: str):
+        for key in sorted(node):
+            value = node[key]
+            children = [t.get(key) if isinstance(t, dict) else None for t in subtrees]
+            if isinstance(value, dict):
+                walk(value, children, prefix + key + '.')
+            else:
+                index.append(prefix + key)
+                for column, child in zip(columns, children):
+                    column.append(child)
+
+    walk(source, others, '')
+    count('keys', len(index))
+    return index, columns
+
+
+def namespace_of(key: str) -> str:
+    """Return the top-level namespace of a dot-separated key"""
+    return key.split('.', 1)[0] if '.' in key else 'root'
+
+
+def value_hash(value: str) -> str:
+    """Short stable hash of a leaf value, used as a cache key"""
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def fingerprint(obj: Any) -> str:
+    """Stable hash of any JSON-serializable subtree"""
+    canonical = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@timed('write')
+def write_if_changed(file_path: Path, content: bytes) -> bool:
+    """Write bytes to a file unless it already holds exactly those bytes"""
+    file_path = Path(file_path)
+    if file_path.exists() and file_path.read_bytes() == content:
+        return False
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(content)
+    return True
+
+
+def git(*args: str) -> Optional[str]:
+    """Run a git command in the project root, None if it fails"""
+    try:
+        result = subprocess.run(['git', *args], cwd=PROJECT_ROOT, capture_output=True,
+                                text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+class GitObjectReader:
+    """
+    One persistent `git cat-file --batch` process: reads any number of
+    objects (blob ids or <commit>:<path> names) without a process per read
+    """
+
+    def __init__(self, cwd: Path = PROJECT_ROOT):
+        self.process = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=cwd,
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+
+    @timed('load', 'git cat-file')
+    def read(self, name: str) -> Optional[bytes]:
+        """Content of an object, None if it does not exist"""
+        self.process.stdin.write(name.encode('utf-8') + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().split()
+        if len(header) != 3:
+            return None
+        data = self.process.stdout.read(int(header[2]))
+        self.process.stdout.read(1)
+        return data
+
+    def read_json(self, name: str) -> Dict:
+        """A JSON object (e.g. a catalog blob), {} if it is missing or invalid"""
+        data = self.read(name)
+        try:
+            return json.loads(data) if data else {}
+        except ValueError:
+            return {}
+
+
+def catalog_log(rev_range: Optional[str] = None, messages_dir: Path = MESSAGES_DIR,
+                locales: List[str] = LOCALES) -> List[Tuple[str, int, Dict[str, Optional[str]]]]:
+    """
+    Commits of a range (default: all history) that changed a catalog, oldest
+    first along first parents, each with the blob id of every locale's catalog
+    after the commit (None while a catalog does not exist). One `git log --raw`
+    call, no checkout. Raises ValueError when git cannot resolve the range.
+    """
+    if rev_range and git('rev-parse', rev_range) is None:
+        raise ValueError(f"invalid revision range: {rev_range}")
+    relative = Path(messages_dir).resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    paths = {f"{relative}/{lang}.json": lang for lang in locales}
+    blobs: Dict[str, Optional[str]] = {lang: None for lang in locales}
+    if rev_range and '..' in rev_range:
+        base = rev_range.split('..')[0] or 'HEAD'
+        for line in (git('ls-tree', base, '--', *paths) or '').splitlines():
+            meta, path = line.split('\t', 1)
+            if path in paths:
+                blobs[paths[path]] = meta.split()[2]
+
+    args = ['log', '--reverse', '--first-parent', '--diff-merges=first-parent', '--no-renames',
+            '--raw', '--no-abbrev', '--format=commit %H %ct']
+    log = git(*args, *([rev_range] if rev_range else []), '--', *paths)
+    if log is None:
+        raise ValueError(f"git log failed for {rev_range or 'the whole history'}")
+    commits = []
+    for line in log.splitlines():
+        if line.startswith('commit '):
+            _, commit, timestamp = line.split()
+            commits.append((commit, int(timestamp), blobs))
+        elif line.startswith(':'):
+            meta, path = line.split('\t', 1)
+            if path in paths:
+                new_blob = meta.split()[3]
+                blobs = dict(blobs)
+                blobs[paths[path]] = None if set(new_blob) == {'0'} else new_blob
+                commit, timestamp, _ = commits[-1]
+                commits[-1] = (commit, timestamp, blobs)
+    return commits
+
+
+def get_value_by_path(obj: Dict, path: str) -> Any:
+    """Get a value (leaf or subtree) from a nested catalog by dot-separated path"""
+    current = obj
+    for key in path.split('.'):
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        else:
+            return None
+    return current
+
+
+def set_value_by_path(obj: Dict, path: str, value: Any) -> None:
+    """Set a value in a nested catalog by dot-separated path"""
+    keys = path.split('.')
+    target = obj
+    for key in keys[:-1]:
+        if not isinstance(target.get(key), dict):
+            target[key] = {}
+        target = target[key]
+    target[keys[-1]] = value
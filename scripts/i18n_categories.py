@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Config-driven categories and priorities for untranslated values
+Loads i18n-categories.json and compiles its rules into one first-match
+decision table: every rule is a tuple of predicates over the value and its
+do-not-translate glossary category, and a value lands in the category of
+the first rule whose predicates all hold (the default category otherwise).
+Results are cached by value hash across runs, and every rule keeps hit
+counts and timing.
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from i18n_catalog import BUILD_DIR, PROJECT_ROOT, fingerprint, value_hash, write_if_changed
+from i18n_glossary import get_glossary
+from i18n_profile import timed
+
+CATEGORIES_FILE = PROJECT_ROOT / "i18n-categories.json"
+CACHE_FILE = BUILD_DIR / "category-cache.json"
+# Bump when rule semantics change to invalidate the cache
+CACHE_VERSION = 1
+PRIORITIES = ('high', 'medium', 'low')
+DEFAULT_RULE = 'default'
+
+# (value, glossary category) -> bool
+Predicate = Callable[[str, Optional[str]], bool]
+
+
+class RuleError(ValueError):
+    pass
+
+
+def substring_pattern(substrings: List[str]) -> re.Pattern:
+    return re.compile('|'.join(re.escape(s) for s in sorted(substrings, key=len, reverse=True)))
+
+
+def compile_rule(rule: Dict) -> Tuple[Predicate, ...]:
+    """Predicates of one rule, cheapest first"""
+    predicates: List[Predicate] = []
+    unknown = set(rule) - {'name', 'category', 'glossary', 'minLength', 'maxLength',
+                           'minWords', 'maxWords', 'contains', 'excludes', 'pattern'}
+    if unknown:
+        raise RuleError(f"rule {rule.get('name')!r}: unknown conditions {sorted(unknown)}")
+
+    glossary = rule.get('glossary')
+    if glossary == '*':
+        predicates.append(lambda value, category: category is not None)
+    elif glossary is not None:
+        accepted = frozenset(glossary)
+        predicates.append(lambda value, category: category in accepted)
+
+    if 'minLength' in rule:
+        min_length = rule['minLength']
+        predicates.append(lambda value, category: len(value) >= min_length)
+    if 'maxLength' in rule:
+        max_length = rule['maxLength']
+        predicates.append(lambda value, category: len(value) <= max_length)
+    if 'excludes' in rule:
+        excluded = substring_pattern(rule['excludes']).search
+        predicates.append(lambda value, category: excluded(value) is None)
+    if 'contains' in rule:
+        contained = substring_pattern(rule['contains']).search
+        predicates.append(lambda value, category: contained(value) is not None)
+    if 'minWords' in rule:
+        min_words = rule['minWords']
+        predicates.append(lambda value, category: len(value.split()) >= min_words)
+    if 'maxWords' in rule:
+        max_words = rule['maxWords']
+        predicates.append(lambda value, category: len(value.split()) <= max_words)
+    if 'pattern' in rule:
+        search = re.compile(rule['pattern']).search
+        predicates.append(lambda value, category: search(value) is not None)
+    return tuple(predicates)
+
+
+class CategoryClassifier:
+    def __init__(self, categories_file: Path = CATEGORIES_FILE, cache_file: Path = CACHE_FILE):
+        self.categories_file = Path(categories_file)
+        self.cache_file = Path(cache_file)
+        with open(self.categories_file, 'r', encoding='utf-8') as f:
+            self.config = json.load(f)
+        self.categories: Dict[str, Dict] = self.config['categories']
+        self.default = self.config['default']
+
+        self.rules: List[Tuple[str, str, Tuple[Predicate, ...]]] = []
+        for rule in self.config['rules']:
+            if rule['category'] not in self.categories:
+                raise RuleError(f"rule {rule['name']!r}: unknown category {rule['category']!r}")
+            self.rules.append((rule['name'], rule['category'], compile_rule(rule)))
+        self.rule_categories = {name: category for name, category, _ in self.rules}
+        self.rule_categories[DEFAULT_RULE] = self.default
+        self.uses_glossary = any('glossary' in rule for rule in self.config['rules'])
+
+        # Rules read the glossary (and its CSS vocabulary), so they are part of what the cache depends on
+        vocabulary = get_glossary().css_vocabulary()
+        self.fingerprint = fingerprint({'rules': self.config['rules'], 'default': self.default,
+                                        'glossary': get_glossary().data,
+                                        'css': vocabulary.fingerprint if vocabulary else None})
+        self.cache: Dict[str, Dict[str, str]] = self.load_cache()
+        self.stats = {name: {'hits': 0, 'evaluated': 0, 'seconds': 0.0} for name in self.rule_categories}
+        self.cache_hits = 0
+
+    def load_cache(self) -> Dict[str, Dict[str, str]]:
+        """Matching rule names keyed by locale and value hash"""
+        if self.cache_file.exists():
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION and data.get('fingerprint') == self.fingerprint:
+                return data['entries']
+        return {}
+
+    def save_cache(self):
+        data = {'version': CACHE_VERSION, 'fingerprint': self.fingerprint, 'entries': self.cache}
+        write_if_changed(self.cache_file,
+                         json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def match_rule(self, value: str, lang: Optional[str] = None) -> str:
+        """Name of the first rule a value satisfies, through the value-hash cache"""
+        entries = self.cache.setdefault(lang or '*', {})
+        digest = value_hash(value)
+        name = entries.get(digest)
+        if name is not None and name in self.rule_categories:
+            self.cache_hits += 1
+        else:
+            name = entries[digest] = self.evaluate(value, lang)
+        self.stats[name]['hits'] += 1
+        return name
+
+    def evaluate(self, value: str, lang: Optional[str] = None) -> str:
+        category = get_glossary().match(value, lang) if self.uses_glossary else None
+        clock = time.perf_counter
+        for name, _, predicates in self.rules:
+            stats = self.stats[name]
+            start = clock()
+            matched = all(predicate(value, category) for predicate in predicates)
+            stats['seconds'] += clock() - start
+            stats['evaluated'] += 1
+            if matched:
+                return name
+        self.stats[DEFAULT_RULE]['evaluated'] += 1
+        return DEFAULT_RULE
+
+    def classify(self, value: str, lang: Optional[str] = None) -> str:
+        """Category of one value"""
+        return self.rule_categories[self.match_rule(value, lang)]
+
+    @timed('compare')
+    def classify_batch(self, items: List[Dict], lang: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Items ({'key', 'value'}) grouped by category, categories in config order"""
+        categories: Dict[str, List[Dict]] = {name: [] for name in self.categories}
+        rule_categories = self.rule_categories
+        match_rule = self.match_rule
+        for item in items:
+            categories[rule_categories[match_rule(item['value'], lang)]].append(item)
+        return categories
+
+    def priorities(self, categories: Dict[str, List[Dict]]) -> Dict[str, object]:
+        """
+        Priority buckets of classified items: high and medium are flat lists in
+        category order, low keeps one list per category; a category 'limit'
+        caps how many of its items are bucketed
+        """
+        buckets = {'high': [], 'medium': [], 'low': {}}
+        for name, spec in self.categories.items():
+            priority = spec.get('priority')
+            if priority not in PRIORITIES:
+                continue
+            items = categories.get(name, [])
+            if 'limit' in spec:
+                items = items[:spec['limit']]
+            if priority == 'low':
+                buckets['low'][name] = items
+            else:
+                buckets[priority].extend(items)
+        return buckets
+
+    def print_stats(self):
+        print(f"{'RULE':20} {'CATEGORY':12} {'HITS':>8} {'EVALUATED':>10} {'TIME':>10}")
+        print("-" * 80)
+        for name, stats in self.stats.items():
+            print(f"{name:20} {self.rule_categories[name]:12} {stats['hits']:>8,} "
+                  f"{stats['evaluated']:>10,} {stats['seconds'] * 1000:>8.2f}ms")
+        print(f"Cache hits: {self.cache_hits:,}")
+
+
+_default_classifier: Optional[CategoryClassifier] = None
+
+
+def get_classifier() -> CategoryClassifier:
+    """Process-wide classifier, loaded and compiled once"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = CategoryClassifier()
+    return _default_classifier
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Shared do-not-translate glossary for the translation scripts
+Loads i18n-glossary.json and compiles its terms, prefixes and patterns (plus
+per-locale overrides) into one regex per locale. Values the regex does not
+match are checked against the Tailwind class vocabulary of "cssClasses"
+(i18n_tailwind.py). A match returns the name of the rule category ('brand',
+'term', 'url', 'css', ...), and results are cached by value hash. The
+bilingual "terms" section (required renderings of English terms) is used by
+check_terms.py.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from i18n_catalog import PROJECT_ROOT, value_hash
+from i18n_profile import count, timed
+from i18n_tailwind import TailwindVocabulary
+
+GLOSSARY_FILE = PROJECT_ROOT / "i18n-glossary.json"
+
+# Categories for values that are identical by design rather than untranslated
+BRAND = 'brand'
+TERM = 'term'
+CSS = 'css'
+
+
+class GlossaryMatcher:
+    def __init__(self, terms: List[str], prefixes: List[str], patterns: Dict[str, str],
+                 css: Optional[TailwindVocabulary] = None, whole: bool = False):
+        alternatives = []
+        if prefixes:
+            escaped = '|'.join(re.escape(p) for p in sorted(prefixes, key=len, reverse=True))
+            alternatives.append(f"(?P<{BRAND}>^(?:{escaped}))")
+        if terms:
+            escaped = '|'.join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+            alternatives.append(f"(?P<{TERM}>^(?:{escaped})$)")
+        for category, pattern in patterns.items():
+            # Whole-value matchers only accept a pattern that spans the value
+            alternatives.append(f"(?P<{category}>^(?:{pattern})$)" if whole else f"(?P<{category}>{pattern})")
+        self.pattern = re.compile('|'.join(alternatives)) if alternatives else None
+        self.css = css
+        self.cache: Dict[str, Optional[str]] = {}
+
+    def match(self, value: str) -> Optional[str]:
+        """Return the category of the first matching rule, or None"""
+        digest = value_hash(value)
+        if digest in self.cache:
+            return self.cache[digest]
+        found = None
+        if self.pattern is not None:
+            m = self.pattern.search(value)
+            if m is not None:
+                found = m.lastgroup
+        if found is None and self.css is not None and self.css.is_css(value):
+            found = CSS
+        self.cache[digest] = found
+        return found
+
+    def match_batch(self, values: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Category of every distinct value of a batch"""
+        return {value: self.match(value) for value in set(values)}
+
+    def is_exempt(self, value: str) -> bool:
+        """True when a value may legitimately stay identical to English"""
+        return self.match(value) is not None
+
+
+class Glossary:
+    def __init__(self, glossary_file: Path = GLOSSARY_FILE):
+        self.glossary_file = Path(glossary_file)
+        self.data = self.load()
+        self.matchers: Dict[Tuple[Optional[str], bool], GlossaryMatcher] = {}
+        self.css: Optional[TailwindVocabulary] = None
+
+    def load(self) -> Dict:
+        if not self.glossary_file.exists():
+            print(f"⚠ Glossary not found: {self.glossary_file}")
+            return {}
+        with open(self.glossary_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def matcher(self, lang: Optional[str] = None, whole: bool = False) -> GlossaryMatcher:
+        """
+        Compiled matcher for a locale: shared rules plus that locale's overrides.
+        A whole-value matcher (for free text such as JSX strings) leaves out the
+        brand prefixes, anchors every pattern to the full value and uses the
+        "wholeValuePatterns" variants (e.g. a bare URL rather than any "://").
+        """
+        if (lang, whole) not in self.matchers:
+            base = self.data.get('doNotTranslate', {})
+            override = self.data.get('locales', {}).get(lang, {}) if lang else {}
+            patterns = dict(base.get('patterns', {}))
+            patterns.update(override.get('patterns', {}))
+            if whole:
+                patterns.update(base.get('wholeValuePatterns', {}))
+            self.matchers[(lang, whole)] = GlossaryMatcher(
+                terms=base.get('terms', []) + override.get('terms', []),
+                prefixes=[] if whole else base.get('prefixes', []) + override.get('prefixes', []),
+                patterns=patterns,
+                css=self.css_vocabulary(),
+                whole=whole,
+            )
+        return self.matchers[(lang, whole)]
+
+    def css_vocabulary(self) -> Optional[TailwindVocabulary]:
+        """Class vocabulary of the tailwind config named by "cssClasses", shared by every locale"""
+        config = self.data.get('doNotTranslate', {}).get('cssClasses')
+        if config and self.css is None:
+            self.css = TailwindVocabulary.load(PROJECT_ROOT / config)
+        return self.css
+
+    def match(self, value: str, lang: Optional[str] = None) -> Optional[str]:
+        return self.matcher(lang).match(value)
+
+    @timed('compare', 'glossary.match_batch')
+    def match_batch(self, values: Iterable[str], lang: Optional[str] = None,
+                    whole: bool = False) -> Dict[str, Optional[str]]:
+        values = set(values)
+        count('glossary values', len(values))
+        return self.matcher(lang, whole).match_batch(values)
+
+    def is_exempt(self, value: str, lang: Optional[str] = None) -> bool:
+        return self.matcher(lang).is_exempt(value)
+
+    def renderings(self, lang: str) -> Dict[str, List[str]]:
+        """English glossary term -> accepted renderings in a locale"""
+        return {term: locales[lang] for term, locales in self.data.get('terms', {}).items()
+                if locales.get(lang)}
+
+    def compound_terms(self, lang: str) -> bool:
+        """True for locales that glue terms into compounds ('promptsjablonen')"""
+        return bool(self.data.get('locales', {}).get(lang, {}).get('compoundTerms'))
+
+
+_default_glossary: Optional[Glossary] = None
+
+
+def get_glossary() -> Glossary:
+    """Process-wide glossary, loaded and compiled once"""
+    global _default_glossary
+    if _default_glossary is None:
+        _default_glossary = Glossary()
+    return _default_glossary
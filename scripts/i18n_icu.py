@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+ICU MessageFormat parser for the translation catalogs
+Parses next-intl messages ({name}, {count, plural, ...}, {x, select, ...},
+rich-text tags like <link>...</link>) into a compact JSON-friendly AST.
+
+Compact AST elements:
+    "text"                               literal
+    [1, name]                            simple argument {name}
+    [2, name, style] / [3, ...] / [4, ...]  number / date / time argument
+    [5, name, {option: [elements]}]      select
+    [6, name, {option: [elements]}, offset, ordinal]  plural / selectordinal
+    [7]                                  '#' inside a plural branch
+    [8, name, [elements]]                rich-text tag (self-closing tags have no children)
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from i18n_catalog import value_hash
+
+ARGUMENT, NUMBER, DATE, TIME, SELECT, PLURAL, POUND, TAG = 1, 2, 3, 4, 5, 6, 7, 8
+
+SIMPLE_TYPES = {'number': NUMBER, 'date': DATE, 'time': TIME}
+PLURAL_TYPES = {'plural': False, 'selectordinal': True}
+SYNTAX_CHARS = set("{}<>'#")
+NAME_STOP = set("{}<>,#'/= \t\n\r")
+
+Element = Union[str, list]
+
+
+class ICUSyntaxError(Exception):
+    def __init__(self, message: str, offset: int):
+        super().__init__(f"{message} (at offset {offset})")
+        self.reason = message
+        self.offset = offset
+
+
+class MessageParser:
+    def __init__(self, message: str):
+        self.message = message
+        self.pos = 0
+
+    def error(self, reason: str, offset: Optional[int] = None):
+        raise ICUSyntaxError(reason, self.pos if offset is None else offset)
+
+    def peek(self, offset: int = 0) -> str:
+        index = self.pos + offset
+        return self.message[index] if index < len(self.message) else ''
+
+    def skip_whitespace(self):
+        while self.peek().isspace():
+            self.pos += 1
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            found = repr(self.peek()) if self.peek() else 'end of message'
+            self.error(f"expected {char!r}, found {found}")
+        self.pos += 1
+
+    def parse(self) -> List[Element]:
+        elements = self.parse_message(in_plural=False, close_tag=None, nested=False)
+        if self.pos < len(self.message):
+            self.error("unmatched '}'")
+        return elements
+
+    def parse_message(self, in_plural: bool, close_tag: Optional[str], nested: bool) -> List[Element]:
+        elements: List[Element] = []
+        literal: List[str] = []
+
+        def flush():
+            if literal:
+                elements.append(''.join(literal))
+                literal.clear()
+
+        while self.pos < len(self.message):
+            char = self.peek()
+            if char == '{':
+                flush()
+                elements.append(self.parse_argument())
+            elif char == '}':
+                if nested:
+                    break
+                self.error("unmatched '}'")
+            elif char == '#' and in_plural:
+                flush()
+                elements.append([POUND])
+                self.pos += 1
+            elif char == '<' and self.peek(1) == '/':
+                if close_tag is None:
+                    self.error("closing tag without an opening tag")
+                break
+            elif char == '<' and self.peek(1).isalpha():
+                flush()
+                elements.append(self.parse_tag(in_plural))
+            elif char == "'":
+                literal.append(self.parse_apostrophe(in_plural))
+            else:
+                literal.append(char)
+                self.pos += 1
+
+        if close_tag is not None and self.pos >= len(self.message):
+            self.error(f"unclosed tag <{close_tag}>")
+        flush()
+        return elements
+
+    def parse_apostrophe(self, in_plural: bool) -> str:
+        """ICU apostrophe rules: '' is a quote, '{...}' quotes syntax characters"""
+        next_char = self.peek(1)
+        if next_char == "'":
+            self.pos += 2
+            return "'"
+        if next_char in ('{', '}', '<', '>') or (next_char == '#' and in_plural):
+            self.pos += 1
+            quoted = []
+            while self.pos < len(self.message):
+                char = self.peek()
+                if char == "'":
+                    if self.peek(1) == "'":
+                        quoted.append("'")
+                        self.pos += 2
+                        continue
+                    self.pos += 1
+                    break
+                quoted.append(char)
+                self.pos += 1
+            return ''.join(quoted)
+        self.pos += 1
+        return "'"
+
+    def parse_name(self, what: str) -> str:
+        start = self.pos
+        while self.pos < len(self.message) and self.peek() not in NAME_STOP:
+            self.pos += 1
+        if self.pos == start:
+            self.error(f"expected {what}")
+        return self.message[start:self.pos]
+
+    def parse_argument(self) -> list:
+        start = self.pos
+        self.expect('{')
+        self.skip_whitespace()
+        name = self.parse_name('argument name')
+        self.skip_whitespace()
+
+        if self.peek() == '}':
+            self.pos += 1
+            return [ARGUMENT, name]
+        if self.peek() != ',':
+            self.error(f"invalid argument {{{name}...", start)
+        self.pos += 1
+        self.skip_whitespace()
+        arg_type = self.parse_name('argument type')
+        self.skip_whitespace()
+
+        if arg_type in SIMPLE_TYPES:
+            style = None
+            if self.peek() == ',':
+                self.pos += 1
+                style = self.parse_style()
+            self.expect('}')
+            element = [SIMPLE_TYPES[arg_type], name]
+            if style:
+                element.append(style)
+            return element
+
+        if arg_type == 'select' or arg_type in PLURAL_TYPES:
+            self.expect(',')
+            offset = 0
+            self.skip_whitespace()
+            if arg_type == 'plural' and self.message.startswith('offset:', self.pos):
+                self.pos += len('offset:')
+                self.skip_whitespace()
+                digits = self.parse_name('plural offset')
+                if not digits.isdigit():
+                    self.error("plural offset must be an integer")
+                offset = int(digits)
+            options = self.parse_options(in_plural=arg_type != 'select')
+            if 'other' not in options:
+                self.error(f"{arg_type} argument {{{name}}} is missing an 'other' option", start)
+            if arg_type == 'select':
+                return [SELECT, name, options]
+            return [PLURAL, name, options, offset, 1 if PLURAL_TYPES[arg_type] else 0]
+
+        self.error(f"invalid argument type '{arg_type}'", start)
+
+    def parse_style(self) -> str:
+        """Argument style text (e.g. 'currency' or '::percent'), up to the closing brace"""
+        start = self.pos
+        depth = 0
+        while self.pos < len(self.message):
+            char = self.peek()
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                if depth == 0:
+                    break
+                depth -= 1
+            self.pos += 1
+        return self.message[start:self.pos].strip()
+
+    def parse_options(self, in_plural: bool) -> Dict[str, List[Element]]:
+        options: Dict[str, List[Element]] = {}
+        while True:
+            self.skip_whitespace()
+            if self.peek() == '}':
+                self.pos += 1
+                return options
+            if not self.peek():
+                self.error("unterminated argument")
+            selector_start = self.pos
+            if self.peek() == '=':
+                self.pos += 1
+                selector = '=' + self.parse_name('plural value')
+            else:
+                selector = self.parse_name('option selector')
+            if selector in options:
+                self.error(f"duplicate option '{selector}'", selector_start)
+            self.skip_whitespace()
+            self.expect('{')
+            options[selector] = self.parse_message(in_plural=in_plural, close_tag=None, nested=True)
+            self.expect('}')
+
+    def parse_tag(self, in_plural: bool) -> list:
+        self.expect('<')
+        name = self.parse_name('tag name')
+        self.skip_whitespace()
+        if self.message.startswith('/>', self.pos):
+            self.pos += 2
+            return [TAG, name, []]
+        self.expect('>')
+        children = self.parse_message(in_plural=in_plural, close_tag=name, nested=False)
+        closing_start = self.pos
+        self.expect('<')
+        self.expect('/')
+        closing = self.parse_name('closing tag name')
+        if closing != name:
+            self.error(f"mismatched tag: <{name}> closed by </{closing}>", closing_start)
+        self.skip_whitespace()
+        self.expect('>')
+        return [TAG, name, children]
+
+
+def has_syntax(message: str) -> bool:
+    """Fast check for characters that need the parser"""
+    return not SYNTAX_CHARS.isdisjoint(message)
+
+
+def parse_message(message: str) -> List[Element]:
+    """Parse one message into compact AST elements, raising ICUSyntaxError"""
+    return MessageParser(message).parse()
+
+
+def compile_message(message: str) -> Union[str, List[Element]]:
+    """
+    Compile a message: plain strings come back untouched, anything with
+    ICU syntax (or escapes that change its text) becomes an element list.
+    """
+    if not has_syntax(message):
+        return message
+    elements = parse_message(message)
+    if len(elements) == 1 and elements[0] == message:
+        return message
+    return elements
+
+
+def iter_elements(elements: List[Element]):
+    """Yield every non-literal element of an AST, depth first"""
+    for element in elements:
+        if isinstance(element, str):
+            continue
+        yield element
+        kind = element[0]
+        if kind in (SELECT, PLURAL):
+            for branch in element[2].values():
+                yield from iter_elements(branch)
+        elif kind == TAG:
+            yield from iter_elements(element[2])
+
+
+# value hash -> signature (None for invalid ICU), shared by every caller in a process
+_signatures: Dict[str, Optional[Tuple[str, ...]]] = {}
+
+
+def message_signature(message: str) -> Optional[Tuple[str, ...]]:
+    """
+    Sorted distinct interpolation tokens of a message: '{name}' for every
+    argument (whatever its type) and '<tag>' for every rich-text tag. Plural
+    and select branches are walked but their option keys are not part of the
+    signature, since plural categories differ between locales. Returns None
+    for invalid ICU. Messages are parsed once per distinct value.
+    """
+    if not has_syntax(message):
+        return ()
+    digest = value_hash(message)
+    if digest in _signatures:
+        return _signatures[digest]
+    try:
+        compiled = compile_message(message)
+    except ICUSyntaxError:
+        signature = None
+    else:
+        tokens = set()
+        if not isinstance(compiled, str):
+            for element in iter_elements(compiled):
+                if element[0] == TAG:
+                    tokens.add(f"<{element[1]}>")
+                elif element[0] != POUND:
+                    tokens.add(f"{{{element[1]}}}")
+        signature = tuple(sorted(tokens))
+    _signatures[digest] = signature
+    return signature
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Character trigram language identifier for catalog values
+Profiles are trained from our own en/fr/nl catalogs (values that differ
+from English, without review markers) and serialized to
+.i18n-build/langid-profiles.json, so scoring only loads a few thousand
+log-probabilities per language and never retrains unless a catalog changed.
+"""
+
+import json
+import math
+import re
+from collections import Counter
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from i18n_catalog import (
+    AUTO_TRANSLATED_MARKER,
+    BUILD_DIR,
+    LOCALES,
+    MESSAGES_DIR,
+    SOURCE_LOCALE,
+    TRANSLATE_MARKER,
+    align_catalogs,
+    fingerprint,
+    load_catalogs,
+    value_hash,
+    write_if_changed,
+)
+
+PROFILES_FILE = BUILD_DIR / "langid-profiles.json"
+# Bump when normalization or the profile format changes
+PROFILES_VERSION = 1
+# Most frequent trigrams kept per language
+PROFILE_SIZE = 4000
+
+# Fixed-point scale of log-probabilities and width of each packed language lane
+PRECISION = 1000
+LANE_BITS = 40
+LANE_MASK = (1 << LANE_BITS) - 1
+MAX_TRIGRAMS = 1 << 16
+
+# ICU arguments, tags, URLs and review markers carry no language signal
+NOISE = re.compile(
+    rf"\{{[^{{}}]*\}}|<[^<>]*>|https?://\S+|{re.escape(AUTO_TRANSLATED_MARKER)}|{re.escape(TRANSLATE_MARKER)}"
+)
+NON_LETTERS = re.compile(r"[^a-zà-öø-ÿœæ'’]+")
+
+
+def normalize(value: str) -> str:
+    """Lowercased letters and single spaces, padded so word edges form trigrams"""
+    text = NON_LETTERS.sub(' ', NOISE.sub(' ', value).lower()).strip()
+    return f" {text} " if text else ''
+
+
+def trigrams(text: str) -> List[str]:
+    """Overlapping character trigrams of a normalized value"""
+    return list(map(''.join, zip(text, text[1:], text[2:])))
+
+
+class LanguageIdentifier:
+    """
+    Scores are summed in fixed point with every language packed into its own
+    LANE_BITS-wide lane of one int, so each trigram costs a single dict lookup
+    instead of one per language.
+    """
+
+    def __init__(self, profiles: Dict[str, Dict], source_fingerprint: str = ''):
+        self.profiles = profiles
+        self.languages = list(profiles)
+        self.source_fingerprint = source_fingerprint
+        self.cache: Dict[str, Optional[Tuple[str, float, int]]] = {}
+
+        floors = [self.fixed(profiles[lang]['floor']) for lang in self.languages]
+        self.floor = self.pack(floors)
+        self.table: Dict[str, int] = {}
+        grams = set().union(*(profiles[lang]['grams'] for lang in self.languages))
+        for gram in grams:
+            costs = [self.fixed(profiles[lang]['grams'][gram]) if gram in profiles[lang]['grams'] else floor
+                     for lang, floor in zip(self.languages, floors)]
+            self.table[gram] = self.pack(costs)
+
+    @staticmethod
+    def fixed(log_prob: float) -> int:
+        """Non-negative fixed-point cost of a log-probability"""
+        return round(-log_prob * PRECISION)
+
+    @staticmethod
+    def pack(costs: List[int]) -> int:
+        packed = 0
+        for i, cost in enumerate(costs):
+            packed |= cost << (i * LANE_BITS)
+        return packed
+
+    def score(self, text: str) -> Optional[List[float]]:
+        """Log-likelihood of a normalized value under each language profile"""
+        grams = trigrams(text)
+        if not grams:
+            return None
+        # Lanes cannot carry into each other below MAX_TRIGRAMS trigrams
+        grams = grams[:MAX_TRIGRAMS]
+        total = sum(map(self.table.get, grams, repeat(self.floor)))
+        return [-((total >> (i * LANE_BITS)) & LANE_MASK) / PRECISION
+                for i in range(len(self.languages))]
+
+    def identify(self, value: str) -> Optional[Tuple[str, float, int]]:
+        """(language, confidence, letters scored) for a raw value, None when it has no letters"""
+        if value in self.cache:
+            return self.cache[value]
+        text = normalize(value)
+        result = None
+        if text:
+            scores = self.score(text)
+            best = max(scores)
+            # Posterior under a uniform prior, computed relative to the best score
+            weights = [math.exp(s - best) for s in scores]
+            index = scores.index(best)
+            result = (self.languages[index], weights[index] / sum(weights), len(text) - 2)
+        self.cache[value] = result
+        return result
+
+    def identify_batch(self, values: Iterable[str]) -> Dict[str, Optional[Tuple[str, float, int]]]:
+        """Identify distinct values once each"""
+        return {value: self.identify(value) for value in set(values)}
+
+    def to_json(self) -> Dict:
+        return {
+            'version': PROFILES_VERSION,
+            'fingerprint': self.source_fingerprint,
+            'profiles': self.profiles,
+        }
+
+
+def training_texts(catalogs: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """
+    Normalized training values per locale. Target values identical to English
+    and values carrying review markers are left out, since they are English.
+    """
+    source = catalogs.get(SOURCE_LOCALE, {})
+    others = [lang for lang in catalogs if lang != SOURCE_LOCALE]
+    _, (en_values, *columns) = align_catalogs(source, [source] + [catalogs[lang] for lang in others])
+
+    texts: Dict[str, List[str]] = {lang: [] for lang in catalogs}
+    for row, en_value in enumerate(en_values):
+        if not isinstance(en_value, str):
+            continue
+        translated = False
+        for lang, column in zip(others, columns):
+            value = column[row]
+            if not isinstance(value, str) or value == en_value:
+                continue
+            if AUTO_TRANSLATED_MARKER in value or TRANSLATE_MARKER in value:
+                continue
+            texts[lang].append(normalize(value))
+            translated = True
+        # English values nobody translated are often brands or code
+        if translated:
+            texts[SOURCE_LOCALE].append(normalize(en_value))
+    return texts
+
+
+def train(catalogs: Dict[str, Dict], profile_size: int = PROFILE_SIZE) -> LanguageIdentifier:
+    """Build trigram log-probability profiles with add-one smoothing"""
+    counts = {lang: Counter(g for text in texts for g in trigrams(text))
+              for lang, texts in training_texts(catalogs).items()}
+    vocabulary = len(set().union(*counts.values())) or 1
+    profiles = {}
+    for lang, counter in counts.items():
+        total = sum(counter.values()) + vocabulary
+        profiles[lang] = {
+            'floor': round(math.log(1 / total), 4),
+            'grams': {g: round(math.log((c + 1) / total), 4) for g, c in counter.most_common(profile_size)},
+        }
+    return LanguageIdentifier(profiles)
+
+
+def catalogs_fingerprint(messages_dir: Path = MESSAGES_DIR, locales: List[str] = LOCALES) -> str:
+    """Fingerprint of the raw catalog files the profiles were trained on"""
+    hashes = {}
+    for lang in locales:
+        file_path = Path(messages_dir) / f"{lang}.json"
+        hashes[lang] = value_hash(file_path.read_text(encoding='utf-8')) if file_path.exists() else None
+    return fingerprint(hashes)
+
+
+def load_identifier(messages_dir: Path = MESSAGES_DIR, locales: List[str] = LOCALES,
+                    profiles_file: Path = PROFILES_FILE, retrain: bool = False) -> LanguageIdentifier:
+    """Serialized profiles when they match the catalogs, otherwise train and save"""
+    profiles_file = Path(profiles_file)
+    current = catalogs_fingerprint(messages_dir, locales)
+    if not retrain and profiles_file.exists():
+        with open(profiles_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == PROFILES_VERSION and data.get('fingerprint') == current:
+            return LanguageIdentifier(data['profiles'], current)
+
+    identifier = train(load_catalogs(messages_dir, locales))
+    identifier.source_fingerprint = current
+    write_if_changed(profiles_file,
+                     json.dumps(identifier.to_json(), ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    return identifier
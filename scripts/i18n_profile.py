@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Phase timing and profiling for the translation scripts
+Off unless the I18N_PROFILE environment variable is set:
+
+    I18N_PROFILE=1 python3 scripts/audit_translations.py           # summary on stderr
+    I18N_PROFILE=trace.json python3 scripts/run_pipeline.py        # + Chrome trace
+
+Work is recorded as spans in one of the phases load, flatten, scan, compare,
+report and write, each with its wall time, CPU time and the peak RSS at its
+end, plus named counters (files, keys, regex evaluations). At exit the
+totals per phase and span are printed to stderr as self time (without the
+time of the spans nested in it, so nothing is counted twice) and, when
+I18N_PROFILE names a file, every span is written as Chrome trace-event JSON
+(chrome://tracing, Perfetto). Disabled, @timed returns the function unchanged and span() is one
+global check returning a shared no-op context.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PHASES = ('load', 'flatten', 'scan', 'compare', 'report', 'write')
+SETTING = os.environ.get('I18N_PROFILE', '').strip()
+ENABLED = SETTING.lower() not in ('', '0', 'false', 'no')
+TRACE_FILE = SETTING if ENABLED and SETTING.lower() not in ('1', 'true', 'yes') else None
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the process so far, in MB"""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    def __init__(self, profiler: 'Profiler', phase: str, name: str, args: Dict):
+        self.profiler = profiler
+        self.phase = phase
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.profiler.open_spans().append(self)
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        stack = self.profiler.open_spans()
+        # Not necessarily the innermost one when a generator holds it open
+        stack.remove(self)
+        if stack:
+            stack[-1].child_wall += wall
+            stack[-1].child_cpu += cpu
+        self.profiler.record(self, wall, cpu)
+        return False
+
+
+class Profiler:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events: List[Dict] = []
+        self.totals: Dict[tuple, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.pid = os.getpid()
+        self.local = threading.local()
+
+    def open_spans(self) -> List[Span]:
+        """Spans entered but not yet exited on this thread, innermost last"""
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def span(self, phase: str, name: Optional[str] = None, **args) -> Span:
+        if phase not in PHASES:
+            raise ValueError(f"unknown phase {phase!r}, expected one of {PHASES}")
+        return Span(self, phase, name or phase, args)
+
+    def record(self, span: Span, wall: float, cpu: float):
+        peak = peak_rss_mb()
+        totals = self.totals.setdefault((span.phase, span.name),
+                                        {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'peak_mb': 0.0})
+        # Self time: nested spans are totalled on their own rows
+        totals['calls'] += 1
+        totals['wall'] += wall - span.child_wall
+        totals['cpu'] += cpu - span.child_cpu
+        totals['peak_mb'] = max(totals['peak_mb'], peak)
+        self.events.append({
+            'name': span.name, 'cat': span.phase, 'ph': 'X',
+            'ts': round((span.wall - self.origin) * 1e6, 1), 'dur': round(wall * 1e6, 1),
+            'pid': self.pid, 'tid': threading.get_ident(),
+            'args': {**span.args, 'cpu_ms': round(cpu * 1000, 3), 'peak_rss_mb': round(peak, 1)},
+        })
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def print_summary(self, out=sys.stderr):
+        elapsed = time.perf_counter() - self.origin
+        print("\n" + "=" * 80, file=out)
+        print(f"PROFILE - {os.path.basename(sys.argv[0])}", file=out)
+        print("=" * 80, file=out)
+        print(f"{'PHASE':8} {'SPAN':32} {'CALLS':>7} {'SELF WALL':>10} {'SELF CPU':>10} {'PEAK RSS':>9}", file=out)
+        print("-" * 80, file=out)
+        for phase in PHASES:
+            for (span_phase, name), totals in sorted(self.totals.items(), key=lambda item: -item[1]['wall']):
+                if span_phase == phase:
+                    print(f"{phase:8} {name[:32]:32} {int(totals['calls']):>7,} {totals['wall'] * 1000:>8.1f}ms "
+                          f"{totals['cpu'] * 1000:>8.1f}ms {totals['peak_mb']:>7.1f}MB", file=out)
+        print("-" * 80, file=out)
+        print(f"{'total':49} {elapsed * 1000:>8.1f}ms {time.process_time() * 1000:>8.1f}ms "
+              f"{peak_rss_mb():>7.1f}MB", file=out)
+        for name, value in sorted(self.counters.items()):
+            print(f"  {name}: {value:,}", file=out)
+
+    def write_trace(self, file_path: str):
+        counters = [{'name': 'counters', 'ph': 'C', 'ts': round((time.perf_counter() - self.origin) * 1e6, 1),
+                     'pid': self.pid, 'tid': threading.get_ident(), 'args': self.counters}]
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid,
+                     'args': {'name': os.path.basename(sys.argv[0])}}]
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': metadata + self.events + counters, 'displayTimeUnit': 'ms'}, f)
+        print(f"💾 Chrome trace saved to: {file_path}", file=sys.stderr)
+
+    def finish(self):
+        self.print_summary()
+        if TRACE_FILE:
+            self.write_trace(TRACE_FILE)
+
+
+_profiler: Optional[Profiler] = None
+if ENABLED:
+    _profiler = Profiler()
+    atexit.register(_profiler.finish)
+
+
+def span(phase: str, name: Optional[str] = None, **args):
+    """Context manager timing a block as part of a phase; a shared no-op when profiling is off"""
+    if _profiler is None:
+        return NULL_SPAN
+    return _profiler.span(phase, name, **args)
+
+
+def count(name: str, n: int = 1):
+    """Add to a named counter (files, keys, regex evaluations, ...)"""
+    if _profiler is not None:
+        _profiler.count(name, n)
+
+
+def timed(phase: str, name: Optional[str] = None):
+    """Decorator timing every call of a function as a span; returns the function itself when profiling is off"""
+    def decorate(fn):
+        if _profiler is None:
+            return fn
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _profiler.span(phase, label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON Lines reports
+An alternative to building a report dict and dumping it with indent=2 at the
+end: every finding is written as one JSON line the moment a check produces
+it (line-buffered, so `tail -f` shows it immediately), framed by a leading
+"run" record and a trailing "summary" record with the counts per check and
+locale. A file without its summary record comes from an interrupted run.
+"""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+REPORT_VERSION = 1
+
+
+class JsonLinesReport:
+    def __init__(self, file_path: Path, tool: str):
+        self.file_path = Path(file_path)
+        self.tool = tool
+        self.counts: Dict[str, Dict[str, int]] = {}
+        self.findings = 0
+        self.started = time.perf_counter()
+        self.file = open(self.file_path, 'w', encoding='utf-8', buffering=1)
+        self.write({'type': 'run', 'tool': tool, 'version': REPORT_VERSION,
+                    'started_at': datetime.now().isoformat()})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # An exception leaves the report without a summary, marking it incomplete
+        if exc_type is None:
+            self.close()
+        else:
+            self.file.close()
+
+    def write(self, record: Dict):
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def finding(self, check: str, locale: Optional[str] = None, **fields):
+        """One finding of a check, e.g. finding('missing_key', 'fr', key='auth.title')"""
+        record = {'type': 'finding', 'check': check}
+        if locale is not None:
+            record['locale'] = locale
+        record.update(fields)
+        self.write(record)
+        by_locale = self.counts.setdefault(check, {})
+        by_locale[locale or '*'] = by_locale.get(locale or '*', 0) + 1
+        self.findings += 1
+
+    def close(self, **summary):
+        """Write the summary record (counts plus any extra fields) and close the file"""
+        if self.file.closed:
+            return
+        self.write({'type': 'summary', 'findings': self.findings, 'counts': self.counts,
+                    'elapsed_seconds': round(time.perf_counter() - self.started, 3), **summary})
+        self.file.close()
+
+
+class Findings:
+    """
+    The findings of one check and locale, as a script's console report uses
+    them (len, slicing, iteration). Each finding goes to the stream the moment
+    it is added. The whole list is only kept when the script also writes a
+    JSON report (keep=True); otherwise just the count and the first `head`
+    findings, so a streaming run holds no result lists and iterating yields
+    only those first findings.
+    """
+
+    def __init__(self, check: str, locale: Optional[str] = None, stream=None,
+                 keep: bool = True, head: int = 20):
+        self.check = check
+        self.locale = locale
+        self.stream = stream
+        self.keep = keep
+        self.head = head
+        self.items: List = []
+        self.total = 0
+
+    def add(self, item, **fields):
+        """One finding: item is what the script keeps, fields what is streamed"""
+        if self.stream is not None:
+            self.stream.finding(self.check, self.locale, **fields)
+        if self.keep or self.total < self.head:
+            self.items.append(item)
+        self.total += 1
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+
+class ReportTee:
+    """Sends every finding to several reports, e.g. a JSON Lines file and the findings database"""
+
+    def __init__(self, reports: List):
+        self.reports = reports
+
+    @property
+    def findings(self) -> int:
+        return self.reports[0].findings
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for report in self.reports:
+            report.__exit__(exc_type, exc, tb)
+
+    def finding(self, check: str, locale: Optional[str] = None, **fields):
+        for report in self.reports:
+            report.finding(check, locale, **fields)
+
+    def close(self, **summary):
+        for report in self.reports:
+            report.close(**summary)
+
+
+def open_report(tool: str, jsonl_path: Optional[Path] = None, db_path: Optional[Path] = None):
+    """
+    The report a tool streams its findings to: a JSON Lines file, a run of the
+    findings database (findings_db.py), both, or None for neither
+    """
+    reports = []
+    if jsonl_path is not None:
+        reports.append(JsonLinesReport(jsonl_path, tool))
+    if db_path is not None:
+        from findings_db import record_run
+        reports.append(record_run(tool, db_path))
+    if len(reports) > 1:
+        return ReportTee(reports)
+    return reports[0] if reports else None
+
+
+def read_report(file_path: Path) -> Iterator[Dict]:
+    """Records of a JSON Lines report, one at a time"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def report_summary(file_path: Path) -> Optional[Dict]:
+    """Summary record of a report, None if the run did not finish"""
+    summary = None
+    for record in read_report(file_path):
+        if record['type'] == 'summary':
+            summary = record
+    return summary
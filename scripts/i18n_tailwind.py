@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+Tailwind class vocabulary for telling CSS class strings from prose
+Builds the set of valid classes from tailwind.config.ts (theme and extend
+sections, following spreads of objects imported from local modules) plus
+Tailwind's core utilities and default scales. The vocabulary is stored
+compactly as shared value scales per utility prefix ('bg' -> colors,
+'px' -> spacing) rather than every prefix x value combination, and cached
+in .i18n-build/ keyed by the config sources. A value counts as CSS only when
+every whitespace token resolves to a class (variants, negatives, opacity
+modifiers and arbitrary values included), so "text-based prompts" is prose,
+and a single bare utility that is also a word ("table", "fixed") is prose too.
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from i18n_catalog import BUILD_DIR, PROJECT_ROOT, fingerprint, load_catalogs, flatten, write_if_changed
+
+TAILWIND_CONFIG = PROJECT_ROOT / "tailwind.config.ts"
+VOCABULARY_FILE = BUILD_DIR / "tailwind-vocabulary.json"
+# Bump when the core tables below change to invalidate the cached vocabulary
+VOCABULARY_VERSION = 2
+
+# Core scales (Tailwind v3 defaults)
+DEFAULT_COLORS = ['slate', 'gray', 'zinc', 'neutral', 'stone', 'red', 'orange', 'amber', 'yellow', 'lime',
+                  'green', 'emerald', 'teal', 'cyan', 'sky', 'blue', 'indigo', 'violet', 'purple', 'fuchsia',
+                  'pink', 'rose']
+SHADES = ['50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950']
+SPECIAL_COLORS = ['inherit', 'current', 'transparent', 'black', 'white']
+SPACING = ['0', 'px', '0.5', '1', '1.5', '2', '2.5', '3', '3.5', '4', '5', '6', '7', '8', '9', '10', '11', '12',
+           '14', '16', '20', '24', '28', '32', '36', '40', '44', '48', '52', '56', '60', '64', '72', '80', '96']
+FRACTIONS = [f"{n}/{d}" for d in (2, 3, 4, 5, 6, 12) for n in range(1, d)] + ['full']
+SIZES = ['auto', 'screen', 'svw', 'lvw', 'dvw', 'svh', 'lvh', 'dvh', 'min', 'max', 'fit']
+TEXT_SIZES = ['xs', 'sm', 'base', 'lg', 'xl', '2xl', '3xl', '4xl', '5xl', '6xl', '7xl', '8xl', '9xl']
+STEPS = [str(n) for n in range(0, 101, 5)]
+CORE_SCALES: Dict[str, List[str]] = {
+    'colors': [f"{c}-{s}" for c in DEFAULT_COLORS for s in SHADES] + SPECIAL_COLORS,
+    'spacing': SPACING,
+    'inset': SPACING + FRACTIONS + ['auto'],
+    'margin': SPACING + ['auto'],
+    'size': SPACING + FRACTIONS + SIZES,
+    'maxWidth': ['none', 'xs', 'sm', 'md', 'lg', 'xl', '2xl', '3xl', '4xl', '5xl', '6xl', '7xl', 'full', 'min',
+                 'max', 'fit', 'prose', 'screen-sm', 'screen-md', 'screen-lg', 'screen-xl', 'screen-2xl'],
+    'fontSize': TEXT_SIZES,
+    'textAlign': ['left', 'center', 'right', 'justify', 'start', 'end', 'wrap', 'nowrap', 'balance', 'pretty',
+                  'ellipsis', 'clip'],
+    'fontWeight': ['thin', 'extralight', 'light', 'normal', 'medium', 'semibold', 'bold', 'extrabold', 'black'],
+    'fontFamily': ['sans', 'serif', 'mono'],
+    'borderRadius': ['none', 'sm', 'md', 'lg', 'xl', '2xl', '3xl', 'full'],
+    'borderWidth': ['0', '2', '4', '8', 'solid', 'dashed', 'dotted', 'double', 'hidden', 'none'],
+    'ringWidth': ['0', '1', '2', '4', '8', 'inset'],
+    'boxShadow': ['sm', 'md', 'lg', 'xl', '2xl', 'inner', 'none'],
+    'opacity': STEPS,
+    'zIndex': ['0', '10', '20', '30', '40', '50', 'auto'],
+    'duration': ['0', '75', '100', '150', '200', '300', '500', '700', '1000'],
+    'ease': ['linear', 'in', 'out', 'in-out'],
+    'animation': ['none', 'spin', 'ping', 'pulse', 'bounce'],
+    'lineHeight': ['none', 'tight', 'snug', 'normal', 'relaxed', 'loose', '3', '4', '5', '6', '7', '8', '9', '10'],
+    'letterSpacing': ['tighter', 'tight', 'normal', 'wide', 'wider', 'widest'],
+    'blur': ['none', 'sm', 'md', 'lg', 'xl', '2xl', '3xl'],
+    'scale': ['0', '50', '75', '90', '95', '100', '105', '110', '125', '150'],
+    'rotate': ['0', '1', '2', '3', '6', '12', '45', '90', '180'],
+    'columns': [str(n) for n in range(1, 13)] + ['none', 'subgrid'],
+    'span': [str(n) for n in range(1, 13)] + ['full'],
+    'order': [str(n) for n in range(1, 13)] + ['first', 'last', 'none'],
+    'lineClamp': ['1', '2', '3', '4', '5', '6', 'none'],
+    'alignment': ['start', 'end', 'center', 'between', 'around', 'evenly', 'stretch', 'baseline', 'normal',
+                  'auto'],
+    'overflow': ['auto', 'hidden', 'clip', 'visible', 'scroll'],
+    'cursor': ['auto', 'default', 'pointer', 'wait', 'text', 'move', 'help', 'not-allowed', 'none', 'grab',
+               'grabbing'],
+    'gradient': ['t', 'tr', 'r', 'br', 'b', 'bl', 'l', 'tl'],
+    'whitespace': ['normal', 'nowrap', 'pre', 'pre-line', 'pre-wrap', 'break-spaces'],
+    'break': ['normal', 'words', 'all', 'keep'],
+    'enterExit': ['0'] + STEPS + ['top', 'bottom', 'left', 'right'],
+}
+# Utility prefix -> scales its values come from
+CORE_FAMILIES: Dict[str, List[str]] = {
+    **{p: ['colors'] for p in ('bg', 'from', 'via', 'to', 'fill', 'stroke', 'outline', 'divide', 'placeholder',
+                               'accent', 'caret', 'decoration')},
+    'text': ['colors', 'fontSize', 'textAlign'],
+    **{p: ['colors', 'borderWidth'] for p in ('border', 'border-x', 'border-y', 'border-t', 'border-r',
+                                              'border-b', 'border-l', 'border-s', 'border-e')},
+    'ring': ['colors', 'ringWidth'],
+    'shadow': ['colors', 'boxShadow'],
+    **{p: ['spacing'] for p in ('p', 'px', 'py', 'pt', 'pr', 'pb', 'pl', 'ps', 'pe', 'gap', 'gap-x', 'gap-y',
+                                'space-x', 'space-y', 'scroll-m', 'scroll-p', 'indent')},
+    **{p: ['margin'] for p in ('m', 'mx', 'my', 'mt', 'mr', 'mb', 'ml', 'ms', 'me')},
+    **{p: ['inset'] for p in ('inset', 'inset-x', 'inset-y', 'top', 'right', 'bottom', 'left', 'start', 'end',
+                              'translate-x', 'translate-y', 'basis')},
+    **{p: ['size'] for p in ('w', 'h', 'size', 'min-w', 'min-h', 'max-h')},
+    'max-w': ['maxWidth'],
+    'font': ['fontWeight', 'fontFamily'],
+    **{p: ['borderRadius'] for p in ('rounded', 'rounded-t', 'rounded-r', 'rounded-b', 'rounded-l', 'rounded-s',
+                                     'rounded-e', 'rounded-tl', 'rounded-tr', 'rounded-br', 'rounded-bl')},
+    'ring-offset': ['colors', 'ringWidth'],
+    'outline-offset': ['ringWidth'],
+    'opacity': ['opacity'],
+    'bg-opacity': ['opacity'],
+    'z': ['zIndex'],
+    'duration': ['duration'],
+    'delay': ['duration'],
+    'ease': ['ease'],
+    'animate': ['animation'],
+    'leading': ['lineHeight'],
+    'tracking': ['letterSpacing'],
+    'blur': ['blur'],
+    'backdrop-blur': ['blur'],
+    'scale': ['scale'],
+    'rotate': ['rotate'],
+    'grid-cols': ['columns'],
+    'grid-rows': ['columns'],
+    'col-span': ['span'],
+    'row-span': ['span'],
+    'order': ['order'],
+    'line-clamp': ['lineClamp'],
+    'justify': ['alignment'],
+    'items': ['alignment'],
+    'content': ['alignment'],
+    'self': ['alignment'],
+    'place-items': ['alignment'],
+    'place-content': ['alignment'],
+    'overflow': ['overflow'],
+    'overflow-x': ['overflow'],
+    'overflow-y': ['overflow'],
+    'cursor': ['cursor'],
+    'bg-gradient-to': ['gradient'],
+    'whitespace': ['whitespace'],
+    'break': ['break'],
+    # tailwindcss-animate
+    **{p: ['enterExit'] for p in ('fade-in', 'fade-out', 'zoom-in', 'zoom-out', 'spin-in', 'spin-out')},
+    **{p: ['spacing', 'inset'] for p in ('slide-in-from-top', 'slide-in-from-bottom', 'slide-in-from-left',
+                                         'slide-in-from-right', 'slide-out-to-top', 'slide-out-to-bottom',
+                                         'slide-out-to-left', 'slide-out-to-right')},
+}
+CORE_UTILITIES = [
+    'block', 'inline-block', 'inline', 'flex', 'inline-flex', 'grid', 'inline-grid', 'hidden', 'contents',
+    'table', 'flow-root', 'flex-row', 'flex-row-reverse', 'flex-col', 'flex-col-reverse', 'flex-wrap',
+    'flex-nowrap', 'flex-1', 'flex-auto', 'flex-initial', 'flex-none', 'grow', 'grow-0', 'shrink', 'shrink-0',
+    'static', 'fixed', 'absolute', 'relative', 'sticky', 'visible', 'invisible', 'collapse', 'isolate',
+    'truncate', 'underline', 'overline', 'no-underline', 'line-through', 'uppercase', 'lowercase', 'capitalize',
+    'normal-case', 'italic', 'not-italic', 'antialiased', 'subpixel-antialiased', 'sr-only', 'not-sr-only',
+    'container', 'group', 'peer', 'transform', 'transition', 'transition-all', 'transition-colors',
+    'transition-opacity', 'transition-shadow', 'transition-transform', 'transition-none', 'border', 'rounded',
+    'shadow', 'ring', 'outline', 'outline-none', 'blur', 'backdrop-blur', 'divide-x', 'divide-y',
+    'pointer-events-none', 'pointer-events-auto', 'select-none', 'select-text', 'select-all', 'select-auto',
+    'list-none', 'list-disc', 'list-decimal', 'list-inside', 'list-outside', 'object-contain', 'object-cover',
+    'object-center', 'aspect-auto', 'aspect-square', 'aspect-video', 'bg-cover', 'bg-contain', 'bg-center',
+    'bg-no-repeat', 'bg-fixed', 'bg-clip-text', 'resize', 'resize-none', 'appearance-none', 'will-change-transform',
+    'mx-auto', 'animate-in', 'animate-out', 'prose', 'prose-sm', 'prose-lg', 'prose-xl', 'prose-2xl',
+    'prose-invert', 'max-w-none',
+]
+CORE_VARIANTS = [
+    'hover', 'focus', 'focus-visible', 'focus-within', 'active', 'visited', 'disabled', 'enabled', 'checked',
+    'required', 'invalid', 'placeholder', 'first', 'last', 'odd', 'even', 'only', 'empty', 'open', 'before',
+    'after', 'file', 'marker', 'selection', 'first-line', 'first-letter', 'dark', 'motion-safe', 'motion-reduce',
+    'print', 'portrait', 'landscape', 'rtl', 'ltr', 'sm', 'md', 'lg', 'xl', '2xl',
+    'group-hover', 'group-focus', 'group-focus-visible', 'group-active', 'peer-hover', 'peer-focus',
+    'peer-checked', 'peer-disabled', 'peer-invalid', 'aria-selected', 'aria-expanded', 'aria-disabled',
+]
+# Theme section -> utility prefixes whose values it provides
+THEME_SECTIONS: Dict[str, List[str]] = {
+    'colors': [p for p, scales in CORE_FAMILIES.items() if 'colors' in scales],
+    'spacing': [p for p, scales in CORE_FAMILIES.items()
+                if {'spacing', 'margin', 'inset', 'size'} & set(scales)],
+    'maxWidth': ['max-w'],
+    'fontSize': ['text'],
+    'fontWeight': ['font'],
+    'fontFamily': ['font'],
+    'borderRadius': [p for p, scales in CORE_FAMILIES.items() if 'borderRadius' in scales],
+    'boxShadow': ['shadow'],
+    'zIndex': ['z'],
+    'lineHeight': ['leading'],
+    'letterSpacing': ['tracking'],
+    'transitionDuration': ['duration', 'delay'],
+    'transitionTimingFunction': ['ease'],
+    'animation': ['animate'],
+    'opacity': ['opacity'],
+}
+
+TOKEN = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"|`(?:\\.|[^`\\])*`)
+  | (?P<spread>\.\.\.)
+  | (?P<word>[A-Za-z_$][\w$]*|\d[\w.]*)
+  | (?P<punct>[{}\[\](),:])
+  | (?P<other>[^\s])
+""", re.VERBOSE | re.DOTALL)
+IMPORT = re.compile(r"""import\s*\{([^}]*)\}\s*from\s*['"](\.[^'"]+)['"]""")
+ARBITRARY = re.compile(r"^\[[^\s\]]+\]$")
+ARBITRARY_PROPERTY = re.compile(r"^\[[a-z-]+:[^\s]+\]$")
+ARBITRARY_VARIANT = re.compile(r"^(?:(?:group|peer)-)?(?:data|aria|supports)?-?\[[^\s]+\]$|^(?:data|aria)-[\w-]+$")
+OPACITY_MODIFIER = re.compile(r"/(?:\d{1,3}|\[[^\s\]]+\])$")
+# A lone class must carry a value, variant, modifier or arbitrary part to
+# count as CSS: bare utilities ('table', 'fixed', 'border') are also words
+STRUCTURED_CLASS = re.compile(r"[-:/\[]")
+
+
+def tokenize(source: str) -> List[Tuple[str, str]]:
+    return [(m.lastgroup, m.group()) for m in TOKEN.finditer(source) if m.lastgroup != 'comment']
+
+
+def unquote(kind: str, text: str) -> str:
+    return text[1:-1] if kind == 'string' else text
+
+
+class ObjectParser:
+    """
+    Reads the keys of a TypeScript object literal. Nested objects are kept,
+    other values become None, and `...name` spreads are recorded under
+    ('...', name) so the caller can resolve them.
+    """
+
+    def __init__(self, source: str):
+        self.tokens = tokenize(source)
+        self.pos = 0
+
+    def find(self, kind: str, text: str, start: int = 0) -> int:
+        for i in range(start, len(self.tokens)):
+            if self.tokens[i] == (kind, text):
+                return i
+        return -1
+
+    def parse_object(self) -> Dict:
+        """Parse the object whose '{' is at the current position"""
+        self.pos += 1
+        result: Dict = {}
+        while self.pos < len(self.tokens):
+            kind, text = self.tokens[self.pos]
+            if text == '}':
+                self.pos += 1
+                return result
+            if text == ',':
+                self.pos += 1
+                continue
+            if kind == 'spread':
+                result[('...', self.tokens[self.pos + 1][1])] = None
+                self.pos += 2
+                continue
+            key = unquote(kind, text)
+            self.pos += 1
+            if self.pos < len(self.tokens) and self.tokens[self.pos][1] == ':':
+                self.pos += 1
+                if self.tokens[self.pos][1] == '{':
+                    result[key] = self.parse_object()
+                    continue
+                self.skip_value()
+            result[key] = None
+        return result
+
+    def skip_value(self):
+        depth = 0
+        while self.pos < len(self.tokens):
+            text = self.tokens[self.pos][1]
+            if depth == 0 and text in ',}':
+                return
+            if text in '{[(':
+                depth += 1
+            elif text in '}])':
+                depth -= 1
+            self.pos += 1
+
+    def object_after(self, index: int) -> Optional[Dict]:
+        """First object literal after a token index (e.g. the one after `theme:`)"""
+        brace = self.find('punct', '{', index)
+        if brace < 0:
+            return None
+        self.pos = brace
+        return self.parse_object()
+
+
+def load_exports(module: Path) -> Dict[str, Dict]:
+    """`export const name = { ... }` objects of a local module"""
+    parser = ObjectParser(module.read_text(encoding='utf-8'))
+    exports = {}
+    for i, (kind, text) in enumerate(parser.tokens[:-2]):
+        if text == 'export' and parser.tokens[i + 1][1] == 'const':
+            name = parser.tokens[i + 2][1]
+            if i + 4 < len(parser.tokens) and parser.tokens[i + 3][1] == '=' and parser.tokens[i + 4][1] == '{':
+                parser.pos = i + 4
+                exports[name] = parser.parse_object()
+    return exports
+
+
+def resolve_spreads(obj: Dict, imports: Dict[str, Dict]) -> Dict:
+    """Inline `...name` spreads of imported objects"""
+    resolved: Dict = {}
+    for key, value in obj.items():
+        if isinstance(key, tuple):
+            resolved.update(resolve_spreads(imports.get(key[1], {}), imports))
+        elif isinstance(value, dict):
+            resolved[key] = resolve_spreads(value, imports)
+        else:
+            resolved[key] = value
+    return resolved
+
+
+def class_names(obj: Dict, prefix: str = '') -> List[str]:
+    """Class suffixes of a theme section: nested keys joined by '-', DEFAULT drops out"""
+    names = []
+    for key, value in obj.items():
+        name = prefix if key == 'DEFAULT' else (f"{prefix}-{key}" if prefix else str(key))
+        if isinstance(value, dict):
+            names.extend(class_names(value, name))
+        elif name:
+            names.append(name)
+    return names
+
+
+def module_file(module: Path) -> Optional[Path]:
+    for candidate in (module.with_suffix('.ts'), module.with_suffix('.js'), module / 'index.ts'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def config_sources(config_file: Path) -> List[Path]:
+    """A tailwind config and the local modules it imports from"""
+    source = config_file.read_text(encoding='utf-8')
+    modules = (module_file((config_file.parent / module).resolve()) for _, module in IMPORT.findall(source))
+    return [config_file] + [module for module in modules if module is not None]
+
+
+def read_theme(config_file: Path) -> Dict:
+    """Theme of a tailwind config with `extend` merged in"""
+    source = config_file.read_text(encoding='utf-8')
+    imports: Dict[str, Dict] = {}
+    for names, module in IMPORT.findall(source):
+        path = module_file((config_file.parent / module).resolve())
+        exports = load_exports(path) if path is not None else {}
+        for name in (n.strip().split(' as ')[-1] for n in names.split(',')):
+            if name in exports:
+                imports[name] = exports[name]
+
+    parser = ObjectParser(source)
+    theme_at = parser.find('word', 'theme')
+    theme = parser.object_after(theme_at) if theme_at >= 0 else None
+    theme = resolve_spreads(theme or {}, imports)
+    extend = theme.pop('extend', None) or {}
+    merged = {section: dict(value) for section, value in theme.items() if isinstance(value, dict)}
+    for section, value in extend.items():
+        if isinstance(value, dict):
+            merged.setdefault(section, {}).update(value)
+    return merged
+
+
+class TailwindVocabulary:
+    """
+    Utilities (standalone classes), value scales and the scales each utility
+    prefix accepts. A token resolves when it is a utility, or splits at some
+    '-' into a known prefix and a value from one of that prefix's scales
+    (or an arbitrary [value]).
+    """
+
+    def __init__(self, utilities: Iterable[str], scales: Dict[str, Iterable[str]],
+                 families: Dict[str, List[str]], variants: Iterable[str]):
+        self.utilities: FrozenSet[str] = frozenset(utilities)
+        self.scales: Dict[str, FrozenSet[str]] = {name: frozenset(values) for name, values in scales.items()}
+        self.families = {prefix: tuple(self.scales[name] for name in names) for prefix, names in families.items()}
+        self.family_names = families
+        self.variants: FrozenSet[str] = frozenset(variants)
+        self.fingerprint: Optional[str] = None
+        self.cache: Dict[str, bool] = {}
+
+    @classmethod
+    def from_config(cls, config_file: Path = TAILWIND_CONFIG) -> 'TailwindVocabulary':
+        theme = read_theme(config_file) if config_file.exists() else {}
+        scales = {name: list(values) for name, values in CORE_SCALES.items()}
+        families = {prefix: list(names) for prefix, names in CORE_FAMILIES.items()}
+        for section, prefixes in THEME_SECTIONS.items():
+            values = class_names(theme.get(section, {}))
+            if not values:
+                continue
+            scale = f"theme.{section}"
+            scales[scale] = values
+            for prefix in prefixes:
+                families.setdefault(prefix, []).append(scale)
+        utilities = list(CORE_UTILITIES)
+        # Keys that map to a bare class (rounded, shadow) through DEFAULT
+        for section in ('borderRadius', 'boxShadow'):
+            if 'DEFAULT' in theme.get(section, {}):
+                utilities.append({'borderRadius': 'rounded', 'boxShadow': 'shadow'}[section])
+        screens = class_names(theme.get('screens', {})) + class_names(theme.get('container', {}).get('screens') or {})
+        return cls(utilities, scales, families, CORE_VARIANTS + screens)
+
+    @classmethod
+    def load(cls, config_file: Path = TAILWIND_CONFIG, cache_file: Path = VOCABULARY_FILE) -> 'TailwindVocabulary':
+        """Vocabulary of a config, rebuilt only when the config or the modules it imports change"""
+        sources = config_sources(config_file) if config_file.exists() else []
+        key = fingerprint({'version': VOCABULARY_VERSION,
+                           'sources': [p.read_text(encoding='utf-8') for p in sources]})
+        if cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('fingerprint') == key:
+                vocabulary = cls(data['utilities'], data['scales'], data['families'], data['variants'])
+                vocabulary.fingerprint = key
+                return vocabulary
+        vocabulary = cls.from_config(config_file)
+        vocabulary.fingerprint = key
+        write_if_changed(cache_file, json.dumps(vocabulary.to_json(key), separators=(',', ':')).encode('utf-8'))
+        return vocabulary
+
+    def to_json(self, key: str) -> Dict:
+        return {
+            'fingerprint': key,
+            'utilities': sorted(self.utilities),
+            'scales': {name: sorted(values) for name, values in self.scales.items()},
+            'families': self.family_names,
+            'variants': sorted(self.variants),
+        }
+
+    def __len__(self) -> int:
+        """Number of distinct classes the vocabulary accepts (variants and arbitrary values aside)"""
+        classes = set(self.utilities)
+        for prefix, scales in self.families.items():
+            for scale in scales:
+                classes.update(f"{prefix}-{value}" for value in scale)
+        return len(classes)
+
+    def is_variant(self, variant: str) -> bool:
+        return variant in self.variants or ARBITRARY_VARIANT.match(variant) is not None
+
+    def is_utility(self, utility: str) -> bool:
+        if utility in self.utilities:
+            return True
+        if ARBITRARY_PROPERTY.match(utility):
+            return True
+        dash = utility.rfind('-')
+        while dash > 0:
+            scales = self.families.get(utility[:dash])
+            if scales is not None:
+                value = utility[dash + 1:]
+                if any(value in scale for scale in scales) or ARBITRARY.match(value):
+                    return True
+            dash = utility.rfind('-', 0, dash)
+        return False
+
+    def is_class(self, token: str) -> bool:
+        """True when a token is a valid class: [variant:]*[!][-]utility[/opacity]"""
+        known = self.cache.get(token)
+        if known is not None:
+            return known
+        *variants, utility = split_variants(token)
+        utility = utility[1:] if utility.startswith('!') else utility
+        utility = utility[1:] if utility.startswith('-') else utility
+        valid = bool(utility) and all(map(self.is_variant, variants)) and (
+            self.is_utility(utility)
+            or (OPACITY_MODIFIER.search(utility) is not None
+                and self.is_utility(OPACITY_MODIFIER.sub('', utility))))
+        self.cache[token] = valid
+        return valid
+
+    def is_css(self, value: str) -> bool:
+        """
+        True when every whitespace token of a value is a class, and the value
+        is either several classes or one class with a '-', ':', '/' or '[...]'
+        """
+        tokens = value.split()
+        if len(tokens) == 1 and STRUCTURED_CLASS.search(tokens[0]) is None:
+            return False
+        return bool(tokens) and all(map(self.is_class, tokens))
+
+    def css_values(self, values: Iterable[str]) -> Set[str]:
+        """The class strings among a batch of values (each distinct value and token checked once)"""
+        return {value for value in set(values) if self.is_css(value)}
+
+
+def split_variants(token: str) -> List[str]:
+    """Split on ':' outside brackets: 'md:data-[state=open]:bg-x' -> ['md', 'data-[state=open]', 'bg-x']"""
+    if '[' not in token:
+        return token.split(':')
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(token):
+        if ch == '[':
+            depth += 1
+        elif ch == ']':
+            depth -= 1
+        elif ch == ':' and depth == 0:
+            parts.append(token[start:i])
+            start = i + 1
+    parts.append(token[start:])
+    return parts
+
+
+_default_vocabulary: Optional[TailwindVocabulary] = None
+
+
+def get_vocabulary() -> TailwindVocabulary:
+    """Process-wide vocabulary of the project's tailwind.config.ts"""
+    global _default_vocabulary
+    if _default_vocabulary is None:
+        _default_vocabulary = TailwindVocabulary.load()
+    return _default_vocabulary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find catalog values that are Tailwind class strings")
+    parser.add_argument('values', nargs='*', help="values to check instead of the catalogs")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    vocabulary = get_vocabulary()
+    print(f"🚀 Tailwind vocabulary: {len(vocabulary):,} classes from {len(vocabulary.families)} prefixes "
+          f"and {len(vocabulary.scales)} scales ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    if args.values:
+        for value in args.values:
+            print(f"  {'CSS  ' if vocabulary.is_css(value) else 'text '} {value}")
+        return
+
+    values = [value for catalog in load_catalogs().values()
+              for value in flatten(catalog).values() if isinstance(value, str)]
+    start = time.perf_counter()
+    css = vocabulary.css_values(values)
+    elapsed = time.perf_counter() - start
+    print(f"\n📊 {len(css)} CSS class strings among {len(set(values)):,} distinct values "
+          f"({len(vocabulary.cache):,} distinct tokens, {elapsed * 1000:.0f} ms)")
+    for value in sorted(css):
+        print(f"  {value}")
+
+
+if __name__ == "__main__":
+    main()
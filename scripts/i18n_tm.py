@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Translation memory built from existing en -> fr/nl catalog pairs
+Exact lookups go through a dict of normalized sources; fuzzy lookups use a
+character trigram inverted index with prefix filtering on both sides, and
+the few candidates it yields are scored exactly (Dice coefficient over
+trigram sets).
+"""
+
+import math
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from i18n_catalog import (
+    AUTO_TRANSLATED_MARKER,
+    SOURCE_LOCALE,
+    TRANSLATE_MARKER,
+    align_catalogs,
+)
+
+WHITESPACE = re.compile(r'\s+')
+# Minimum Dice similarity of a fuzzy match
+MIN_SCORE = 0.75
+# Keeps float rounding from tightening the overlap and size bounds
+EPSILON = 1e-9
+# Postings pack (size-ordered position, offset within the source's prefix)
+OFFSET_BITS = 16
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+
+class Segment(NamedTuple):
+    source: str
+    target: str
+    key: str
+
+
+class Match(NamedTuple):
+    score: float
+    source: str
+    target: str
+    key: str
+
+
+def prefix_length(count: int, min_score: float, size: Optional[int] = None) -> int:
+    """
+    How many of the rarest grams must be probed. Any set with Dice >= min_score
+    against a set of `size` grams shares at least min_score * size / (2 - min_score)
+    of them; `count` of those grams are candidates for sharing.
+    """
+    size = count if size is None else size
+    return count - math.ceil(min_score * size / (2 - min_score) - EPSILON) + 1
+
+
+def normalize(text: str) -> str:
+    """Whitespace-collapsed source text used for exact matching"""
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def trigram_set(text: str) -> frozenset:
+    """Distinct lowercase character trigrams, padded so short strings still get grams"""
+    padded = f"  {text.lower()} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TranslationMemory:
+    """
+    Sources are indexed by the rarest part of their trigram set only: with every
+    set ordered by global gram frequency, two sets sharing at least k grams
+    must share one within the first (size - k + 1) of each (prefix filtering).
+    Posting lists hold positions in size order, so the length filter is a
+    bisect per list. They are rebuilt lazily after additions, for the lowest
+    score fuzzy lookups will accept.
+    """
+
+    def __init__(self, min_score: float = MIN_SCORE):
+        self.min_score = min_score
+        self.segments: List[Segment] = []
+        self.grams: List[frozenset] = []
+        self.exact: Dict[str, List[int]] = {}
+        self.rank: Dict[str, int] = {}
+        self.by_size: List[int] = []
+        self.sized_grams: List[frozenset] = []
+        self.sizes: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+        self.dirty = False
+
+    def add(self, source: str, target: str, key: str = ''):
+        """Add one source/target pair to the memory"""
+        normalized = normalize(source)
+        self.exact.setdefault(normalized, []).append(len(self.segments))
+        self.segments.append(Segment(source, target, key))
+        self.grams.append(trigram_set(normalized))
+        self.dirty = True
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def build_index(self):
+        """Order grams by frequency and index the prefix of every source"""
+        frequency = Counter(g for grams in self.grams for g in grams)
+        self.rank = {g: i for i, (g, _) in enumerate(sorted(frequency.items(), key=lambda item: (item[1], item[0])))}
+        self.by_size = sorted(range(len(self.grams)), key=lambda i: len(self.grams[i]))
+        self.sized_grams = [self.grams[i] for i in self.by_size]
+        self.sizes = [len(grams) for grams in self.sized_grams]
+        self.postings = {}
+        for position, index in enumerate(self.by_size):
+            ordered = sorted(self.grams[index], key=self.rank.__getitem__)
+            for offset, gram in enumerate(ordered[:prefix_length(len(ordered), self.min_score)]):
+                entry = position << OFFSET_BITS | offset
+                postings = self.postings.get(gram)
+                if postings is None:
+                    self.postings[gram] = [entry]
+                else:
+                    postings.append(entry)
+        self.dirty = False
+
+    def lookup_exact(self, source: str) -> Optional[Match]:
+        """Most frequent translation of an identical source, if any"""
+        indexes = self.exact.get(normalize(source))
+        if not indexes:
+            return None
+        targets = Counter(self.segments[i].target for i in indexes)
+        target = targets.most_common(1)[0][0]
+        segment = next(self.segments[i] for i in indexes if self.segments[i].target == target)
+        return Match(1.0, segment.source, segment.target, segment.key)
+
+    def lookup_fuzzy(self, source: str, min_score: Optional[float] = None, limit: int = 3) -> List[Match]:
+        """Best matches with Dice similarity >= min_score, highest first"""
+        min_score = self.min_score if min_score is None else min_score
+        if min_score < self.min_score:
+            raise ValueError(f"index was built for scores >= {self.min_score}")
+        if self.dirty:
+            self.build_index()
+
+        query = trigram_set(normalize(source))
+        size = len(query)
+        # Grams no source contains cannot be shared, but still count towards size
+        known = sorted((g for g in query if g in self.rank), key=self.rank.__getitem__)
+        prefix = prefix_length(len(known), min_score, size)
+        if prefix <= 0:
+            return []
+
+        # Only sources whose size allows a match: min_size <= len <= max_size
+        low = bisect_left(self.sizes, math.ceil(min_score * size / (2 - min_score) - EPSILON))
+        high = bisect_right(self.sizes, math.floor((2 - min_score) * size / min_score + EPSILON))
+        low <<= OFFSET_BITS
+        high <<= OFFSET_BITS
+        sizes = self.sizes
+        required: Dict[int, int] = {}
+        counts: Dict[int, int] = {}
+        for i, gram in enumerate(known[:prefix]):
+            postings = self.postings.get(gram)
+            if not postings:
+                continue
+            remaining = len(known) - i - 1
+            for entry in postings[bisect_left(postings, low):bisect_left(postings, high)]:
+                position = entry >> OFFSET_BITS
+                count = counts.get(position, 0)
+                if count < 0:
+                    continue
+                other = sizes[position]
+                needed = required.get(other)
+                if needed is None:
+                    needed = required[other] = math.ceil(min_score * (size + other) / 2 - EPSILON)
+                # Positional filter: grams after this one in either set bound the overlap
+                rest = other - (entry & OFFSET_MASK) - 1
+                if count + 1 + (remaining if remaining < rest else rest) >= needed:
+                    counts[position] = count + 1
+                else:
+                    counts[position] = -1
+
+        positions = [position for position, count in counts.items() if count > 0]
+        if not positions:
+            return []
+        # Overlaps are computed in bulk (C-level map over the candidate gram sets)
+        overlaps = map(len, map(query.intersection, map(self.sized_grams.__getitem__, positions)))
+        scored = {}
+        for position, overlap in zip(positions, overlaps):
+            score = 2 * overlap / (size + self.sizes[position])
+            if score < min_score:
+                continue
+            index = self.by_size[position]
+            segment = self.segments[index]
+            # Keep one match per distinct translation
+            if segment.target not in scored or score > scored[segment.target].score:
+                scored[segment.target] = Match(round(score, 3), segment.source, segment.target, segment.key)
+        return sorted(scored.values(), key=lambda m: (-m.score, m.key))[:limit]
+
+    def lookup(self, source: str, min_score: Optional[float] = None, limit: int = 3) -> List[Match]:
+        """Exact match when there is one, fuzzy matches otherwise"""
+        exact = self.lookup_exact(source)
+        if exact is not None:
+            return [exact]
+        return self.lookup_fuzzy(source, min_score, limit)
+
+
+def is_translated_pair(source, target) -> bool:
+    """True for a string pair that holds a real translation"""
+    if not isinstance(source, str) or not isinstance(target, str):
+        return False
+    if not target.strip() or target == source:
+        return False
+    return AUTO_TRANSLATED_MARKER not in target and TRANSLATE_MARKER not in target
+
+
+def iter_pairs(catalogs: Dict[str, Dict], lang: str) -> Iterable[Tuple[str, str, str]]:
+    """(key, source, target) for every translated leaf of one locale"""
+    source_catalog = catalogs[SOURCE_LOCALE]
+    keys, (sources, targets) = align_catalogs(source_catalog, [source_catalog, catalogs.get(lang, {})])
+    for key, source, target in zip(keys, sources, targets):
+        if is_translated_pair(source, target):
+            yield key, source, target
+
+
+def build_memory(catalogs: Dict[str, Dict], lang: str) -> TranslationMemory:
+    """Translation memory of every existing en -> lang pair"""
+    memory = TranslationMemory()
+    for key, source, target in iter_pairs(catalogs, lang):
+        memory.add(source, target, key)
+    return memory
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Static translation usage scanner for the Next.js source tree
+Resolves useTranslations/getTranslations bindings and t('key') calls to full
+catalog keys, and follows local imports to find the keys each route uses.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from i18n_catalog import PROJECT_ROOT
+from i18n_profile import timed
+
+SRC_DIR = PROJECT_ROOT / "src"
+APP_DIR = SRC_DIR / "app"
+
+# const t = useTranslations('ns') / const tCommon = await getTranslations('common')
+BINDING_PATTERN = re.compile(
+    r"\b(?:const|let|var)\s+(\w+)\s*=\s*(?:await\s+)?(?:useTranslations|getTranslations)"
+    r"\(\s*(?:['\"]([^'\"]*)['\"])?\s*\)"
+)
+IMPORT_PATTERN = re.compile(r"""(?:import|export)\s[^'"]*?from\s+['"]([^'"]+)['"]""")
+SOURCE_SUFFIXES = ['.tsx', '.ts', '/index.tsx', '/index.ts']
+
+
+def call_pattern(binding: str) -> re.Pattern:
+    """Match t('key'), t.rich('key'), t.raw('key') and t.markup('key') for a binding"""
+    return re.compile(
+        rf"(?<![\w.]){re.escape(binding)}(?:\.(?:rich|raw|markup|has))?\(\s*['\"]([^'\"]+)['\"]"
+    )
+
+
+def scan_file_keys(content: str) -> Set[str]:
+    """Return the full catalog keys statically referenced in one source file"""
+    keys = set()
+    for binding, namespace in BINDING_PATTERN.findall(content):
+        for key in call_pattern(binding).findall(content):
+            keys.add(f"{namespace}.{key}" if namespace else key)
+    return keys
+
+
+class UsageScanner:
+    def __init__(self, src_dir: Path = SRC_DIR):
+        self.src_dir = Path(src_dir)
+        self.file_keys: Dict[Path, Set[str]] = {}
+        self.file_imports: Dict[Path, List[Path]] = {}
+
+    def resolve_import(self, importer: Path, specifier: str) -> Optional[Path]:
+        """Resolve '@/...' and relative imports to a source file"""
+        if specifier.startswith('@/'):
+            base = self.src_dir / specifier[2:]
+        elif specifier.startswith('.'):
+            base = (importer.parent / specifier).resolve()
+        else:
+            return None
+        if base.is_file():
+            return base
+        for suffix in SOURCE_SUFFIXES:
+            candidate = Path(str(base) + suffix)
+            if candidate.is_file():
+                return candidate
+        return None
+
+    @timed('scan')
+    def scan(self, file_path: Path):
+        """Scan one file once, caching its keys and local imports"""
+        if file_path in self.file_keys:
+            return
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"⚠ Error reading {file_path}: {e}")
+            content = ''
+        self.file_keys[file_path] = scan_file_keys(content)
+        imports = []
+        for specifier in IMPORT_PATTERN.findall(content):
+            resolved = self.resolve_import(file_path, specifier)
+            if resolved is not None:
+                imports.append(resolved)
+        self.file_imports[file_path] = imports
+
+    def reachable_keys(self, entry: Path) -> Set[str]:
+        """Keys used by a file and everything it imports locally"""
+        keys = set()
+        seen = set()
+        stack = [entry.resolve()]
+        while stack:
+            file_path = stack.pop()
+            if file_path in seen:
+                continue
+            seen.add(file_path)
+            self.scan(file_path)
+            keys |= self.file_keys[file_path]
+            stack.extend(self.file_imports[file_path])
+        return keys
+
+    def route_keys(self, app_dir: Path = APP_DIR) -> Dict[str, Set[str]]:
+        """Statically used keys for every page route under src/app"""
+        routes = {}
+        for page in sorted(Path(app_dir).rglob('page.tsx')):
+            route = '/' + str(page.parent.relative_to(app_dir)).replace('\\', '/')
+            routes['/' if route == '/.' else route] = self.reachable_keys(page)
+        return routes
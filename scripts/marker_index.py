@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Machine-translation marker index
+Records every [AUTO-TRANSLATED] / [TRANSLATE] marker of the live catalogs in
+.i18n-build/markers.sqlite3, keyed by locale and key, with the marker type,
+the English source hash, when it was introduced and when it was resolved.
+The writers (fix_translations.py, generate_translations.py) sync it after
+saving a catalog, so "pending markers per namespace" or "pending for more
+than 30 days" are index lookups instead of substring scans of every value.
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from i18n_catalog import (
+    AUTO_TRANSLATED_MARKER,
+    BUILD_DIR,
+    LOCALES,
+    MESSAGES_DIR,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    TRANSLATE_MARKER,
+    GitObjectReader,
+    align_catalogs,
+    catalog_log,
+    git,
+    load_catalogs,
+    namespace_of,
+    value_hash,
+)
+from i18n_profile import timed
+
+DB_FILE = BUILD_DIR / "markers.sqlite3"
+SCHEMA_VERSION = 1
+MARKERS = (AUTO_TRANSLATED_MARKER, TRANSLATE_MARKER)
+DAY = 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS markers (
+    id INTEGER PRIMARY KEY,
+    locale TEXT NOT NULL,
+    key TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    marker TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    introduced_at INTEGER NOT NULL,
+    introduced_commit TEXT,
+    resolved_at INTEGER,
+    resolved_commit TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS markers_pending ON markers (locale, key) WHERE resolved_at IS NULL;
+CREATE INDEX IF NOT EXISTS markers_namespace ON markers (locale, namespace) WHERE resolved_at IS NULL;
+CREATE INDEX IF NOT EXISTS markers_age ON markers (introduced_at) WHERE resolved_at IS NULL;
+"""
+
+# key -> (marker, source hash)
+MarkerMap = Dict[str, Tuple[str, str]]
+
+
+def marker_of(value) -> Optional[str]:
+    """The machine-translation marker a catalog value carries, if any"""
+    if isinstance(value, str):
+        for marker in MARKERS:
+            if marker in value:
+                return marker
+    return None
+
+
+def scan_markers(catalogs: Dict[str, Dict], locales: Iterable[str]) -> Dict[str, MarkerMap]:
+    """Per locale: every marked key with its marker and English source hash"""
+    locales = [lang for lang in locales if lang != SOURCE_LOCALE and lang in catalogs]
+    source = catalogs.get(SOURCE_LOCALE, {})
+    keys, (sources, *columns) = align_catalogs(source, [source] + [catalogs[lang] for lang in locales])
+    found: Dict[str, MarkerMap] = {lang: {} for lang in locales}
+    for lang, column in zip(locales, columns):
+        markers = found[lang]
+        for key, en_value, value in zip(keys, sources, column):
+            marker = marker_of(value)
+            if marker is not None:
+                markers[key] = (marker, value_hash(en_value if isinstance(en_value, str) else ''))
+    return found
+
+
+class MarkerIndex:
+    def __init__(self, db_path: Path = DB_FILE, readonly: bool = False):
+        self.db_path = Path(db_path)
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            self.conn.commit()
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Updates
+
+    @timed('compare')
+    def sync(self, catalogs: Dict[str, Dict], locales: Iterable[str] = TARGET_LOCALES,
+             commit: Optional[str] = None, timestamp: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Bring the pending markers of some locales in line with their catalogs:
+        new markers are introduced, vanished ones resolved, and a marker whose
+        type or English source changed is resolved and introduced again.
+        """
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        changes = {}
+        with self.conn:
+            for lang, current in scan_markers(catalogs, locales).items():
+                pending = {row['key']: (row['marker'], row['source_hash']) for row in self.conn.execute(
+                    "SELECT key, marker, source_hash FROM markers WHERE locale = ? AND resolved_at IS NULL",
+                    (lang,))}
+                resolved = [key for key, entry in pending.items() if current.get(key) != entry]
+                introduced = [key for key, entry in current.items() if pending.get(key) != entry]
+                self.conn.executemany(
+                    "UPDATE markers SET resolved_at = ?, resolved_commit = ? "
+                    "WHERE locale = ? AND key = ? AND resolved_at IS NULL",
+                    ((timestamp, commit, lang, key) for key in resolved))
+                self.conn.executemany(
+                    "INSERT INTO markers (locale, key, namespace, marker, source_hash, introduced_at, introduced_commit) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((lang, key, namespace_of(key), *current[key], timestamp, commit) for key in introduced))
+                changes[lang] = {'introduced': len(introduced), 'resolved': len(resolved), 'pending': len(current)}
+        return changes
+
+    def backfill(self, messages_dir: Path = MESSAGES_DIR, locales: List[str] = LOCALES) -> Dict[str, Dict[str, int]]:
+        """
+        Replay the catalogs of every commit that touched them, oldest first
+        along first parents, then the working tree. Blobs are read through one
+        `git cat-file --batch` process, each distinct blob is parsed once, and
+        a locale is only re-synced when its catalog or the English one changed.
+        """
+        targets = [lang for lang in locales if lang != SOURCE_LOCALE]
+        totals = {lang: {'introduced': 0, 'resolved': 0, 'pending': 0} for lang in targets}
+
+        def add(changes: Dict[str, Dict[str, int]]):
+            for lang, counts in changes.items():
+                totals[lang]['introduced'] += counts['introduced']
+                totals[lang]['resolved'] += counts['resolved']
+                totals[lang]['pending'] = counts['pending']
+
+        with self.conn:
+            self.conn.execute("DELETE FROM markers")
+        parsed: Dict[str, Dict] = {}
+        previous: Dict[str, Optional[str]] = {}
+        with GitObjectReader() as reader:
+            for commit, timestamp, blobs in catalog_log(messages_dir=messages_dir, locales=locales):
+                catalogs = {}
+                for lang in locales:
+                    blob = blobs.get(lang)
+                    if blob is not None and blob not in parsed:
+                        # Only the latest blob of each locale is needed again
+                        parsed = {b: c for b, c in parsed.items() if b in blobs.values()}
+                        parsed[blob] = reader.read_json(blob)
+                    catalogs[lang] = parsed[blob] if blob is not None else {}
+                source_changed = blobs.get(SOURCE_LOCALE) != previous.get(SOURCE_LOCALE)
+                changed = [lang for lang in targets
+                           if source_changed or blobs.get(lang) != previous.get(lang)]
+                previous = blobs
+                if changed:
+                    add(self.sync(catalogs, changed, commit, timestamp))
+        add(self.sync(load_catalogs(messages_dir, locales), targets))
+        return totals
+
+    # Queries
+
+    def pending(self, locale: Optional[str] = None, namespace: Optional[str] = None,
+                marker: Optional[str] = None, older_than_days: Optional[float] = None,
+                now: Optional[int] = None) -> List[Dict]:
+        """Pending markers, oldest first"""
+        sql = "SELECT * FROM markers WHERE resolved_at IS NULL"
+        params: List = []
+        if locale:
+            sql += " AND locale = ?"
+            params.append(locale)
+        if namespace:
+            sql += " AND namespace = ?"
+            params.append(namespace)
+        if marker:
+            sql += " AND marker = ?"
+            params.append(marker)
+        if older_than_days is not None:
+            sql += " AND introduced_at <= ?"
+            params.append((int(time.time()) if now is None else now) - int(older_than_days * DAY))
+        sql += " ORDER BY introduced_at, locale, key"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def by_namespace(self, locale: Optional[str] = None) -> List[Dict]:
+        """Pending marker counts and oldest introduction per locale and namespace"""
+        sql = ("SELECT locale, namespace, marker, COUNT(*) AS pending, MIN(introduced_at) AS oldest "
+               "FROM markers WHERE resolved_at IS NULL")
+        params: List = []
+        if locale:
+            sql += " AND locale = ?"
+            params.append(locale)
+        sql += " GROUP BY locale, namespace, marker ORDER BY pending DESC, locale, namespace"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def history(self, key: str, locale: str) -> List[Dict]:
+        """Every marker a key has carried, oldest first"""
+        rows = self.conn.execute(
+            "SELECT * FROM markers WHERE locale = ? AND key = ? ORDER BY introduced_at, id", (locale, key))
+        return [dict(row) for row in rows]
+
+    def stats(self) -> List[Dict]:
+        """Pending and resolved counts, and average days to resolution, per locale and marker"""
+        rows = self.conn.execute(
+            "SELECT locale, marker, "
+            "SUM(resolved_at IS NULL) AS pending, SUM(resolved_at IS NOT NULL) AS resolved, "
+            f"AVG(CASE WHEN resolved_at IS NOT NULL THEN (resolved_at - introduced_at) / {DAY}.0 END) "
+            "AS days_to_resolve FROM markers GROUP BY locale, marker ORDER BY locale, marker")
+        return [dict(row) for row in rows]
+
+
+def catalog_commit(messages_dir: Path = MESSAGES_DIR) -> Optional[str]:
+    """HEAD when the catalogs on disk are committed, None for uncommitted changes"""
+    if git('status', '--porcelain', '--', str(messages_dir)):
+        return None
+    return git('rev-parse', 'HEAD')
+
+
+def sync_catalogs(messages_dir: Path = MESSAGES_DIR, locales: List[str] = LOCALES,
+                  db_path: Path = DB_FILE) -> Dict[str, Dict[str, int]]:
+    """Sync the index with the catalogs on disk; called by the scripts that write markers"""
+    with MarkerIndex(db_path) as index:
+        return index.sync(load_catalogs(messages_dir, locales), locales, catalog_commit(messages_dir))
+
+
+def age_days(timestamp: int, now: Optional[int] = None) -> float:
+    return ((int(time.time()) if now is None else now) - timestamp) / DAY
+
+
+def print_query(index: MarkerIndex, args: argparse.Namespace):
+    if args.command == 'pending':
+        rows = index.pending(args.locale, args.namespace, args.marker, args.older_than)
+        if args.json:
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+            return
+        for row in rows:
+            print(f"  [{row['locale']}] {age_days(row['introduced_at']):6.1f}d  {row['marker']:18} {row['key']}")
+        print(f"\n📊 {len(rows)} pending markers")
+    elif args.command == 'namespaces':
+        print(f"{'LOCALE':8} {'NAMESPACE':30} {'MARKER':18} {'PENDING':>8} {'OLDEST':>8}")
+        print("-" * 80)
+        for row in index.by_namespace(args.locale):
+            print(f"{row['locale']:8} {row['namespace']:30} {row['marker']:18} "
+                  f"{row['pending']:>8,} {age_days(row['oldest']):>7.1f}d")
+    elif args.command == 'history':
+        for row in index.history(args.key, args.locale):
+            introduced = time.strftime('%Y-%m-%d', time.localtime(row['introduced_at']))
+            resolved = (time.strftime('%Y-%m-%d', time.localtime(row['resolved_at']))
+                        if row['resolved_at'] else 'pending')
+            print(f"  {introduced} → {resolved:10} {row['marker']:18} source {row['source_hash']}")
+    else:
+        print(f"{'LOCALE':8} {'MARKER':18} {'PENDING':>8} {'RESOLVED':>9} {'DAYS TO RESOLVE':>16}")
+        print("-" * 80)
+        for row in index.stats():
+            days = f"{row['days_to_resolve']:.1f}" if row['days_to_resolve'] is not None else '-'
+            print(f"{row['locale']:8} {row['marker']:18} {row['pending']:>8,} {row['resolved']:>9,} {days:>16}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Machine-translation marker index")
+    parser.add_argument('--db', type=Path, default=DB_FILE, help="SQLite database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('sync', help="index the markers of the current messages/*.json")
+    commands.add_parser('backfill', help="rebuild the index from the catalogs' git history")
+
+    pending = commands.add_parser('pending', help="pending markers, oldest first")
+    pending.add_argument('--locale', choices=TARGET_LOCALES)
+    pending.add_argument('--namespace')
+    pending.add_argument('--marker', choices=MARKERS)
+    pending.add_argument('--older-than', type=float, metavar='DAYS', help="only markers pending this long")
+    pending.add_argument('--json', action='store_true', help="print the rows as JSON")
+
+    namespaces = commands.add_parser('namespaces', help="pending markers per namespace")
+    namespaces.add_argument('--locale', choices=TARGET_LOCALES)
+
+    history = commands.add_parser('history', help="every marker a key has carried")
+    history.add_argument('key')
+    history.add_argument('--locale', choices=TARGET_LOCALES, default=TARGET_LOCALES[0])
+
+    commands.add_parser('stats', help="pending/resolved counts per locale and marker")
+    args = parser.parse_args()
+
+    if args.command == 'sync':
+        changes = sync_catalogs(db_path=args.db)
+    elif args.command == 'backfill':
+        with MarkerIndex(args.db) as index:
+            changes = index.backfill()
+    elif not args.db.exists():
+        print(f"✗ No marker index at {args.db}, run sync or backfill first")
+        return
+    else:
+        with MarkerIndex(args.db, readonly=True) as index:
+            print_query(index, args)
+        return
+
+    for lang, counts in changes.items():
+        print(f"✓ {lang}: {counts['introduced']:,} introduced, {counts['resolved']:,} resolved, "
+              f"{counts['pending']:,} pending")
+    print(f"💾 Marker index: {args.db}")
+
+
+if __name__ == "__main__":
+    main()
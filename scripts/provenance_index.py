@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Per-key provenance index
+For every key of every locale, records the commit that introduced it, the
+commit that last changed its value and, once deleted, the commit that
+removed it, in .i18n-build/provenance.sqlite3. Built by diffing the
+flattened catalogs of consecutive blob versions in git history (read
+through one `git cat-file --batch` process), and updated incrementally from
+the last processed commit; a rewritten history triggers a rebuild.
+Answers "when was this key added to en.json, and was fr updated since?".
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from i18n_catalog import (
+    BUILD_DIR,
+    LOCALES,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    GitObjectReader,
+    catalog_log,
+    flatten,
+    git,
+    namespace_of,
+    value_hash,
+)
+from i18n_profile import timed
+
+DB_FILE = BUILD_DIR / "provenance.sqlite3"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commits (
+    seq INTEGER PRIMARY KEY,
+    sha TEXT NOT NULL UNIQUE,
+    committed_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS provenance (
+    locale TEXT NOT NULL,
+    key TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    value_hash TEXT NOT NULL,
+    introduced_seq INTEGER NOT NULL REFERENCES commits (seq),
+    changed_seq INTEGER NOT NULL REFERENCES commits (seq),
+    removed_seq INTEGER REFERENCES commits (seq),
+    PRIMARY KEY (locale, key)
+);
+CREATE INDEX IF NOT EXISTS provenance_namespace ON provenance (locale, namespace) WHERE removed_seq IS NULL;
+CREATE INDEX IF NOT EXISTS provenance_changed ON provenance (changed_seq);
+"""
+
+ROW_COLUMNS = """
+    p.locale, p.key, p.namespace, p.removed_seq IS NOT NULL AS removed,
+    i.sha AS introduced_commit, i.committed_at AS introduced_at,
+    c.sha AS changed_commit, c.committed_at AS changed_at,
+    r.sha AS removed_commit, r.committed_at AS removed_at
+"""
+ROW_JOINS = """
+    JOIN commits i ON i.seq = p.introduced_seq
+    JOIN commits c ON c.seq = p.changed_seq
+    LEFT JOIN commits r ON r.seq = p.removed_seq
+"""
+
+
+def leaf_hashes(catalog: Dict) -> Dict[str, str]:
+    """Hash of every leaf value of a catalog, by flattened key"""
+    return {key: value_hash(value if isinstance(value, str) else json.dumps(value))
+            for key, value in flatten(catalog).items()}
+
+
+@timed('flatten')
+def changed_leaves(previous: Dict, catalog: Dict) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Leaf hashes of the top-level subtrees that differ between two versions of
+    a catalog, before and after; equal subtrees are skipped with one
+    comparison instead of being flattened
+    """
+    before, after = {}, {}
+    for name in previous.keys() | catalog.keys():
+        old, new = previous.get(name), catalog.get(name)
+        if old == new:
+            continue
+        if old is not None:
+            before.update(leaf_hashes({name: old}))
+        if new is not None:
+            after.update(leaf_hashes({name: new}))
+    return before, after
+
+
+class ProvenanceIndex:
+    def __init__(self, db_path: Path = DB_FILE, readonly: bool = False):
+        self.db_path = Path(db_path)
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            self.conn.commit()
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_meta(self, name: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row['value'] if row else None
+
+    # Updates
+
+    def update(self, locales: List[str] = LOCALES) -> Dict[str, Dict[str, int]]:
+        """
+        Process the catalog commits after the last processed one, oldest
+        first; rebuilds from scratch when that commit is no longer an ancestor
+        of HEAD (rebase, reset)
+        """
+        last_commit = self.get_meta('last_commit')
+        if last_commit and git('merge-base', '--is-ancestor', last_commit, 'HEAD') is None:
+            last_commit = None
+        if last_commit is None:
+            with self.conn:
+                self.conn.execute("DELETE FROM provenance")
+                self.conn.execute("DELETE FROM commits")
+                self.conn.execute("DELETE FROM meta WHERE name IN ('last_commit', 'blobs')")
+
+        blobs: Dict[str, Optional[str]] = json.loads(self.get_meta('blobs') or '{}')
+        seq = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM commits").fetchone()[0]
+        totals = {lang: {'introduced': 0, 'changed': 0, 'removed': 0} for lang in locales}
+        commits = catalog_log(f"{last_commit}..HEAD" if last_commit else None, locales=locales)
+
+        with GitObjectReader() as reader, self.conn:
+            catalogs = {lang: reader.read_json(blobs[lang]) if blobs.get(lang) else {} for lang in locales}
+            for commit, timestamp, commit_blobs in commits:
+                changed = [lang for lang in locales if commit_blobs.get(lang) != blobs.get(lang)]
+                if not changed:
+                    continue
+                seq += 1
+                self.conn.execute("INSERT INTO commits VALUES (?, ?, ?)", (seq, commit, timestamp))
+                for lang in changed:
+                    blob = commit_blobs.get(lang)
+                    catalog = reader.read_json(blob) if blob else {}
+                    previous, current = changed_leaves(catalogs[lang], catalog)
+                    counts = self.apply(lang, previous, current, seq)
+                    for name, count in counts.items():
+                        totals[lang][name] += count
+                    catalogs[lang] = catalog
+                    blobs[lang] = blob
+            if commits:
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_commit', ?)", (commits[-1][0],))
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('blobs', ?)", (json.dumps(blobs),))
+        return totals
+
+    @timed('write')
+    def apply(self, lang: str, previous: Dict[str, str], current: Dict[str, str], seq: int) -> Dict[str, int]:
+        """Record the difference between the leaf hashes of two versions of one catalog (or of their changed parts)"""
+        introduced = [key for key in current if key not in previous]
+        changed = [key for key, digest in current.items() if key in previous and previous[key] != digest]
+        removed = [key for key in previous if key not in current]
+        # A key that comes back after a removal is introduced again
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO provenance (locale, key, namespace, value_hash, introduced_seq, changed_seq) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            ((lang, key, namespace_of(key), current[key], seq, seq) for key in introduced))
+        self.conn.executemany(
+            "UPDATE provenance SET value_hash = ?, changed_seq = ? WHERE locale = ? AND key = ?",
+            ((current[key], seq, lang, key) for key in changed))
+        self.conn.executemany(
+            "UPDATE provenance SET removed_seq = ? WHERE locale = ? AND key = ?",
+            ((seq, lang, key) for key in removed))
+        return {'introduced': len(introduced), 'changed': len(changed), 'removed': len(removed)}
+
+    # Queries
+
+    def key(self, key: str) -> List[Dict]:
+        """Provenance of one key in every locale"""
+        return [dict(row) for row in self.conn.execute(
+            f"SELECT {ROW_COLUMNS} FROM provenance p {ROW_JOINS} WHERE p.key = ? ORDER BY p.locale", (key,))]
+
+    def stale(self, locale: Optional[str] = None, namespace: Optional[str] = None) -> List[Dict]:
+        """Translations last changed before their English source was"""
+        sql = (f"SELECT {ROW_COLUMNS}, ec.sha AS source_changed_commit, ec.committed_at AS source_changed_at "
+               f"FROM provenance p {ROW_JOINS} "
+               "JOIN provenance e ON e.locale = ? AND e.key = p.key AND e.removed_seq IS NULL "
+               "JOIN commits ec ON ec.seq = e.changed_seq "
+               "WHERE p.locale != ? AND p.removed_seq IS NULL AND p.changed_seq < e.changed_seq")
+        params: List = [SOURCE_LOCALE, SOURCE_LOCALE]
+        if locale:
+            sql += " AND p.locale = ?"
+            params.append(locale)
+        if namespace:
+            sql += " AND p.namespace = ?"
+            params.append(namespace)
+        sql += " ORDER BY e.changed_seq DESC, p.key, p.locale"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def recent(self, locale: Optional[str] = None, namespace: Optional[str] = None,
+               limit: int = 20) -> List[Dict]:
+        """Keys most recently introduced or changed"""
+        sql = f"SELECT {ROW_COLUMNS} FROM provenance p {ROW_JOINS} WHERE p.removed_seq IS NULL"
+        params: List = []
+        if locale:
+            sql += " AND p.locale = ?"
+            params.append(locale)
+        if namespace:
+            sql += " AND p.namespace = ?"
+            params.append(namespace)
+        sql += " ORDER BY p.changed_seq DESC, p.key LIMIT ?"
+        return [dict(row) for row in self.conn.execute(sql, params + [limit])]
+
+
+def when(timestamp: Optional[int]) -> str:
+    return time.strftime('%Y-%m-%d', time.localtime(timestamp)) if timestamp else '-'
+
+
+def print_rows(rows: List[Dict]):
+    for row in rows:
+        state = f"removed {when(row['removed_at'])} {row['removed_commit'][:8]}" if row['removed'] else ''
+        print(f"  [{row['locale']}] {row['key']}")
+        print(f"       added {when(row['introduced_at'])} {row['introduced_commit'][:8]}  "
+              f"changed {when(row['changed_at'])} {row['changed_commit'][:8]}  {state}".rstrip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Which commit introduced or last changed each key")
+    parser.add_argument('--db', type=Path, default=DB_FILE, help="SQLite database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('update', help="process the catalog commits since the last update")
+    commands.add_parser('rebuild', help="rebuild the index from all history")
+
+    key = commands.add_parser('key', help="provenance of one key in every locale")
+    key.add_argument('key')
+
+    stale = commands.add_parser('stale', help="translations not updated since their English source changed")
+    stale.add_argument('--locale', choices=TARGET_LOCALES)
+    stale.add_argument('--namespace')
+    stale.add_argument('--json', action='store_true', help="print the rows as JSON")
+
+    recent = commands.add_parser('recent', help="keys most recently introduced or changed")
+    recent.add_argument('--locale', choices=LOCALES)
+    recent.add_argument('--namespace')
+    recent.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    with ProvenanceIndex(args.db) as index:
+        if args.command == 'rebuild':
+            with index.conn:
+                index.conn.execute("DELETE FROM meta WHERE name = 'last_commit'")
+        start = time.perf_counter()
+        totals = index.update()
+        elapsed = time.perf_counter() - start
+        if args.command in ('update', 'rebuild'):
+            for lang, counts in totals.items():
+                print(f"✓ {lang}: {counts['introduced']:,} introduced, {counts['changed']:,} changed, "
+                      f"{counts['removed']:,} removed")
+            print(f"💾 Provenance index: {args.db} (up to {(index.get_meta('last_commit') or '-')[:8]}, "
+                  f"{elapsed * 1000:.0f} ms)")
+        elif args.command == 'key':
+            rows = index.key(args.key)
+            print_rows(rows)
+            if not rows:
+                print(f"✗ {args.key} is not in the catalog history")
+        elif args.command == 'stale':
+            rows = index.stale(args.locale, args.namespace)
+            if args.json:
+                print(json.dumps(rows, indent=2, ensure_ascii=False))
+                return
+            for row in rows:
+                print(f"  [{row['locale']}] {row['key']}: changed {when(row['changed_at'])} "
+                      f"{row['changed_commit'][:8]}, English changed {when(row['source_changed_at'])} "
+                      f"{row['source_changed_commit'][:8]}")
+            print(f"\n📊 {len(rows)} stale translations")
+        else:
+            print_rows(index.recent(args.locale, args.namespace, args.limit))
+
+
+if __name__ == "__main__":
+    main()
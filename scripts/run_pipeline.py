@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+In-process translation pipeline
+Runs audit -> analyze -> examples -> generate in one process over catalogs
+loaded once, handing each stage's result to the next in memory instead of
+through translation-audit-report.json and untranslated_{fr,nl}_prioritized.json.
+The intermediate files are only written with --save-intermediate; a stage
+run without its predecessor reads them from disk as the standalone scripts do.
+Prints the wall time of every stage.
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from typing import Dict, List
+
+import analyze_untranslated
+import show_translation_examples
+from audit_translations import TranslationAuditor
+from generate_translations import TranslationGenerator
+from i18n_catalog import LOCALES, PROJECT_ROOT, load_catalogs
+from i18n_categories import get_classifier
+
+STAGES = ['audit', 'analyze', 'examples', 'generate']
+
+
+class Pipeline:
+    def __init__(self, save_intermediate: bool = False, save_patches: bool = True):
+        self.save_intermediate = save_intermediate
+        self.save_patches = save_patches
+        self.catalogs: Dict[str, Dict] = {}
+        self.report = None
+        self.prioritized = None
+        self.suggestions = None
+        self.timings: List[tuple] = []
+
+    def load(self):
+        self.catalogs = load_catalogs(locales=LOCALES)
+        for lang in LOCALES:
+            print(f"✓ Loaded {lang}.json")
+
+    def audit(self):
+        auditor = TranslationAuditor(str(PROJECT_ROOT), translations=self.catalogs)
+        auditor.scan_tsx_files()
+        self.report = auditor.generate_report(save=self.save_intermediate)
+
+    def analyze(self):
+        report = self.report if self.report is not None else analyze_untranslated.load_report()
+        self.prioritized = analyze_untranslated.generate_priority_list(report, save=self.save_intermediate)
+        get_classifier().save_cache()
+
+    def examples(self):
+        show_translation_examples.show_examples(self.prioritized)
+        show_translation_examples.show_tutorial_examples(self.prioritized)
+        show_translation_examples.show_quick_wins(self.prioritized)
+
+    def generate(self):
+        generator = TranslationGenerator(str(PROJECT_ROOT), translations=self.catalogs,
+                                         untranslated=self.prioritized)
+        self.suggestions = generator.generate_report(save=self.save_patches)
+
+    def run(self, stages: List[str], quiet: bool = False):
+        """Run the selected stages in pipeline order, timing each"""
+        for name in ['load'] + [stage for stage in STAGES if stage in stages]:
+            start = time.perf_counter()
+            if quiet:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    getattr(self, name)()
+            else:
+                getattr(self, name)()
+            self.timings.append((name, time.perf_counter() - start))
+
+    def print_timings(self):
+        print("\n" + "=" * 80)
+        print("PIPELINE TIMINGS")
+        print("=" * 80)
+        total = sum(seconds for _, seconds in self.timings)
+        for name, seconds in self.timings:
+            share = seconds / total * 100 if total else 0
+            print(f"{name:12} {seconds * 1000:>10.1f}ms {share:>6.1f}%")
+        print("-" * 80)
+        print(f"{'total':12} {total * 1000:>10.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the translation audit pipeline in one process")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES,
+                        help="stages to run (default: all)")
+    parser.add_argument('--save-intermediate', action='store_true',
+                        help="also write translation-audit-report.json and untranslated_*_prioritized.json")
+    parser.add_argument('--no-patches', action='store_true',
+                        help="do not write translations_*_patch.json / translations_*_suggestions.json")
+    parser.add_argument('--quiet', action='store_true', help="only print the stage timings")
+    args = parser.parse_args()
+
+    pipeline = Pipeline(save_intermediate=args.save_intermediate, save_patches=not args.no_patches)
+    print("🚀 Starting Translation Pipeline...")
+    pipeline.run(args.stages, quiet=args.quiet)
+    pipeline.print_timings()
+
+    if pipeline.prioritized is not None:
+        for lang, data in pipeline.prioritized.items():
+            summary = data['summary']
+            print(f"{lang.upper()}: {summary['total']} untranslated "
+                  f"({summary['high_priority']} high, {summary['medium_priority']} medium, "
+                  f"{summary['low_priority']} low)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,21 +4,28 @@ Show concrete examples of translations that need work
 """
 
 import json
+from collections import defaultdict
 from pathlib import Path
+from typing import Dict, Optional
+
+from i18n_profile import timed
 
-def load_prioritized(lang):
-    """Load prioritized translations"""
+@timed('load')
+def load_prioritized(lang, prioritized: Optional[Dict[str, Dict]] = None):
+    """Load prioritized translations, from the in-memory analysis when given"""
+    if prioritized is not None:
+        return prioritized[lang]
     file_path = Path(__file__).parent.parent / f"untranslated_{lang}_prioritized.json"
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def show_examples():
+def show_examples(prioritized: Optional[Dict[str, Dict]] = None):
     print("\n" + "=" * 80)
     print("TRANSLATION EXAMPLES - WHAT NEEDS TO BE DONE")
     print("=" * 80)
 
     for lang_code, lang_name in [('fr', 'FRENCH'), ('nl', 'DUTCH')]:
-        data = load_prioritized(lang_code)
+        data = load_prioritized(lang_code, prioritized)
 
         print(f"\n{'=' * 80}")
         print(f"{lang_name} ({lang_code.upper()}) EXAMPLES")
@@ -69,8 +76,8 @@ def show_examples():
     print("SIDE-BY-SIDE COMPARISON")
     print("=" * 80)
 
-    fr_data = load_prioritized('fr')
-    nl_data = load_prioritized('nl')
+    fr_data = load_prioritized('fr', prioritized)
+    nl_data = load_prioritized('nl', prioritized)
 
     print("\nSame keys needing translation in both languages:\n")
 
@@ -89,7 +96,7 @@ def show_examples():
         print(f"   NL: ❌ (needs translation)")
         print()
 
-def show_tutorial_examples():
+def show_tutorial_examples(prioritized: Optional[Dict[str, Dict]] = None):
     """Show specific tutorial translation examples"""
     print("\n" + "=" * 80)
     print("TUTORIAL CONTENT EXAMPLES")
@@ -97,7 +104,7 @@ def show_tutorial_examples():
     print("\nThe 'tutorials' namespace has the most untranslated content.")
     print("Here are some critical tutorial items:\n")
 
-    fr_data = load_prioritized('fr')
+    fr_data = load_prioritized('fr', prioritized)
 
     tutorial_items = [
         item for ns_data in fr_data['by_namespace']
@@ -121,14 +128,14 @@ def show_tutorial_examples():
             value_short = item['value'][:70] + '...' if len(item['value']) > 70 else item['value']
             print(f"  - {key_short}: \"{value_short}\"")
 
-def show_quick_wins():
+def show_quick_wins(prioritized: Optional[Dict[str, Dict]] = None):
     """Show easy quick-win translations"""
     print("\n" + "=" * 80)
     print("QUICK WINS - Easy Translations to Start With")
     print("=" * 80)
 
-    fr_data = load_prioritized('fr')
-    nl_data = load_prioritized('nl')
+    fr_data = load_prioritized('fr', prioritized)
+    nl_data = load_prioritized('nl', prioritized)
 
     quick_wins_fr = [
         item for item in fr_data['categories']['medium_priority']
@@ -148,8 +155,6 @@ def show_quick_wins():
     for i, item in enumerate(quick_wins_nl[:15], 1):
         print(f"{i:2}. {item['key']:50} → \"{item['value']}\"")
 
-from collections import defaultdict
-
 def main():
     show_examples()
     show_tutorial_examples()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Cross-locale string interning and duplicate-value storage report
+Hashes every leaf value of every locale into one string pool in a single
+pass, then reports duplicate groups, bytes wasted by repeated values and
+candidates for consolidation into common.*. Optionally emits pooled
+bundles where each leaf is an index into the shared pool.
+"""
+
+import argparse
+import ast
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from i18n_catalog import (
+    BUILD_DIR,
+    LOCALES,
+    MESSAGES_DIR,
+    PROJECT_ROOT,
+    SOURCE_LOCALE,
+    iter_leaves,
+    load_json,
+    namespace_of,
+    value_hash,
+    write_if_changed,
+)
+from i18n_profile import timed
+
+POOLED_DIR = BUILD_DIR / "pooled"
+COMMON_NAMESPACE = 'common'
+EXTRACTION_SCRIPT = PROJECT_ROOT / "complete-i18n-extraction.py"
+# Keys remembered per pooled value; counts stay exact beyond this
+SAMPLE_KEYS = 5
+
+
+class PoolEntry:
+    __slots__ = ('value', 'size', 'index', 'counts', 'namespaces', 'sample_keys', 'common_key')
+
+    def __init__(self, value: str, index: int):
+        self.value = value
+        self.size = len(value.encode('utf-8'))
+        self.index = index
+        self.counts: Counter = Counter()
+        self.namespaces = set()
+        self.sample_keys: Dict[str, List[str]] = {}
+        self.common_key: Optional[str] = None
+
+    def add(self, lang: str, key: str):
+        self.counts[lang] += 1
+        self.namespaces.add(namespace_of(key))
+        samples = self.sample_keys.setdefault(lang, [])
+        if len(samples) < SAMPLE_KEYS:
+            samples.append(key)
+        if self.common_key is None and lang == SOURCE_LOCALE and key.startswith(COMMON_NAMESPACE + '.'):
+            self.common_key = key
+
+    def wasted(self, lang: str) -> int:
+        """Bytes spent on repeats of this value within one locale"""
+        return max(self.counts[lang] - 1, 0) * self.size
+
+
+class StringPool:
+    def __init__(self):
+        self.entries: Dict[str, PoolEntry] = {}
+        self.leaves = Counter()
+        self.raw_bytes = Counter()
+
+    def intern(self, lang: str, key: str, value: str) -> PoolEntry:
+        digest = value_hash(value)
+        entry = self.entries.get(digest)
+        if entry is None:
+            entry = self.entries[digest] = PoolEntry(value, len(self.entries))
+        entry.add(lang, key)
+        self.leaves[lang] += 1
+        self.raw_bytes[lang] += entry.size
+        return entry
+
+    @timed('scan')
+    def build(self, messages_dir: Path, locales: List[str], emit_dir: Optional[Path] = None):
+        """Single pass over every locale; pooled bundles are written as the pass goes"""
+        for lang in locales:
+            file_path = Path(messages_dir) / f"{lang}.json"
+            if not file_path.exists():
+                print(f"✗ Missing {lang}.json")
+                continue
+            catalog = load_json(file_path)
+            pooled = {} if emit_dir else None
+            for key, value in iter_leaves(catalog):
+                if not isinstance(value, str):
+                    continue
+                entry = self.intern(lang, key, value)
+                if pooled is not None:
+                    pooled[key] = entry.index
+            if pooled is not None:
+                write_if_changed(Path(emit_dir) / f"{lang}.json",
+                                 json.dumps(pooled, separators=(',', ':')).encode('utf-8'))
+            # Drop the parsed catalog before loading the next locale
+            del catalog
+            print(f"✓ Pooled {lang}.json: {self.leaves[lang]:,} leaves")
+
+        if emit_dir:
+            pool = [None] * len(self.entries)
+            for entry in self.entries.values():
+                pool[entry.index] = entry.value
+            write_if_changed(Path(emit_dir) / "strings.json",
+                             json.dumps(pool, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def duplicate_groups(self, lang: str) -> List[PoolEntry]:
+        """Values repeated within a locale, most wasted bytes first"""
+        groups = [e for e in self.entries.values() if e.counts[lang] > 1]
+        groups.sort(key=lambda e: (e.wasted(lang), e.counts[lang]), reverse=True)
+        return groups
+
+    def consolidation_candidates(self, min_count: int) -> List[PoolEntry]:
+        """English values repeated across namespaces that could live in common.*"""
+        candidates = [
+            e for e in self.entries.values()
+            if e.counts[SOURCE_LOCALE] >= min_count and len(e.namespaces - {COMMON_NAMESPACE}) >= 2
+        ]
+        candidates.sort(key=lambda e: e.wasted(SOURCE_LOCALE), reverse=True)
+        return candidates
+
+
+def suggest_common_key(value: str) -> str:
+    """camelCase key suggestion for a new common.* entry"""
+    words = re.findall(r'[A-Za-z0-9]+', value)[:4]
+    if not words:
+        return f"{COMMON_NAMESPACE}.value_{value_hash(value)[:6]}"
+    head, *tail = [w.lower() for w in words]
+    return f"{COMMON_NAMESPACE}." + head + ''.join(w.capitalize() for w in tail)
+
+
+def common_translations_duplicates(script_path: Path = EXTRACTION_SCRIPT) -> Dict[str, Dict[str, List]]:
+    """
+    Find duplicate keys and duplicate values in COMMON_TRANSLATIONS.
+    Parses the source, since duplicate dict keys vanish once the module is imported.
+    """
+    result = {}
+    if not script_path.exists():
+        return result
+    tree = ast.parse(script_path.read_text(encoding='utf-8'))
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)
+                and any(getattr(t, 'id', None) == 'COMMON_TRANSLATIONS' for t in node.targets)):
+            continue
+        for lang_node, mapping in zip(node.value.keys, node.value.values):
+            if not isinstance(mapping, ast.Dict):
+                continue
+            keys = Counter(k.value for k in mapping.keys if isinstance(k, ast.Constant))
+            values: Dict[str, List[str]] = {}
+            for k, v in zip(mapping.keys, mapping.values):
+                if isinstance(k, ast.Constant) and isinstance(v, ast.Constant):
+                    values.setdefault(v.value, [])
+                    if k.value not in values[v.value]:
+                        values[v.value].append(k.value)
+            result[lang_node.value] = {
+                'duplicate_keys': sorted(k for k, count in keys.items() if count > 1),
+                'shared_values': {v: ks for v, ks in values.items() if len(ks) > 1},
+            }
+    return result
+
+
+@timed('report')
+def print_report(pool: StringPool, locales: List[str], min_count: int, top: int) -> Dict:
+    """Print the storage report and return it as a dict"""
+    print("\n" + "=" * 80)
+    print("STRING POOL REPORT")
+    print("=" * 80)
+
+    pool_bytes = sum(e.size for e in pool.entries.values())
+    total_bytes = sum(pool.raw_bytes.values())
+    print(f"\n📊 POOL: {len(pool.entries):,} unique values, {pool_bytes:,} bytes "
+          f"(vs {total_bytes:,} bytes across {sum(pool.leaves.values()):,} leaves)")
+
+    report = {'pool': {'unique_values': len(pool.entries), 'bytes': pool_bytes,
+                       'leaf_bytes': total_bytes}, 'locales': {}}
+
+    for lang in locales:
+        groups = pool.duplicate_groups(lang)
+        wasted = sum(e.wasted(lang) for e in groups)
+        print(f"\n♻️  {lang.upper()}: {len(groups):,} duplicate groups, {wasted:,} bytes wasted")
+        print("-" * 80)
+        for entry in groups[:top]:
+            preview = entry.value[:50] + '...' if len(entry.value) > 50 else entry.value
+            print(f"  {entry.counts[lang]:4}× {entry.wasted(lang):>7,} B  \"{preview}\"")
+            print(f"        e.g. {', '.join(entry.sample_keys[lang][:3])}")
+        report['locales'][lang] = {
+            'leaves': pool.leaves[lang],
+            'duplicate_groups': len(groups),
+            'bytes_wasted': wasted,
+            'groups': [
+                {'value': e.value, 'count': e.counts[lang], 'bytes_wasted': e.wasted(lang),
+                 'sample_keys': e.sample_keys[lang]}
+                for e in groups
+            ],
+        }
+
+    candidates = pool.consolidation_candidates(min_count)
+    print(f"\n📦 CONSOLIDATION CANDIDATES (≥{min_count} uses in ≥2 namespaces)")
+    print("-" * 80)
+    for entry in candidates[:top]:
+        target = entry.common_key or suggest_common_key(entry.value)
+        action = "reuse" if entry.common_key else "add"
+        preview = entry.value[:40] + '...' if len(entry.value) > 40 else entry.value
+        print(f"  {action:5} {target:35} {entry.counts[SOURCE_LOCALE]:3}× \"{preview}\"")
+    report['consolidation_candidates'] = [
+        {'value': e.value, 'count': e.counts[SOURCE_LOCALE], 'namespaces': sorted(e.namespaces),
+         'common_key': e.common_key or suggest_common_key(e.value), 'exists': bool(e.common_key)}
+        for e in candidates
+    ]
+
+    common = common_translations_duplicates()
+    if common:
+        print(f"\n🔁 COMMON_TRANSLATIONS DUPLICATES ({EXTRACTION_SCRIPT.name})")
+        print("-" * 80)
+        for lang, found in common.items():
+            print(f"  {lang.upper()}: {len(found['duplicate_keys'])} duplicate keys, "
+                  f"{len(found['shared_values'])} values shared by several keys")
+            if found['duplicate_keys']:
+                print(f"    keys: {', '.join(found['duplicate_keys'][:10])}"
+                      + (" ..." if len(found['duplicate_keys']) > 10 else ""))
+    report['common_translations'] = common
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="String pool and duplicate-value report")
+    parser.add_argument('--messages', type=Path, default=MESSAGES_DIR, help="catalog directory")
+    parser.add_argument('--min-count', type=int, default=3, help="uses before suggesting common.*")
+    parser.add_argument('--top', type=int, default=15, help="rows to print per section")
+    parser.add_argument('--emit-pooled', action='store_true',
+                        help=f"write pooled bundles to {POOLED_DIR.relative_to(PROJECT_ROOT)}")
+    args = parser.parse_args()
+
+    print("🚀 Building string pool...")
+    pool = StringPool()
+    pool.build(args.messages, LOCALES, emit_dir=POOLED_DIR if args.emit_pooled else None)
+    report = print_report(pool, LOCALES, args.min_count, args.top)
+
+    report_path = PROJECT_ROOT / "string-pool-report.json"
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Detailed report saved to: {report_path}")
+    if args.emit_pooled:
+        print(f"💾 Pooled bundles written to: {POOLED_DIR}")
+
+
+if __name__ == "__main__":
+    main()
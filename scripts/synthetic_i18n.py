@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic catalogs and TSX source trees
+Generates messages/{locale}.json and src/**/*.tsx shaped like this project
+(namespace fan-out, key depth, value lengths, ICU arguments, rich-text tags,
+translation-call density, hardcoded JSX strings) at any size, so the scripts
+can be run at 10x or 100x the real catalog. The same spec and seed always
+produce byte-identical files.
+"""
+
+import argparse
+import json
+import math
+import random
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from i18n_catalog import BUILD_DIR, LOCALES, MESSAGES_DIR, PROJECT_ROOT, SOURCE_LOCALE, fingerprint, flatten
+from i18n_usage import SRC_DIR
+
+SYNTHETIC_DIR = BUILD_DIR / "synthetic"
+SPEC_FILE = "synthetic-spec.json"
+# Bump when the generator changes its output to regenerate existing projects
+GENERATOR_VERSION = 1
+
+# Measured on the real tree: ~79 keys per namespace, 2.6 key segments on
+# average (at most 5), 1.6% of values with arguments, 14.5 t() calls per
+# TSX file with half the files using translations. The English vocabulary
+# grows as 60 * keys^0.47 (Heaps' law) and its 50 most frequent words make
+# up a third of the text.
+KEYS_PER_NAMESPACE = 80
+HEAPS_K = 60
+HEAPS_BETA = 0.47
+CORE_WORD_SHARE = 0.25
+ARGUMENT_RATIO = 0.016
+TAG_RATIO = 0.002
+EXEMPT_RATIO = 0.02
+CALLS_PER_FILE = 14.5
+TRANSLATED_FILES = 0.5
+ROUTE_FILES = 0.2
+UNKNOWN_KEY_RATIO = 0.01
+
+# Parallel word lists: a synthetic translation maps each English word to the
+# word at the same index, so translations keep their length ratio and the
+# glossary terms (prompt, model, template...) get their usual renderings.
+# The long tail is made of generated words with a per-locale ending.
+VOCABULARY = {
+    'en': ['the', 'your', 'new', 'all', 'prompt', 'model', 'template', 'team', 'settings', 'profile',
+           'challenge', 'tutorial', 'collection', 'comment', 'search', 'create', 'save', 'delete',
+           'share', 'learn', 'how', 'to', 'write', 'better', 'answers', 'with', 'examples', 'and',
+           'clear', 'instructions', 'for', 'every', 'task', 'project', 'account', 'results', 'view',
+           'details', 'start', 'free', 'step', 'guide', 'quick', 'advanced', 'library', 'members'],
+    'fr': ['le', 'votre', 'nouveau', 'tous', 'prompt', 'modèle', 'modèle', 'équipe', 'paramètres', 'profil',
+           'défi', 'tutoriel', 'collection', 'commentaire', 'recherche', 'créer', 'enregistrer', 'supprimer',
+           'partager', 'apprendre', 'comment', 'à', 'écrire', 'meilleures', 'réponses', 'avec', 'exemples',
+           'et', 'claires', 'instructions', 'pour', 'chaque', 'tâche', 'projet', 'compte', 'résultats',
+           'voir', 'détails', 'commencer', 'gratuit', 'étape', 'guide', 'rapide', 'avancé', 'bibliothèque',
+           'membres'],
+    'nl': ['de', 'je', 'nieuwe', 'alle', 'prompt', 'model', 'sjabloon', 'team', 'instellingen', 'profiel',
+           'uitdaging', 'tutorial', 'collectie', 'reactie', 'zoeken', 'maken', 'opslaan', 'verwijderen',
+           'delen', 'leren', 'hoe', 'te', 'schrijven', 'betere', 'antwoorden', 'met', 'voorbeelden', 'en',
+           'duidelijke', 'instructies', 'voor', 'elke', 'taak', 'project', 'account', 'resultaten',
+           'bekijken', 'details', 'beginnen', 'gratis', 'stap', 'gids', 'snel', 'geavanceerd', 'bibliotheek',
+           'leden'],
+}
+SEGMENT_WORDS = ['page', 'hero', 'form', 'list', 'card', 'modal', 'nav', 'quiz', 'stats', 'empty',
+                 'errors', 'actions', 'filters', 'table', 'header', 'footer', 'steps', 'tabs', 'menu', 'toast']
+LEAF_WORDS = ['title', 'description', 'label', 'button', 'placeholder', 'subtitle', 'hint', 'error',
+              'success', 'cta', 'heading', 'tooltip', 'option', 'explanation', 'badge', 'link']
+SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'tas', 'vo', 'dri', 'sel', 'pun', 'gor', 'fi', 'bal', 'zu', 'nor', 'te', 'quin']
+TAIL_ENDINGS = {'en': '', 'fr': 'ique', 'nl': 'ing'}
+ARGUMENTS = ['{count}', '{name}', '{date}', '{count, plural, one {# item} other {# items}}']
+EXEMPT_VALUES = ['https://docs.example.com/guide', 'v2.1.0', '100%', 'API', 'GPT-4', 'px-4 py-2 text-sm']
+CLASS_NAMES = ['flex items-center gap-2', 'text-sm text-muted-foreground', 'rounded-lg border p-4',
+               'grid gap-4 md:grid-cols-2', 'font-semibold tracking-tight', 'space-y-2']
+
+
+class SyntheticSpec(NamedTuple):
+    keys: int = 4600
+    depth: int = 5
+    locales: Tuple[str, ...] = tuple(LOCALES)
+    untranslated: float = 0.05
+    missing: float = 0.04
+    files: int = 256
+    calls: float = CALLS_PER_FILE
+    seed: int = 1
+
+    def scaled(self, factor: float) -> 'SyntheticSpec':
+        """Same shape with factor times the keys and source files"""
+        return self._replace(keys=max(1, round(self.keys * factor)), files=max(1, round(self.files * factor)))
+
+
+def current_spec(seed: int = 1) -> SyntheticSpec:
+    """A spec the size of the real project (keys in en.json, TSX files in src/)"""
+    source_file = MESSAGES_DIR / f"{SOURCE_LOCALE}.json"
+    keys = len(flatten(json.loads(source_file.read_text(encoding='utf-8')))) if source_file.exists() else 4600
+    files = sum(1 for _ in SRC_DIR.rglob('*.tsx')) if SRC_DIR.exists() else 256
+    return SyntheticSpec(keys=keys, files=files, seed=seed)
+
+
+def vocabulary_size(keys: int) -> int:
+    """Distinct long-tail words of a catalog of this many keys"""
+    return max(1, int(HEAPS_K * keys ** HEAPS_BETA))
+
+
+def sentence(rng: random.Random, tail: int) -> List[int]:
+    """
+    Word indexes of one English value: mostly short labels, some long
+    explanations. Indexes past the core vocabulary are long-tail words,
+    drawn with a Zipf-like (log-uniform) rank.
+    """
+    core = len(VOCABULARY['en'])
+    length = min(40, max(1, int(rng.lognormvariate(1.5, 0.8))))
+    return [rng.randrange(core) if rng.random() < CORE_WORD_SHARE else core + int(tail ** rng.random()) - 1
+            for _ in range(length)]
+
+
+def word(index: int, lang: str) -> str:
+    core = VOCABULARY['en']
+    if index < len(core):
+        vocabulary = VOCABULARY.get(lang)
+        # Locales without a word list get a pseudo-translation
+        return vocabulary[index] if vocabulary else core[index][::-1]
+    index -= len(core)
+    syllables = [SYLLABLES[index % len(SYLLABLES)]]
+    while index >= len(SYLLABLES):
+        index //= len(SYLLABLES)
+        syllables.append(SYLLABLES[index % len(SYLLABLES)])
+    return ''.join(syllables) + TAIL_ENDINGS.get(lang, lang)
+
+
+def render(words: List[int], lang: str, extra: str = '') -> str:
+    text = ' '.join(word(i, lang) for i in words)
+    text = text[0].upper() + text[1:]
+    return f"{text} {extra}" if extra else text
+
+
+def generate_keys(spec: SyntheticSpec, rng: random.Random) -> List[str]:
+    """Unique dot-separated keys, grouped into namespaces and nested up to spec.depth segments"""
+    namespaces = [f"{rng.choice(SEGMENT_WORDS)}{i}" for i in range(max(1, math.ceil(spec.keys / KEYS_PER_NAMESPACE)))]
+    keys = []
+    for i in range(spec.keys):
+        segments = [rng.choice(namespaces)]
+        # 1 + geometric number of groups: 2.6 segments on average
+        while len(segments) < spec.depth - 1 and rng.random() < (0.38 if len(segments) > 1 else 0.45):
+            segments.append(rng.choice(SEGMENT_WORDS))
+        # Leaves carry a numeric suffix, groups never do: no key is both
+        segments.append(f"{rng.choice(LEAF_WORDS)}_{i}")
+        keys.append('.'.join(segments))
+    return keys
+
+
+def generate_catalogs(spec: SyntheticSpec) -> Dict[str, Dict]:
+    """Nested catalogs of every locale in spec.locales"""
+    rng = random.Random(spec.seed)
+    tail = vocabulary_size(spec.keys)
+    catalogs: Dict[str, Dict] = {lang: {} for lang in spec.locales}
+    for key in generate_keys(spec, rng):
+        roll = rng.random()
+        if roll < EXEMPT_RATIO:
+            values = dict.fromkeys(spec.locales, rng.choice(EXEMPT_VALUES))
+        else:
+            words = sentence(rng, tail)
+            extra = ''
+            if roll < EXEMPT_RATIO + ARGUMENT_RATIO:
+                extra = rng.choice(ARGUMENTS)
+            elif roll < EXEMPT_RATIO + ARGUMENT_RATIO + TAG_RATIO:
+                extra = '<link>' + word(rng.randrange(len(VOCABULARY['en'])), SOURCE_LOCALE) + '</link>'
+            values = {lang: render(words, lang, extra) for lang in spec.locales}
+        *path, leaf = key.split('.')
+        for lang in spec.locales:
+            value = values[lang]
+            if lang != SOURCE_LOCALE:
+                state = rng.random()
+                if state < spec.missing:
+                    continue
+                if state < spec.missing + spec.untranslated:
+                    value = values[SOURCE_LOCALE]
+            node = catalogs[lang]
+            for segment in path:
+                node = node.setdefault(segment, {})
+            node[leaf] = value
+    return catalogs
+
+
+def component_source(name: str, bindings: List[Tuple[str, str, List[str]]], imports: List[str],
+                     rng: random.Random, tail: int) -> str:
+    """One TSX component: local imports, translation bindings, t() calls and some hardcoded JSX text"""
+    lines = ["'use client'", '']
+    if bindings:
+        lines.append("import { useTranslations } from 'next-intl'")
+    lines.append("import { useState } from 'react'")
+    for specifier in imports:
+        lines.append(f"import {{ {specifier.rsplit('/', 1)[-1].title().replace('-', '')} }} from '{specifier}'")
+    lines += ['', f"export function {name}() {{"]
+    for binding, namespace, _ in bindings:
+        lines.append(f"  const {binding} = useTranslations('{namespace}')")
+    lines += ["  const [open, setOpen] = useState(false)", '', '  return (',
+              f'    <div className="{rng.choice(CLASS_NAMES)}">']
+    calls = [(binding, key) for binding, _, keys in bindings for key in keys]
+    rng.shuffle(calls)
+    for binding, key in calls:
+        lines.append(f'      <div className="{rng.choice(CLASS_NAMES)}">')
+        lines.append(f"        <span>{{{binding}('{key}')}}</span>")
+        lines.append('      </div>')
+    # Text the extraction script should find
+    for _ in range(rng.randrange(4)):
+        text = render(sentence(rng, tail), SOURCE_LOCALE)
+        lines.append(f'      <p className="{rng.choice(CLASS_NAMES)}">{text}</p>')
+    if rng.random() < 0.3:
+        lines.append(f'      <input placeholder="{render(sentence(rng, tail), SOURCE_LOCALE)}" />')
+    lines += ['      <button type="button" onClick={() => setOpen(!open)} />', '    </div>', '  )', '}', '']
+    return '\n'.join(lines)
+
+
+def generate_sources(spec: SyntheticSpec, catalog: Dict) -> Dict[str, str]:
+    """{path relative to the project root: TSX source} calling keys of the source catalog"""
+    rng = random.Random(spec.seed + 1)
+    tail = vocabulary_size(spec.keys)
+    by_namespace: Dict[str, List[str]] = {}
+    for key in flatten(catalog):
+        namespace, rest = key.split('.', 1) if '.' in key else ('', key)
+        by_namespace.setdefault(namespace, []).append(rest)
+    namespaces = sorted(by_namespace)
+
+    sources: Dict[str, str] = {}
+    components: List[str] = []
+    for i in range(spec.files):
+        group = SEGMENT_WORDS[i % len(SEGMENT_WORDS)]
+        is_route = rng.random() < ROUTE_FILES
+        path = f"src/app/{group}/route{i}/page.tsx" if is_route else f"src/components/{group}/widget-{i}.tsx"
+
+        bindings = []
+        if rng.random() < TRANSLATED_FILES:
+            calls = max(1, int(rng.expovariate(1 / (spec.calls / TRANSLATED_FILES))))
+            for b in range(1 if rng.random() < 0.8 else 2):
+                namespace = rng.choice(namespaces)
+                keys = [rng.choice(by_namespace[namespace]) for _ in range(calls if b == 0 else max(1, calls // 4))]
+                keys = [f"missing_{rng.randrange(10 ** 6)}" if rng.random() < UNKNOWN_KEY_RATIO else key
+                        for key in keys]
+                bindings.append(('t' if b == 0 else 'tCommon', namespace, keys))
+        imports = ['@/' + c[len('src/'):-len('.tsx')] for c in rng.sample(components, min(len(components), rng.randrange(4)))]
+        sources[path] = component_source(f"Widget{i}", bindings, imports, rng, tail)
+        if not is_route:
+            components.append(path)
+    return sources
+
+
+def write_project(root: Path, spec: SyntheticSpec) -> Path:
+    """
+    Write a synthetic project (messages/ and src/) under root, unless root
+    already holds the project of this exact spec. Only a missing or empty
+    directory, or one holding an earlier synthetic project, is written to.
+    """
+    root = Path(root)
+    spec_data = {**spec._asdict(), 'locales': list(spec.locales), 'version': GENERATOR_VERSION}
+    spec_file = root / SPEC_FILE
+    if spec_file.exists():
+        if json.loads(spec_file.read_text(encoding='utf-8')).get('fingerprint') == fingerprint(spec_data):
+            return root
+        # An earlier synthetic project: drop only what the generator wrote
+        for generated in (root / "messages", root / "src"):
+            if generated.exists():
+                shutil.rmtree(generated)
+        spec_file.unlink()
+    elif root.exists() and (not root.is_dir() or any(root.iterdir())):
+        raise FileExistsError(f"{root} is not empty and holds no {SPEC_FILE}, refusing to overwrite it")
+
+    catalogs = generate_catalogs(spec)
+    (root / "messages").mkdir(parents=True, exist_ok=True)
+    for lang, catalog in catalogs.items():
+        with open(root / "messages" / f"{lang}.json", 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, indent=2, ensure_ascii=False)
+    for relative, source in generate_sources(spec, catalogs[SOURCE_LOCALE]).items():
+        file_path = root / relative
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(source, encoding='utf-8')
+
+    spec_file.write_text(json.dumps({'spec': spec_data, 'fingerprint': fingerprint(spec_data)}, indent=2),
+                         encoding='utf-8')
+    return root
+
+
+def main():
+    base = current_spec()
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic catalog and TSX tree")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help=f"size relative to this project ({base.keys:,} keys, {base.files} files)")
+    parser.add_argument('--keys', type=int, help="number of keys (overrides --scale)")
+    parser.add_argument('--files', type=int, help="number of TSX files (overrides --scale)")
+    parser.add_argument('--depth', type=int, default=base.depth, help="maximum key segments")
+    parser.add_argument('--locales', nargs='+', default=list(base.locales),
+                        help=f"locales to generate, {SOURCE_LOCALE} first")
+    parser.add_argument('--untranslated', type=float, default=base.untranslated,
+                        help="share of target values left identical to English")
+    parser.add_argument('--missing', type=float, default=base.missing, help="share of target keys left out")
+    parser.add_argument('--calls', type=float, default=base.calls, help="average t() calls per TSX file")
+    parser.add_argument('--seed', type=int, default=base.seed)
+    parser.add_argument('--output', type=Path, help=f"project directory (default {SYNTHETIC_DIR.relative_to(PROJECT_ROOT)}/<scale>x)")
+    args = parser.parse_args()
+
+    if args.locales[0] != SOURCE_LOCALE:
+        parser.error(f"the first locale must be {SOURCE_LOCALE}")
+    spec = base.scaled(args.scale)._replace(
+        depth=max(2, args.depth), locales=tuple(args.locales), untranslated=args.untranslated,
+        missing=args.missing, calls=args.calls, seed=args.seed)
+    spec = spec._replace(keys=args.keys or spec.keys, files=args.files or spec.files)
+    output = args.output or SYNTHETIC_DIR / f"{args.scale:g}x"
+
+    print(f"🚀 Generating {spec.keys:,} keys x {len(spec.locales)} locales and {spec.files:,} TSX files...")
+    try:
+        write_project(output, spec)
+    except FileExistsError as e:
+        print(f"✗ {e}")
+        sys.exit(2)
+    print(f"💾 Synthetic project written to: {output}")
+
+
+if __name__ == "__main__":
+    main()
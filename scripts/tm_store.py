@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Persistent translation memory store (SQLite + FTS5)
+Keeps every en -> fr/nl segment ever seen in .i18n-build/tm.sqlite3 with its
+locale, key, commit and timestamp. Segments are bulk-imported from the
+current catalogs, from the catalogs' git history and from vendor TMX files.
+The database runs in WAL mode so the generator and a review UI can read
+while an import is writing; both go through the TMStore query API.
+"""
+
+import argparse
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from i18n_catalog import (
+    BUILD_DIR,
+    LOCALES,
+    MESSAGES_DIR,
+    SOURCE_LOCALE,
+    TARGET_LOCALES,
+    GitObjectReader,
+    catalog_log,
+    git,
+    load_catalogs,
+    value_hash,
+)
+from i18n_profile import timed
+from i18n_tm import MIN_SCORE, Match, TranslationMemory, iter_pairs, normalize, trigram_set
+
+DB_FILE = BUILD_DIR / "tm.sqlite3"
+SCHEMA_VERSION = 1
+# Full-text candidates fetched before fuzzy matches are re-scored
+FTS_CANDIDATES = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    locale TEXT NOT NULL,
+    key TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    commit_sha TEXT,
+    timestamp INTEGER NOT NULL,
+    UNIQUE (locale, key, source, target)
+);
+CREATE INDEX IF NOT EXISTS segments_exact ON segments (locale, source_hash);
+CREATE INDEX IF NOT EXISTS segments_key ON segments (locale, key);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5 (
+    source, target, content='segments', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts (rowid, source, target) VALUES (new.id, new.source, new.target);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_ad AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts (segments_fts, rowid, source, target)
+    VALUES ('delete', old.id, old.source, old.target);
+END;
+"""
+
+# (locale, key, source, target, origin, commit, timestamp)
+SegmentRow = Tuple[str, str, str, str, str, Optional[str], int]
+
+
+def fts_phrase(text: str) -> str:
+    """Quote text as an FTS5 string so user input cannot inject query syntax"""
+    return '"' + text.replace('"', '""') + '"'
+
+
+class TMStore:
+    def __init__(self, db_path: Path = DB_FILE, readonly: bool = False):
+        self.db_path = Path(db_path)
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path)
+            # WAL lets readers keep querying while an import writes
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            self.conn.commit()
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Imports
+
+    @timed('write')
+    def insert(self, rows: Iterable[SegmentRow]) -> int:
+        """Bulk insert segments in one transaction; known segments are kept as they are"""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO segments "
+                "(locale, key, source, target, source_hash, origin, commit_sha, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((locale, key, source, target, value_hash(normalize(source)), origin, commit, timestamp)
+                 for locale, key, source, target, origin, commit, timestamp in rows),
+            )
+        # rowcount leaves out the rows the FTS triggers write
+        return cursor.rowcount
+
+    @timed('compare')
+    def import_catalogs(self, catalogs: Dict[str, Dict], origin: str = 'catalog',
+                        commit: Optional[str] = None, timestamp: Optional[int] = None) -> Dict[str, int]:
+        """Import every translated en -> lang pair of a set of catalogs"""
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        added = {}
+        for lang in catalogs:
+            if lang == SOURCE_LOCALE:
+                continue
+            added[lang] = self.insert(
+                (lang, key, source, target, origin, commit, timestamp)
+                for key, source, target in iter_pairs(catalogs, lang)
+            )
+        return added
+
+    def import_history(self, messages_dir: Path = MESSAGES_DIR, locales: List[str] = LOCALES) -> Dict[str, int]:
+        """
+        Import the catalogs of every commit that touched them, oldest first.
+        Blobs are read through one `git cat-file --batch` process and each
+        distinct blob is parsed once.
+        """
+        added = {lang: 0 for lang in locales if lang != SOURCE_LOCALE}
+        parsed: Dict[str, Dict] = {}
+        with GitObjectReader() as reader:
+            for commit, timestamp, blobs in catalog_log(messages_dir=messages_dir, locales=locales):
+                catalogs = {}
+                for lang in locales:
+                    blob = blobs.get(lang)
+                    if blob is not None and blob not in parsed:
+                        # Only the latest blob of each locale is needed again
+                        parsed = {b: c for b, c in parsed.items() if b in blobs.values()}
+                        parsed[blob] = reader.read_json(blob)
+                    catalogs[lang] = parsed[blob] if blob is not None else {}
+                if not catalogs.get(SOURCE_LOCALE):
+                    continue
+                for lang, count in self.import_catalogs(catalogs, 'git', commit, timestamp).items():
+                    added[lang] += count
+        return added
+
+    @timed('load')
+    def import_tmx(self, tmx_file: Path, source_lang: str = SOURCE_LOCALE) -> Dict[str, int]:
+        """Import a vendor TMX file; target locales come from its xml:lang attributes"""
+        lang_attr = '{http://www.w3.org/XML/1998/namespace}lang'
+        origin = f"tmx:{Path(tmx_file).name}"
+        timestamp = int(time.time())
+        rows: List[SegmentRow] = []
+        for tu in ET.parse(tmx_file).getroot().iter('tu'):
+            texts = {}
+            for tuv in tu.iter('tuv'):
+                lang = (tuv.get(lang_attr) or tuv.get('lang') or '').split('-')[0].lower()
+                seg = tuv.find('seg')
+                if lang and seg is not None:
+                    texts[lang] = ''.join(seg.itertext())
+            source = texts.pop(source_lang, None)
+            if source is None:
+                continue
+            key = tu.get('tuid', '')
+            rows.extend((lang, key, source, target, origin, None, timestamp)
+                        for lang, target in texts.items() if target and target != source)
+        added = {}
+        for lang in sorted({row[0] for row in rows}):
+            added[lang] = self.insert(row for row in rows if row[0] == lang)
+        return added
+
+    # Queries
+
+    @timed('compare')
+    def exact(self, source: str, locale: str) -> List[Match]:
+        """Translations of an identical source, most common first"""
+        rows = self.conn.execute(
+            "SELECT target, MIN(source) AS source, MIN(key) AS key, COUNT(*) AS uses FROM segments "
+            "WHERE locale = ? AND source_hash = ? "
+            "GROUP BY target ORDER BY uses DESC, MAX(timestamp) DESC",
+            (locale, value_hash(normalize(source))),
+        ).fetchall()
+        return [Match(1.0, row['source'], row['target'], row['key']) for row in rows]
+
+    @timed('compare')
+    def fuzzy(self, source: str, locale: str, min_score: float = MIN_SCORE, limit: int = 3) -> List[Match]:
+        """Full-text candidates re-scored with the in-memory Dice similarity"""
+        words = {w for w in normalize(source).split() if len(w) >= 3}
+        if not words:
+            return []
+        rows = self.conn.execute(
+            "SELECT s.source, s.target, s.key FROM segments_fts "
+            "JOIN segments s ON s.id = segments_fts.rowid "
+            "WHERE segments_fts MATCH ? AND s.locale = ? ORDER BY rank LIMIT ?",
+            (' OR '.join(f"source:{fts_phrase(w)}" for w in sorted(words)), locale, FTS_CANDIDATES),
+        ).fetchall()
+        query = trigram_set(normalize(source))
+        scored: Dict[str, Match] = {}
+        for row in rows:
+            grams = trigram_set(normalize(row['source']))
+            score = 2 * len(query & grams) / (len(query) + len(grams))
+            if score >= min_score and (row['target'] not in scored or score > scored[row['target']].score):
+                scored[row['target']] = Match(round(score, 3), row['source'], row['target'], row['key'])
+        return sorted(scored.values(), key=lambda m: (-m.score, m.key))[:limit]
+
+    def lookup(self, source: str, locale: str, min_score: float = MIN_SCORE, limit: int = 3) -> List[Match]:
+        """Exact matches when there are any, fuzzy matches otherwise"""
+        return self.exact(source, locale)[:limit] or self.fuzzy(source, locale, min_score, limit)
+
+    @timed('compare')
+    def search(self, text: str, locale: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Substring search over sources and targets, for review tooling"""
+        sql = ("SELECT s.* FROM segments_fts JOIN segments s ON s.id = segments_fts.rowid "
+               "WHERE segments_fts MATCH ?")
+        params: List = [fts_phrase(text)]
+        if locale:
+            sql += " AND s.locale = ?"
+            params.append(locale)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def history(self, key: str, locale: str) -> List[Dict]:
+        """Every translation a key has had, oldest first"""
+        rows = self.conn.execute(
+            "SELECT * FROM segments WHERE locale = ? AND key = ? ORDER BY timestamp, id", (locale, key))
+        return [dict(row) for row in rows]
+
+    def segments(self, locale: str) -> Iterable[Tuple[str, str, str]]:
+        """(source, target, key) of every segment of a locale"""
+        yield from self.conn.execute(
+            "SELECT source, target, key FROM segments WHERE locale = ? ORDER BY id", (locale,))
+
+    @timed('load')
+    def memory(self, locale: str) -> TranslationMemory:
+        """In-memory index over every stored segment of a locale, for batch lookups"""
+        memory = TranslationMemory()
+        for source, target, key in self.segments(locale):
+            memory.add(source, target, key)
+        return memory
+
+    def stats(self) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT locale, origin, COUNT(*) AS segments, COUNT(DISTINCT source_hash) AS sources "
+            "FROM segments GROUP BY locale, origin ORDER BY locale, origin")
+        return [dict(row) for row in rows]
+
+
+def print_matches(matches: List[Match]):
+    if not matches:
+        print("  (no matches)")
+    for m in matches:
+        print(f"  {m.score:.3f}  {m.target}")
+        print(f"         ← \"{m.source}\" ({m.key or 'no key'})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent translation memory store")
+    parser.add_argument('--db', type=Path, default=DB_FILE, help="SQLite database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('import-catalogs', help="import the current messages/*.json")
+    commands.add_parser('import-history', help="import messages/*.json from every commit")
+    tmx = commands.add_parser('import-tmx', help="import a vendor TMX file")
+    tmx.add_argument('file', type=Path)
+
+    query = commands.add_parser('query', help="exact or fuzzy lookup of an English source")
+    query.add_argument('source')
+    query.add_argument('--locale', choices=TARGET_LOCALES, default=TARGET_LOCALES[0])
+    query.add_argument('--min-score', type=float, default=MIN_SCORE)
+
+    search = commands.add_parser('search', help="substring search over sources and targets")
+    search.add_argument('text')
+    search.add_argument('--locale', choices=TARGET_LOCALES)
+
+    history = commands.add_parser('history', help="every translation a key has had")
+    history.add_argument('key')
+    history.add_argument('--locale', choices=TARGET_LOCALES, default=TARGET_LOCALES[0])
+
+    commands.add_parser('stats', help="segment counts per locale and origin")
+    args = parser.parse_args()
+
+    readonly = not args.command.startswith('import')
+    if readonly and not args.db.exists():
+        print(f"✗ No translation memory at {args.db}, run import-catalogs first")
+        return
+    with TMStore(args.db, readonly=readonly) as store:
+        if args.command == 'import-catalogs':
+            commit = git('rev-parse', 'HEAD')
+            if git('status', '--porcelain', '--', 'messages'):
+                commit = None  # uncommitted catalog changes
+            added = store.import_catalogs(load_catalogs(), commit=commit)
+        elif args.command == 'import-history':
+            added = store.import_history()
+        elif args.command == 'import-tmx':
+            added = store.import_tmx(args.file)
+        elif args.command == 'query':
+            print(f"🔎 {args.locale.upper()} matches for \"{args.source}\"")
+            print_matches(store.lookup(args.source, args.locale, args.min_score))
+            return
+        elif args.command == 'search':
+            for row in store.search(args.text, args.locale):
+                print(f"  [{row['locale']}] {row['key'] or '-'}: \"{row['source']}\" → \"{row['target']}\"")
+            return
+        elif args.command == 'history':
+            for row in store.history(args.key, args.locale):
+                when = time.strftime('%Y-%m-%d', time.localtime(row['timestamp']))
+                print(f"  {when} {(row['commit_sha'] or 'uncommitted')[:8]} {row['origin']:8} \"{row['target']}\"")
+            return
+        else:
+            print(f"{'LOCALE':8} {'ORIGIN':24} {'SEGMENTS':>10} {'SOURCES':>10}")
+            print("-" * 80)
+            for row in store.stats():
+                print(f"{row['locale']:8} {row['origin']:24} {row['segments']:>10,} {row['sources']:>10,}")
+            return
+
+    for lang, count in added.items():
+        print(f"✓ {lang}: {count:,} new segments")
+    print(f"💾 Translation memory: {args.db}")
+
+
+if __name__ == "__main__":
+    main()
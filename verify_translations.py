@@ -4,12 +4,21 @@ Comprehensive Translation Verification Script for Prompt Party
 Analyzes en.json, fr.json, and nl.json translation files
 """
 
+import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, Set, List, Tuple, Any
+from typing import Dict, Set, List, Tuple, Any, Optional
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from check_placeholders import describe as describe_placeholder_mismatch
+from check_placeholders import iter_mismatches as iter_placeholder_mismatches
+from findings_db import DB_FILE as FINDINGS_DB
+from i18n_glossary import get_glossary
+from i18n_profile import span, timed
+from i18n_report import Findings, JsonLinesReport, open_report
+
 class TranslationVerifier:
     def __init__(self, messages_dir: Path):
         self.messages_dir = messages_dir
@@ -17,6 +26,7 @@ class TranslationVerifier:
         self.translations = {}
         self.errors = []
 
+    @timed('load')
     def load_translations(self) -> bool:
         """Load all translation files"""
         print("Loading translation files...")
@@ -47,22 +57,53 @@ class TranslationVerifier:
                 items.append((new_key, v))
         return dict(items)
 
+    @timed('flatten')
     def get_all_keys(self, lang: str) -> Set[str]:
         """Get all keys from a language translation file"""
         flat = self.flatten_dict(self.translations[lang])
         return set(flat.keys())
 
-    def get_empty_keys(self, lang: str) -> List[str]:
+    @timed('flatten')
+    def get_empty_keys(self, lang: str, stream=None, keep: bool = True) -> Findings:
         """Find keys with empty or null values"""
         flat = self.flatten_dict(self.translations[lang])
-        empty = []
-        for key, value in flat.items():
+        empty = Findings('empty_value', lang, stream, keep)
+        for key in sorted(flat):
+            value = flat[key]
             if value is None or value == "" or (isinstance(value, str) and value.strip() == ""):
-                empty.append(key)
+                empty.add(key, key=key)
         return empty
 
-    def compare_translations(self) -> Dict:
-        """Compare all translation files and identify issues"""
+    @timed('compare')
+    def get_key_differences(self, check: str, keys: List[str], other_keys: Set[str],
+                            lang: str, stream=None, keep: bool = True) -> Findings:
+        """Keys of a sorted list that are not in another key set"""
+        found = Findings(check, lang, stream, keep)
+        for key in keys:
+            if key not in other_keys:
+                found.add(key, key=key)
+        return found
+
+    @timed('compare')
+    def get_untranslated_keys(self, lang: str, stream=None, keep: bool = True) -> Findings:
+        """(key, value) of values identical to English, except the do-not-translate glossary entries"""
+        en_flat = self.flatten_dict(self.translations['en'])
+        flat = self.flatten_dict(self.translations[lang])
+        identical = sorted(key for key, value in flat.items()
+                           if isinstance(value, str) and value.strip() and en_flat.get(key) == value)
+        categories = get_glossary().match_batch([flat[key] for key in identical], lang)
+        untranslated = Findings('untranslated_value', lang, stream, keep)
+        for key in identical:
+            if categories[flat[key]] is None:
+                untranslated.add((key, flat[key]), key=key, value=flat[key])
+        return untranslated
+
+    def compare_translations(self, stream: Optional[JsonLinesReport] = None, keep: bool = True) -> Dict:
+        """
+        Compare all translation files and identify issues, streaming every
+        finding the moment it is found when given a stream; with keep=False
+        only the counts and first findings are held for the console report
+        """
         print("\n" + "="*80)
         print("COMPREHENSIVE TRANSLATION VERIFICATION REPORT")
         print("="*80)
@@ -73,25 +114,37 @@ class TranslationVerifier:
         fr_keys = all_keys['fr']
         nl_keys = all_keys['nl']
 
-        # Calculate statistics
-        stats = {
-            'en': {'total': len(en_keys), 'empty': len(self.get_empty_keys('en'))},
-            'fr': {'total': len(fr_keys), 'empty': len(self.get_empty_keys('fr'))},
-            'nl': {'total': len(nl_keys), 'empty': len(self.get_empty_keys('nl'))},
-        }
-
         # Find missing keys (keys in EN but not in other languages)
-        missing_in_fr = sorted(en_keys - fr_keys)
-        missing_in_nl = sorted(en_keys - nl_keys)
+        en_sorted = sorted(en_keys)
+        missing_in_fr = self.get_key_differences('missing_key', en_sorted, fr_keys, 'fr', stream, keep)
+        missing_in_nl = self.get_key_differences('missing_key', en_sorted, nl_keys, 'nl', stream, keep)
 
         # Find extra keys (keys in other languages but not in EN)
-        extra_in_fr = sorted(fr_keys - en_keys)
-        extra_in_nl = sorted(nl_keys - en_keys)
+        extra_in_fr = self.get_key_differences('extra_key', sorted(fr_keys), en_keys, 'fr', stream, keep)
+        extra_in_nl = self.get_key_differences('extra_key', sorted(nl_keys), en_keys, 'nl', stream, keep)
 
         # Find empty values
-        empty_in_en = sorted(self.get_empty_keys('en'))
-        empty_in_fr = sorted(self.get_empty_keys('fr'))
-        empty_in_nl = sorted(self.get_empty_keys('nl'))
+        empty_in_en = self.get_empty_keys('en', stream, keep)
+        empty_in_fr = self.get_empty_keys('fr', stream, keep)
+        empty_in_nl = self.get_empty_keys('nl', stream, keep)
+
+        # Calculate statistics
+        stats = {
+            'en': {'total': len(en_keys), 'empty': len(empty_in_en)},
+            'fr': {'total': len(fr_keys), 'empty': len(empty_in_fr)},
+            'nl': {'total': len(nl_keys), 'empty': len(empty_in_nl)},
+        }
+
+        # Find values left identical to English (same glossary exemptions as the audit)
+        untranslated_in_fr = self.get_untranslated_keys('fr', stream, keep)
+        untranslated_in_nl = self.get_untranslated_keys('nl', stream, keep)
+
+        # Find interpolation arguments and rich-text tags that differ from English
+        placeholders = {lang: Findings('placeholder_mismatch', lang, stream, keep)
+                        for lang in self.languages if lang != 'en'}
+        with span('compare', 'placeholder_mismatches'):
+            for lang, mismatch in iter_placeholder_mismatches(self.translations):
+                placeholders[lang].add(mismatch, **mismatch)
 
         # Calculate coverage
         fr_coverage = ((len(fr_keys) - len(missing_in_fr)) / len(en_keys) * 100) if en_keys else 0
@@ -116,12 +169,18 @@ class TranslationVerifier:
                 'en': empty_in_en,
                 'fr': empty_in_fr,
                 'nl': empty_in_nl
-            }
+            },
+            'untranslated': {
+                'fr': untranslated_in_fr,
+                'nl': untranslated_in_nl
+            },
+            'placeholders': placeholders
         }
 
         self.print_report(results)
         return results
 
+    @timed('report')
     def print_report(self, results: Dict):
         """Print comprehensive report"""
 
@@ -183,11 +242,46 @@ class TranslationVerifier:
                 print("  ✓ No empty values!")
 
         print("\n" + "-"*80)
-        print("5. PRIORITY FIXES NEEDED")
+        print("5. UNTRANSLATED VALUES (Identical to English, do-not-translate glossary excluded)")
+        print("-"*80)
+
+        for lang in ['fr', 'nl']:
+            untranslated = results['untranslated'][lang]
+            print(f"\n{lang.upper()} - {len(untranslated)} untranslated values:")
+            if untranslated:
+                for i, (key, value) in enumerate(untranslated[:20], 1):
+                    print(f"  {i}. {key}: '{value[:60]}'")
+                if len(untranslated) > 20:
+                    print(f"  ... and {len(untranslated) - 20} more")
+            else:
+                print("  ✓ No untranslated values!")
+
+        print("\n" + "-"*80)
+        print("6. PLACEHOLDER & TAG MISMATCHES (Arguments or rich-text tags differ from English)")
+        print("-"*80)
+
+        for lang in ['fr', 'nl']:
+            mismatches = results['placeholders'][lang]
+            print(f"\n{lang.upper()} - {len(mismatches)} mismatches:")
+            if mismatches:
+                for i, mismatch in enumerate(mismatches[:20], 1):
+                    print(f"  {i}. {mismatch['key']}: {describe_placeholder_mismatch(mismatch)}")
+                if len(mismatches) > 20:
+                    print(f"  ... and {len(mismatches) - 20} more")
+            else:
+                print("  ✓ All placeholders match!")
+
+        print("\n" + "-"*80)
+        print("7. PRIORITY FIXES NEEDED")
         print("-"*80)
 
         priority_issues = []
 
+        # Critical: Placeholder mismatches crash rendering at runtime
+        for lang, name in (('fr', 'French'), ('nl', 'Dutch')):
+            if results['placeholders'][lang]:
+                priority_issues.append(f"CRITICAL: {len(results['placeholders'][lang])} {name} placeholder/tag mismatches")
+
         # Critical: Missing translations
         if results['missing']['fr']:
             priority_issues.append(f"HIGH: {len(results['missing']['fr'])} missing French translations")
@@ -202,6 +296,12 @@ class TranslationVerifier:
         if results['empty']['nl']:
             priority_issues.append(f"MEDIUM: {len(results['empty']['nl'])} empty Dutch values")
 
+        # Medium: Values identical to English
+        if results['untranslated']['fr']:
+            priority_issues.append(f"MEDIUM: {len(results['untranslated']['fr'])} untranslated French values")
+        if results['untranslated']['nl']:
+            priority_issues.append(f"MEDIUM: {len(results['untranslated']['nl'])} untranslated Dutch values")
+
         # Low: Extra keys
         if results['extra']['fr']:
             priority_issues.append(f"LOW: {len(results['extra']['fr'])} extra French keys (not in English)")
@@ -215,7 +315,7 @@ class TranslationVerifier:
             print("\n  ✓ No critical issues found!")
 
         print("\n" + "-"*80)
-        print("6. RECOMMENDATIONS")
+        print("8. RECOMMENDATIONS")
         print("-"*80)
 
         print("\n1. Missing Keys:")
@@ -232,7 +332,11 @@ class TranslationVerifier:
         print("   - Remove unused keys to maintain consistency")
         print("   - Or add missing keys to English if they should exist")
 
-        print("\n4. Consistency:")
+        print("\n4. Placeholders:")
+        print("   - Keep every {argument} and <tag> of the English value in the translation")
+        print("   - Quote apostrophes before a tag or brace as '' (e.g. l''<link>)")
+
+        print("\n5. Consistency:")
         print("   - Run automated tests to verify translation keys match code usage")
         print("   - Use TypeScript types for translation keys to catch errors at compile time")
 
@@ -240,6 +344,7 @@ class TranslationVerifier:
         print("END OF REPORT")
         print("="*80 + "\n")
 
+    @timed('write')
     def save_detailed_report(self, results: Dict, output_file: Path):
         """Save detailed JSON report"""
         from datetime import datetime
@@ -252,18 +357,24 @@ class TranslationVerifier:
             },
             'issues': {
                 'missing_translations': {
-                    'fr': results['missing']['fr'],
-                    'nl': results['missing']['nl']
+                    'fr': list(results['missing']['fr']),
+                    'nl': list(results['missing']['nl'])
                 },
                 'extra_keys': {
-                    'fr': results['extra']['fr'],
-                    'nl': results['extra']['nl']
+                    'fr': list(results['extra']['fr']),
+                    'nl': list(results['extra']['nl'])
                 },
                 'empty_values': {
-                    'en': results['empty']['en'],
-                    'fr': results['empty']['fr'],
-                    'nl': results['empty']['nl']
-                }
+                    'en': list(results['empty']['en']),
+                    'fr': list(results['empty']['fr']),
+                    'nl': list(results['empty']['nl'])
+                },
+                'untranslated_values': {
+                    'fr': [{'key': key, 'value': value} for key, value in results['untranslated']['fr']],
+                    'nl': [{'key': key, 'value': value} for key, value in results['untranslated']['nl']]
+                },
+                'placeholder_mismatches': {lang: list(mismatches)
+                                           for lang, mismatches in results['placeholders'].items()}
             },
             'errors': self.errors
         }
@@ -274,6 +385,13 @@ class TranslationVerifier:
         print(f"\n✓ Detailed report saved to: {output_file}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Verify the en/fr/nl translation catalogs")
+    parser.add_argument('--jsonl', action='store_true',
+                        help="stream findings to translation_verification_report.jsonl instead of the JSON report")
+    parser.add_argument('--db', type=Path, nargs='?', const=FINDINGS_DB,
+                        help=f"also record the findings in the findings database (default {FINDINGS_DB.name})")
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
     messages_dir = script_dir / 'messages'
 
@@ -287,11 +405,23 @@ def main():
         print("\n✗ Failed to load translation files. Please fix JSON syntax errors.")
         sys.exit(1)
 
-    results = verifier.compare_translations()
-
-    # Save detailed report
-    output_file = script_dir / 'translation_verification_report.json'
-    verifier.save_detailed_report(results, output_file)
+    jsonl_file = script_dir / 'translation_verification_report.jsonl'
+    stream = open_report('verify_translations', jsonl_file if args.jsonl else None, args.db)
+    if stream is None:
+        results = verifier.compare_translations()
+    else:
+        with stream:
+            results = verifier.compare_translations(stream, keep=not args.jsonl)
+            stream.close(statistics=results['stats'], coverage=results['coverage'], errors=verifier.errors)
+        if args.jsonl:
+            print(f"\n✓ Findings streamed to: {jsonl_file}")
+        if args.db:
+            print(f"✓ Findings recorded in: {args.db}")
+
+    if not args.jsonl:
+        # Save detailed report
+        output_file = script_dir / 'translation_verification_report.json'
+        verifier.save_detailed_report(results, output_file)
 
     # Exit with error code if there are issues
     has_issues = (
@@ -299,7 +429,9 @@ def main():
         len(results['missing']['nl']) > 0 or
         len(results['empty']['en']) > 0 or
         len(results['empty']['fr']) > 0 or
-        len(results['empty']['nl']) > 0
+        len(results['empty']['nl']) > 0 or
+        len(results['placeholders']['fr']) > 0 or
+        len(results['placeholders']['nl']) > 0
     )
 
     if has_issues: